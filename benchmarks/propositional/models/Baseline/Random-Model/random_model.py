@@ -3,6 +3,8 @@ import numpy as np
 import ccobra
 
 class RandomModel(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='RandomModel'):
         super(RandomModel, self).__init__(
             name, ['propositional'], ['single-choice'])
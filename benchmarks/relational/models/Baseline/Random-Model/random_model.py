@@ -10,6 +10,8 @@ class RandomModel(ccobra.CCobraModel):
 
     """
 
+    stateless = True
+
     def __init__(self, name='RandomModel'):
         """ Initializes the random model.
 
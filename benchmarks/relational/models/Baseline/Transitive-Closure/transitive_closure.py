@@ -132,6 +132,8 @@ def is_possible_model(premises, conclusion):
     return True
 
 class TransitiveClosure(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='TransitiveClosure'):
         super(TransitiveClosure, self).__init__(name, ['spatial-relational'], ['verify', "accept", 'single-choice'])
 
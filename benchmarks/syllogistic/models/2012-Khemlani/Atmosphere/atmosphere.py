@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class Atmosphere(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='Atmosphere'):
         super(Atmosphere, self).__init__(
             name, ['syllogistic'], ['single-choice'])
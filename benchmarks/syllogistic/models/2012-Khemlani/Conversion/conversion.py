@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class Conversion(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='Conversion'):
         super(Conversion, self).__init__(
             name, ['syllogistic'], ['single-choice'])
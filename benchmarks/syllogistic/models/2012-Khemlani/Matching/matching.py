@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class Matching(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='Matching'):
         super(Matching, self).__init__(
             name, ['syllogistic'], ['single-choice'])
@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class MMT(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='MMT'):
         super(MMT, self).__init__(
             name, ['syllogistic'], ['single-choice'])
@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class PHM(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='PHM'):
         super(PHM, self).__init__(
             name, ['syllogistic'], ['single-choice'])
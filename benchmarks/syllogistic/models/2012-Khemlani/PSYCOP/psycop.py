@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class PSYCOP(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='PSYCOP'):
         super(PSYCOP, self).__init__(
             name, ['syllogistic'], ['single-choice'])
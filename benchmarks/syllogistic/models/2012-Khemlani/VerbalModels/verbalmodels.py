@@ -4,6 +4,8 @@ import numpy as np
 import ccobra
 
 class VerbalModels(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='VerbalModels'):
         super(VerbalModels, self).__init__(
             name, ['syllogistic'], ['single-choice'])
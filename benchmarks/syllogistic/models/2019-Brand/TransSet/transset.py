@@ -118,6 +118,8 @@ class TransitivitySet(ccobra.CCobraModel):
 
     """
 
+    stateless = True
+
     def __init__(self, name='TransSet'):
         """ Initializes the TransitivitySet model.
 
@@ -132,6 +134,7 @@ class TransitivitySet(ccobra.CCobraModel):
         super(TransitivitySet, self).__init__(name, ['syllogistic'], ['single-choice'])
 
 
+    @ccobra.cacheable_predict
     def predict(self, item, **kwargs):
         """ Predicts weighted responses to a given syllogism.
 
@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 
 import torch
@@ -22,6 +24,22 @@ class SylMLPModel(ccobra.CCobraModel):
 
         self.history = torch.zeros((576,))
 
+    def clone(self):
+        # Only copy the trainable components and the response history
+        clone = copy.copy(self)
+        clone.net = copy.deepcopy(self.net)
+        clone.optimizer = optim.Adam(clone.net.parameters())
+        clone.optimizer.load_state_dict(copy.deepcopy(self.optimizer.state_dict()))
+        clone.history = self.history.clone()
+        return clone
+
+    def snapshot(self):
+        # Adaption only changes the response history
+        return self.history.clone()
+
+    def restore(self, snapshot):
+        self.history = snapshot.clone()
+
     def pre_train(self, dataset):
         # Extract the training data and result targets from the training dataset
         train_x = []
@@ -91,6 +109,18 @@ class SylMLPModel(ccobra.CCobraModel):
         pred_idx = self.net(self.history)[task_idx*9:task_idx*9+9].argmax().item()
         return syllogism.decode_response(ccobra.syllogistic.RESPONSES[pred_idx])
 
+    def predict_batch(self, items, aux_list):
+        # The completion only depends on the history and is queried once for all tasks
+        completion = self.net(self.history)
+
+        predictions = []
+        for item in items:
+            syllogism = ccobra.syllogistic.Syllogism(item)
+            task_idx = ccobra.syllogistic.SYLLOGISMS.index(syllogism.encoded_task)
+            pred_idx = completion[task_idx*9:task_idx*9+9].argmax().item()
+            predictions.append(syllogism.decode_response(ccobra.syllogistic.RESPONSES[pred_idx]))
+        return predictions
+
     def adapt(self, item, truth, **kwargs):
         syllogism = ccobra.syllogistic.Syllogism(item)
         syl_idx = ccobra.syllogistic.SYLLOGISMS.index(syllogism.encoded_task)
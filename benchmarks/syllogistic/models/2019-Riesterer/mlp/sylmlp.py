@@ -1,3 +1,4 @@
+import copy
 import time
 
 import numpy as np
@@ -38,6 +39,23 @@ class MLPModel(ccobra.CCobraModel):
         self.n_epochs_adapt = 3
         self.batch_size = 8
 
+    def clone(self):
+        # Share the training data and only copy the trainable components
+        clone = copy.copy(self)
+        clone.net = copy.deepcopy(self.net)
+        clone.optimizer = optim.Adam(clone.net.parameters())
+        clone.optimizer.load_state_dict(copy.deepcopy(self.optimizer.state_dict()))
+        return clone
+
+    def snapshot(self):
+        # Adaption only changes the network parameters and optimizer state
+        return copy.deepcopy(self.net.state_dict()), copy.deepcopy(self.optimizer.state_dict())
+
+    def restore(self, snapshot):
+        net_state, optimizer_state = snapshot
+        self.net.load_state_dict(net_state)
+        self.optimizer.load_state_dict(copy.deepcopy(optimizer_state))
+
     def pre_train(self, dataset, **kwargs):
         train_x = []
         train_y = []
@@ -108,6 +126,20 @@ class MLPModel(ccobra.CCobraModel):
         enc_response = ccobra.syllogistic.RESPONSES[response]
         return syllogism.decode_response(enc_response)
 
+    def predict_batch(self, items, aux_list):
+        syllogisms = [ccobra.syllogistic.Syllogism(item) for item in items]
+
+        # Query the model for all tasks at once
+        inp = np.array([onehot.onehot_syllogism_content(x.encoded_task) for x in syllogisms])
+        inp_tensor = torch.from_numpy(inp).float()
+        output = self.net(inp_tensor)
+
+        # Return maximum responses
+        responses = output.argmax(1).tolist()
+        return [
+            syllogism.decode_response(ccobra.syllogistic.RESPONSES[response])
+            for syllogism, response in zip(syllogisms, responses)]
+
     def adapt(self, item, truth, **kwargs):
         syllogism = ccobra.syllogistic.Syllogism(item)
 
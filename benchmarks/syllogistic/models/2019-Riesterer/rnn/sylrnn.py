@@ -1,3 +1,4 @@
+import copy
 import time
 
 import torch
@@ -26,12 +27,16 @@ class RNN(nn.Module):
         return output, hidden
 
 class RNNModel(ccobra.CCobraModel):
+    lockstep = True
+
     def __init__(self, name='RNN'):
         super(RNNModel, self).__init__(
             name, ['syllogistic'], ['single-choice'])
 
         self.net = RNN()
-        self.hidden = None
+
+        # Hidden states of the participants
+        self.hidden = {}
 
         # Training parameters
         self.n_epochs = 13
@@ -40,6 +45,22 @@ class RNNModel(ccobra.CCobraModel):
         self.optimizer = optim.Adam(self.net.parameters())
         self.criterion = nn.CrossEntropyLoss()
 
+    def clone(self):
+        # Share the training data and only copy the trainable components and hidden states
+        clone = copy.copy(self)
+        clone.hidden = dict(self.hidden)
+        clone.net = copy.deepcopy(self.net)
+        clone.optimizer = optim.Adam(clone.net.parameters())
+        clone.optimizer.load_state_dict(copy.deepcopy(self.optimizer.state_dict()))
+        return clone
+
+    def snapshot(self):
+        # Only the hidden states change during the evaluation of a participant
+        return dict(self.hidden)
+
+    def restore(self, snapshot):
+        self.hidden = dict(snapshot)
+
     def pre_train(self, dataset):
         # Prepare the data for training by converting it into a 64 x n_subj x 12
         train_x = []
@@ -122,9 +143,48 @@ class RNNModel(ccobra.CCobraModel):
 
         # Obtain the prediction
         input = torch.from_numpy(onehot.onehot_syllogism_content(syllogism.encoded_task)).float()
-        output, self.hidden = self.net(input.view(1, 1, -1), self.hidden)
+        output, self.hidden[item.identifier] = self.net(
+            input.view(1, 1, -1), self.hidden.get(item.identifier))
 
         # Return maximum response
         response = output.argmax().item()
         enc_response = ccobra.syllogistic.RESPONSES[response]
         return syllogism.decode_response(enc_response)
+
+    def predict_batch(self, items, aux_list):
+        # Group the tasks by participant. Contains the task sequence of a single participant
+        # or the current task of all participants in lockstep evaluations.
+        subj_ids = list(dict.fromkeys(item.identifier for item in items))
+        sequences = {subj_id: [] for subj_id in subj_ids}
+        for idx, item in enumerate(items):
+            sequences[item.identifier].append(idx)
+
+        if len(set(len(x) for x in sequences.values())) != 1:
+            return [self.predict(item, **aux) for item, aux in zip(items, aux_list)]
+
+        # Feed the sequences of the participants as a batch through the network
+        syllogisms = [ccobra.syllogistic.Syllogism(item) for item in items]
+        inputs = np.array([
+            [onehot.onehot_syllogism_content(syllogisms[idx].encoded_task) for idx in sequences[subj_id]]
+            for subj_id in subj_ids])
+        input = torch.from_numpy(inputs).float().transpose(0, 1)
+
+        hidden = None
+        if any(subj_id in self.hidden for subj_id in subj_ids):
+            zeros = [torch.zeros(self.net.lstm.num_layers, 1, self.net.lstm.hidden_size)] * 2
+            states = [self.hidden.get(subj_id, zeros) for subj_id in subj_ids]
+            hidden = tuple(torch.cat([x[part] for x in states], 1) for part in range(2))
+
+        outputs, (h_n, c_n) = self.net(input, hidden)
+        for subj_idx, subj_id in enumerate(subj_ids):
+            self.hidden[subj_id] = (
+                h_n[:, subj_idx:subj_idx + 1].contiguous(), c_n[:, subj_idx:subj_idx + 1].contiguous())
+
+        # Return maximum responses
+        responses = outputs.argmax(2)
+        predictions = [None] * len(items)
+        for subj_idx, subj_id in enumerate(subj_ids):
+            for step, idx in enumerate(sequences[subj_id]):
+                response = responses[step, subj_idx].item()
+                predictions[idx] = syllogisms[idx].decode_response(ccobra.syllogistic.RESPONSES[response])
+        return predictions
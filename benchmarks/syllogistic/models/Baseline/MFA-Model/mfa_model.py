@@ -16,7 +16,7 @@ class MFAModel(ccobra.CCobraModel):
             # Iterate over the task for an individual subject
             for task_data in subj_data:
                 # Create the syllogism object and extract the task and response encodings
-                syllogism = ccobra.syllogistic.Syllogism(task_data['item'])
+                syllogism = ccobra.syllogistic.Syllogism.from_item(task_data['item'])
                 encoded_task = syllogism.encoded_task
                 encoded_response = syllogism.encode_response(task_data['response'])
 
@@ -28,12 +28,27 @@ class MFAModel(ccobra.CCobraModel):
                 self.mfa_population[encoded_task][encoded_response] = \
                     self.mfa_population[encoded_task].get(encoded_response, 0) + 1
 
+    def pre_train_exclude(self, dataset):
+        # Remove the responses of the given subjects from the population counts
+        for subj_data in dataset:
+            for task_data in subj_data:
+                syllogism = ccobra.syllogistic.Syllogism.from_item(task_data['item'])
+                encoded_task = syllogism.encoded_task
+                encoded_response = syllogism.encode_response(task_data['response'])
+
+                # Decrement the response count and drop responses that are no longer given
+                task_counts = self.mfa_population[encoded_task]
+                task_counts[encoded_response] -= 1
+                if task_counts[encoded_response] == 0:
+                    del task_counts[encoded_response]
+                if not task_counts:
+                    del self.mfa_population[encoded_task]
 
     def pre_train_person(self, dataset):
         # Iterate over the given tasks for the individual subject to be predicted for
         for task_data in dataset:
             # Create the syllogism object and extract the task and response encodings
-            syllogism = ccobra.syllogistic.Syllogism(task_data['item'])
+            syllogism = ccobra.syllogistic.Syllogism.from_item(task_data['item'])
             encoded_task = syllogism.encoded_task
             encoded_response = syllogism.encode_response(task_data['response'])
 
@@ -46,10 +61,15 @@ class MFAModel(ccobra.CCobraModel):
                 self.mfa_personal[encoded_task].get(encoded_response, 0) + 1
 
     def get_mfa_prediction(self, item, mfa_dictionary):
-        # Extract the encoded task
-        syllogism = ccobra.syllogistic.Syllogism(item)
-        encoded_task = syllogism.encoded_task
-        encoded_choices = [syllogism.encode_response(x) for x in item.choices]
+        # Extract the encoded task and choices (precomputed by the evaluator if available)
+        features = item.features
+        if features is not None:
+            encoded_task = features['task']
+            encoded_choices = features['choices']
+        else:
+            syllogism = ccobra.syllogistic.Syllogism.from_item(item)
+            encoded_task = syllogism.encoded_task
+            encoded_choices = [syllogism.encode_response(x) for x in item.choices]
 
         if encoded_task in mfa_dictionary:
             # Extract the potential MFA responses which are allowed in terms
@@ -82,7 +102,7 @@ class MFAModel(ccobra.CCobraModel):
 
     def predict(self, item, **kwargs):
         # Create the syllogism object
-        syllogism = ccobra.syllogistic.Syllogism(item)
+        syllogism = ccobra.syllogistic.Syllogism.from_item(item)
 
         # Return the personal MFA if available
         personal_prediction = self.get_mfa_prediction(item, self.mfa_personal)
@@ -99,7 +119,7 @@ class MFAModel(ccobra.CCobraModel):
 
     def adapt(self, item, target, **kwargs):
         # Extract the encoded task and response
-        syllogism = ccobra.syllogistic.Syllogism(item)
+        syllogism = ccobra.syllogistic.Syllogism.from_item(item)
         encoded_task = syllogism.encoded_task
         encoded_response = syllogism.encode_response(target)
 
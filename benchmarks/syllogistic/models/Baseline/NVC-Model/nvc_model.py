@@ -1,8 +1,11 @@
 import ccobra
 
 class NVCModel(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='NVCModel'):
         super(NVCModel, self).__init__(name, ["syllogistic"], ["single-choice"])
 
+    @ccobra.cacheable_predict
     def predict(self, item, **kwargs):
         return [['NVC']]
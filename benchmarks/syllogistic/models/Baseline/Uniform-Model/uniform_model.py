@@ -3,6 +3,8 @@ import numpy as np
 import ccobra
 
 class UniformModel(ccobra.CCobraModel):
+    stateless = True
+
     def __init__(self, name='UniformModel'):
         super(UniformModel, self).__init__(name, ["syllogistic"], ["single-choice"])
 
@@ -2,8 +2,12 @@
 
 .. rubric:: Functions
 
+.. autofunction:: cacheable_predict
+
 .. autofunction:: convert_to_basic_types
 
+.. autofunction:: encode_dataset
+
 .. autofunction:: tuple_to_string
 
 .. autofunction:: unnest
@@ -26,6 +30,12 @@
     :members:
 .. autoclass:: CCobraData
     :members:
+.. autoclass:: CCobraDataStream
+    :members:
+.. autoclass:: DataArena
+    :members:
+.. autoclass:: DatasetTensor
+    :members:
 .. autoclass:: CCobraModel
     :members:
 .. autoclass:: CCobraResponseEncoder
@@ -41,9 +51,9 @@
 from .version import __version__
 
 from .helper import convert_to_basic_types, tuple_to_string, unnest
-from .data import CCobraData
+from .data import CCobraData, CCobraDataStream, DataArena, DatasetTensor, encode_dataset
 from .item import Item
-from .model import CCobraModel
+from .model import CCobraModel, cacheable_predict
 from .encoder import CCobraTaskEncoder, CCobraResponseEncoder
 from .comparator import CCobraComparator
 
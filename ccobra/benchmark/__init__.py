@@ -21,6 +21,8 @@
 
 .. autoclass:: Benchmark
     :members:
+.. autoclass:: DataCache
+    :members:
 .. autoclass:: ModelInfo
     :members:
 .. autoclass:: Evaluator
@@ -29,6 +31,12 @@
     :members:
 .. autoclass:: EvaluationHandler
     :members:
+.. autoclass:: ResultSink
+    :members:
+.. autoclass:: ResultStore
+    :members:
+.. autoclass:: RunJournal
+    :members:
 
 """
 
@@ -36,7 +44,11 @@ from . import comparators
 
 from .benchmark import Benchmark, ModelInfo, fix_rel_path, fix_model_path
 from .contextmanager import dir_context
+from .data_cache import DataCache
 from .evaluator import Evaluator
 from .modelimporter import ModelImporter
 from .runner import entry_point, parse_arguments, main, silence_stdout
 from .evaluation_handler import EvaluationHandler
+from .result_sink import ResultSink
+from .result_store import ResultStore
+from .journal import RunJournal
@@ -2,6 +2,9 @@
 
 """
 
+import concurrent.futures
+import glob
+import hashlib
 import json
 import logging
 import os
@@ -10,11 +13,13 @@ import pandas as pd
 
 from . import comparators
 from . import contextmanager
+from . import data_cache
 from . import modelimporter
 from . import evaluation_handler
+from .result_store import hash_file
 from .. import encoders
 from .. import CCobraComparator, CCobraTaskEncoder, CCobraResponseEncoder
-from ..data import CCobraData
+from ..data import CCobraData, CCobraDataStream
 from ..propositional.task_encoder_prop import PropositionalTaskEncoder
 from ..syllogistic.task_encoder_syl import SyllogisticTaskEncoder
 
@@ -49,6 +54,38 @@ def fix_rel_path(path, base_path):
 
     return path
 
+def expand_data_path(path, base_path):
+    """ Resolves a data path and expands glob patterns.
+
+    Parameters
+    ----------
+    path : str
+        Data path, optionally containing glob patterns (e.g., 'data/shard-*.parquet').
+
+    base_path : str
+        Basepath used to fix relative paths with.
+
+    Returns
+    -------
+    list(str)
+        Sorted list of absolute data file paths.
+
+    Raises
+    ------
+    ValueError
+        Thrown if a glob pattern does not match any files.
+
+    """
+
+    full_path = fix_rel_path(path, base_path)
+    if not any(x in full_path for x in '*?['):
+        return [full_path]
+
+    matches = sorted(glob.glob(full_path))
+    if not matches:
+        raise ValueError('No data files match the pattern: {}'.format(full_path))
+    return matches
+
 def fix_model_path(path, base_path=None):
     """ Fixes the model path by checking if the path directly refers to a python file. Otherwise
     searches for a subdirectory containing possible modules.
@@ -269,7 +306,8 @@ class Benchmark():
 
     """
 
-    def __init__(self, json_path, argmodel=None, cached=False):
+    def __init__(self, json_path, argmodel=None, cached=False, use_data_cache=False,
+                 stream_test_data=False):
         """ Initializes the benchmark instance by reading the JSON benchmark specification file
         content.
 
@@ -285,6 +323,15 @@ class Benchmark():
             Flag to indicate whether the benchmark is cached or not. If true, the benchmark models
             are ignored.
 
+        use_data_cache : bool, optional
+            Flag to indicate whether parsed datasets are cached in a directory next to the
+            benchmark file. Unchanged data files are loaded from the cache on repeated runs.
+
+        stream_test_data : bool, optional
+            Flag to indicate whether the test data is streamed from its file during the
+            evaluation instead of being loaded completely. Requires a single test data file in
+            which the rows of each subject are contiguous.
+
         """
 
         logger.debug('Opening benchmark: "%s"', json_path)
@@ -311,6 +358,19 @@ class Benchmark():
         self.base_path = os.path.dirname(os.path.abspath(json_path))
         logger.debug('base_path: %s', self.base_path)
 
+        # Loaded data files by resolved path and content hash. Data files referenced multiple
+        # times are only loaded once.
+        self.data_files = {}
+        self.data_hashes = {}
+
+        self.stream_test_data = stream_test_data
+
+        # Prepare the cache for parsed datasets
+        self.data_cache = None
+        if use_data_cache:
+            self.data_cache = data_cache.DataCache(
+                os.path.join(self.base_path, data_cache.DATA_CACHE_DIR))
+
         # Parse the JSON content
         self.parse_type()
         self.parse_auxiliary_evaluations()
@@ -428,13 +488,14 @@ class Benchmark():
         self.evaluation_targets = evaluation_targets
 
     def parse_data_path(self, path):
-        """ Reads in a dataset CSV file and returns it as a pandas.DataFrame object. If a list
-        of paths is supplied, the datasets are combined.
+        """ Reads in a dataset file and returns it as a pandas.DataFrame object. If a list of
+        paths or a glob pattern matching multiple files is supplied, the files are loaded in
+        parallel and the datasets are combined.
 
         Parameters
         ----------
-        path : str
-            Path to the data file.
+        path : str or list(str)
+            Path to the data file or glob pattern.
 
         Returns
         -------
@@ -448,23 +509,83 @@ class Benchmark():
         if not path:
             return None, None
 
-        if isinstance(path, list):
-            logger.debug('List data path encountered: %s', path)
-            parts = [self.parse_data_path(x) for x in path]
-            paths = ';'.join([x[0] for x in parts])
+        # Resolve relative paths and expand glob patterns
+        if not isinstance(path, list):
+            path = [path]
+        full_paths = []
+        for data_path in path:
+            full_paths.extend(expand_data_path(data_path, self.base_path))
 
-            # Combine the datasets
-            comb_df = pd.concat([df for _, df in parts])
-            return paths, comb_df
+        if len(full_paths) == 1:
+            logger.debug('Regular data path encountered: %s', full_paths[0])
+            return full_paths[0], self.load_data_file(full_paths[0])
 
-        logger.debug('Regular data path encountered: %s', path)
+        logger.debug('List data path encountered: %s', full_paths)
+        paths = ';'.join(full_paths)
 
-        # Resolve relative paths
-        full_path = fix_rel_path(path, self.base_path)
+        # Load and combine the datasets (only once for identical lists of paths)
+        if paths not in self.data_files:
+            n_threads = min(len(full_paths), os.cpu_count() or 1)
+            with concurrent.futures.ThreadPoolExecutor(n_threads) as executor:
+                parts = list(executor.map(self.load_data_file, full_paths))
+            self.data_files[paths] = pd.concat(parts)
+        return paths, self.data_files[paths]
 
-        # Load the data and create CCOBRA container
-        df = pd.read_csv(full_path)
-        return full_path, df
+    def data_columns(self):
+        """ Determines the columns to read from the data files. Comprises the required fields,
+        the evaluation targets, and the auxiliary columns declared in the benchmark (aux_columns).
+
+        Returns
+        -------
+        list(str)
+            List of columns to read. None if no auxiliary columns are declared, in which case all
+            columns are read and passed to the models.
+
+        """
+
+        aux_columns = self.json_content.get('aux_columns', None)
+        if aux_columns is None:
+            return None
+
+        required_fields = ['id', 'sequence', 'task', 'choices', 'response_type', 'domain']
+        return required_fields + self.evaluation_targets + list(aux_columns)
+
+    def load_data_file(self, path):
+        """ Loads a data file. Files are deduplicated by their resolved path and their content, so
+        that data files referenced multiple times share a single dataframe.
+
+        Parameters
+        ----------
+        path : str
+            Path to the data file.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe containing the data.
+
+        """
+
+        real_path = os.path.realpath(path)
+        if real_path in self.data_files:
+            logger.debug('Reusing loaded data file: %s', path)
+            return self.data_files[real_path]
+
+        hasher = hashlib.sha256()
+        hash_file(real_path, hasher)
+        content_hash = hasher.hexdigest()
+
+        df = self.data_hashes.get(content_hash)
+        if df is not None:
+            logger.debug('Reusing data file with identical content: %s', path)
+        elif self.data_cache is not None:
+            df = self.data_cache.read_data_file(real_path, self.data_columns())
+        else:
+            df = data_cache.read_data_file(real_path, self.data_columns())
+
+        self.data_files[real_path] = df
+        self.data_hashes[content_hash] = df
+        return df
 
     def parse_data(self):
         """ Parses the benchmark data information. Reads in an preprocesses the datasets.
@@ -483,12 +604,25 @@ class Benchmark():
         self.data_pre_person_background_path, data_pre_person_background_df = self.parse_data_path(self.json_content.get('data.pre_person_background', ''))
         logger.debug('data_pre_person_background_path: %s', self.data_pre_person_background_path)
 
-        # Parse test data field
-        self.data_test_path, data_test_df = self.parse_data_path(self.json_content['data.test'])
+        # Parse test data field. Streamed test data is only scanned for its subjects.
+        if self.stream_test_data:
+            test_paths = self.json_content['data.test']
+            if isinstance(test_paths, list) or \
+                len(expand_data_path(test_paths, self.base_path)) != 1:
+                raise ValueError('Streaming requires a single test data file.')
+            self.data_test_path = expand_data_path(test_paths, self.base_path)[0]
+            if os.path.splitext(self.data_test_path)[1].lower() in data_cache.DATA_FORMATS:
+                raise ValueError('Streaming requires a CSV test data file.')
+            data_test_df = None
+            self.data_test = CCobraDataStream(
+                self.data_test_path, target_columns=self.evaluation_targets)
+            test_ids = self.data_test.subject_ids
+        else:
+            self.data_test_path, data_test_df = self.parse_data_path(self.json_content['data.test'])
+            test_ids = data_test_df['id'].unique()
         logger.debug('data_test_path: %s', self.data_test_path)
 
         # Filter person data so that only test ids are present
-        test_ids = data_test_df['id'].unique()
         if data_pre_train_person_df is not None:
             data_pre_train_person_df = data_pre_train_person_df.loc[
                 data_pre_train_person_df['id'].isin(test_ids)]
@@ -500,9 +634,31 @@ class Benchmark():
         self.corresponding_data = self.json_content.get('corresponding_data', False)
         logger.debug('corresponding_data: %s', self.corresponding_data)
 
-        # Construct CCOBRA datasets
-        self.data_test = CCobraData(data_test_df, target_columns=self.evaluation_targets)
-        self.data_pre_train = CCobraData(data_pre_train_df, target_columns=self.evaluation_targets) if data_pre_train_df is not None else None
+        # Set number of crossvalidation folds
+        self.cv_folds = self.json_content.get('cv_folds', None)
+        logger.debug('cv_folds: %s', self.cv_folds)
+        if self.cv_folds is not None:
+            if not self.corresponding_data:
+                raise ValueError('cv_folds requires corresponding_data to be set.')
+            if not isinstance(self.cv_folds, int) or self.cv_folds < 2:
+                raise ValueError('cv_folds must be an integer larger than 1: {}'.format(self.cv_folds))
+
+        # Set seed for the assignment of subjects to crossvalidation folds
+        self.cv_seed = self.json_content.get('cv_seed', 0)
+        logger.debug('cv_seed: %s', self.cv_seed)
+        if not isinstance(self.cv_seed, int) or isinstance(self.cv_seed, bool) or self.cv_seed < 0:
+            raise ValueError('cv_seed must be a non-negative integer: {}'.format(self.cv_seed))
+
+        # Construct CCOBRA datasets. Training data loaded from the same source as the test data
+        # shares its container in case of corresponding data.
+        if not self.stream_test_data:
+            self.data_test = CCobraData(data_test_df, target_columns=self.evaluation_targets)
+        same_source = data_pre_train_df is not None and (
+            data_pre_train_df is data_test_df or self.data_pre_train_path == self.data_test_path)
+        if same_source and self.corresponding_data and not self.stream_test_data:
+            self.data_pre_train = self.data_test
+        else:
+            self.data_pre_train = CCobraData(data_pre_train_df, target_columns=self.evaluation_targets) if data_pre_train_df is not None else None
         self.data_pre_train_person = CCobraData(data_pre_train_person_df, target_columns=self.evaluation_targets) if data_pre_train_person_df is not None else None
         self.data_pre_person_background = CCobraData(data_pre_person_background_df, target_columns=self.evaluation_targets) if data_pre_person_background_df is not None else None
 
@@ -514,9 +670,19 @@ class Benchmark():
         elif self.data_pre_train is not None and self.corresponding_data:
             logger.debug('extracting additional person data from comparing data_pre_train with data_test...')
 
-            # Identify the columns which are present only in the training data
-            merge = data_pre_train_df.merge(data_test_df, how='left', indicator=True)
-            data_train_only_df = merge.loc[merge['_merge'] == 'left_only'].drop(columns=['_merge'])
+            # Identify the tasks which are present only in the training data based on the
+            # identifying columns of the tasks
+            if same_source:
+                data_train_only_df = data_pre_train_df.iloc[:0]
+            else:
+                key_columns = self.data_test.required_fields
+                if data_test_df is None:
+                    test_keys = pd.MultiIndex.from_frame(
+                        pd.read_csv(self.data_test_path, usecols=key_columns)[key_columns])
+                else:
+                    test_keys = pd.MultiIndex.from_frame(data_test_df[key_columns])
+                train_keys = pd.MultiIndex.from_frame(data_pre_train_df[key_columns])
+                data_train_only_df = data_pre_train_df.loc[~train_keys.isin(test_keys)]
 
             # Append domain related data to pre_train_person
             domain_related_df = data_train_only_df.loc[data_train_only_df['domain'].isin(self.data_test.domains)]
@@ -525,16 +691,16 @@ class Benchmark():
                 domain_related_df = pd.concat([domain_related_df, data_pre_train_person_df])
 
             if not domain_related_df.empty:
-                self.data_pre_train_person = CCobraData(domain_related_df.drop(columns='_unique_id'), target_columns=self.evaluation_targets)
+                self.data_pre_train_person = CCobraData(domain_related_df, target_columns=self.evaluation_targets)
 
             # Append domain unrelated data to pre_person_background
             domain_unrelated_df = data_train_only_df.loc[~data_train_only_df['domain'].isin(self.data_test.domains)]
 
             if data_pre_person_background_df is not None:
-                domain_unrelated_df = pd.concat(domain_unrelated_df, data_pre_person_background_df)
+                domain_unrelated_df = pd.concat([domain_unrelated_df, data_pre_person_background_df])
 
             if not domain_unrelated_df.empty:
-                self.data_pre_person_background = CCobraData(domain_unrelated_df.drop(columns='_unique_id'), target_columns=self.evaluation_targets)
+                self.data_pre_person_background = CCobraData(domain_unrelated_df, target_columns=self.evaluation_targets)
 
     def parse_models(self):
         """ Parses the benchmark model information.
@@ -559,6 +725,8 @@ class Benchmark():
         s.append('      pre_person_background: {}'.format(self.data_pre_person_background_path))
         s.append('      test : {}'.format(self.data_test_path))
         s.append('   corresponding_data: {}'.format(self.corresponding_data))
+        s.append('   cv_folds: {}'.format(self.cv_folds))
+        s.append('   cv_seed: {}'.format(self.cv_seed))
         s.append('   models:')
         for idx, model in enumerate(self.models):
             s.append('      ({}) {}'.format(idx + 1, model))
@@ -0,0 +1,223 @@
+""" CCOBRA data cache. Stores parsed datasets and evaluation dictionaries in a binary format to
+avoid parsing unchanged data files on repeated benchmark runs.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+import pandas as pd
+
+from ..version import __version__
+from .result_sink import import_pyarrow
+from .result_store import hash_file
+
+
+# Initialize module-level logger
+logger = logging.getLogger(__name__)
+
+#: Name of the cache directory created next to the benchmark file
+DATA_CACHE_DIR = '.ccobra_cache'
+
+#: Version of the structure of cached evaluation dictionaries
+CACHE_FORMAT = 2
+
+#: Binary data formats and their file extensions. Other files are read as (compressed) CSV.
+DATA_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.ipc': 'feather'
+}
+
+def read_data_file(path, columns=None):
+    """ Reads a data file into a dataframe. The format is determined from the file extension:
+    Parquet (.parquet, .pq), Feather/Arrow IPC (.feather, .arrow, .ipc), or CSV, which may be
+    compressed (e.g., .csv.gz, .csv.xz, .csv.zst).
+
+    Parameters
+    ----------
+    path : str
+        Path to the data file.
+
+    columns : list(str), optional
+        Columns to read. Columns not contained in the file are ignored. If not specified, all
+        columns are read.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Dataframe containing the data.
+
+    """
+
+    data_format = DATA_FORMATS.get(os.path.splitext(path)[1].lower(), 'csv')
+    if data_format == 'csv':
+        usecols = None if columns is None else (lambda x: x in columns)
+        return pd.read_csv(path, usecols=usecols)
+
+    # Restrict the projection to the columns of the file
+    if columns is not None:
+        _, pq, ipc = import_pyarrow()
+        if data_format == 'parquet':
+            names = pq.read_schema(path).names
+        else:
+            with ipc.open_file(path) as reader:
+                names = reader.schema.names
+        columns = [x for x in names if x in columns]
+
+    if data_format == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+class DataCache():
+    """ Directory-based cache for parsed datasets. Entries are keyed by the content of the data
+    and stored as pickle files. Entries of changed data files are not removed automatically; the
+    cache directory can be deleted at any time.
+
+    """
+
+    def __init__(self, path):
+        """ Initializes the data cache.
+
+        Parameters
+        ----------
+        path : str
+            Directory the cache entries are stored in. Is created if it does not exist.
+
+        """
+
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def make_hasher():
+        """ Creates a hash object for cache keys. Cache entries depend on the versions of CCOBRA
+        and pandas as well as the cache format since they determine the pickled representation.
+
+        Returns
+        -------
+        hashlib object
+            Hash object initialized with the version information.
+
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update('{};{};{}'.format(__version__, pd.__version__, CACHE_FORMAT).encode('utf-8'))
+        return hasher
+
+    def load(self, key):
+        """ Loads a cache entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the cache entry.
+
+        Returns
+        -------
+        object
+            Cached object. None if the entry does not exist or cannot be read.
+
+        """
+
+        entry_path = os.path.join(self.path, '{}.pkl'.format(key))
+        if not os.path.isfile(entry_path):
+            return None
+
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                return pickle.load(entry_file)
+        except Exception as exc:
+            logger.warning('Ignoring unreadable data cache entry %s: %s', entry_path, exc)
+            return None
+
+    def save(self, key, obj):
+        """ Stores a cache entry. The entry is written to a temporary file first so that
+        concurrent runs never read partially written entries.
+
+        Parameters
+        ----------
+        key : str
+            Key of the cache entry.
+
+        obj : object
+            Object to store.
+
+        """
+
+        entry_path = os.path.join(self.path, '{}.pkl'.format(key))
+        tmp_path = '{}.{}.tmp'.format(entry_path, os.getpid())
+        with open(tmp_path, 'wb') as entry_file:
+            pickle.dump(obj, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+
+    def read_data_file(self, path, columns=None):
+        """ Reads a data file. The parsed dataframe is loaded from the cache if the content of
+        the file and the columns to read are unchanged.
+
+        Parameters
+        ----------
+        path : str
+            Path to the data file.
+
+        columns : list(str), optional
+            Columns to read. If not specified, all columns are read.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe containing the data.
+
+        """
+
+        hasher = self.make_hasher()
+        hasher.update(os.path.basename(path).encode('utf-8'))
+        hasher.update(json.dumps(columns).encode('utf-8'))
+        hash_file(path, hasher)
+        key = 'data_{}'.format(hasher.hexdigest())
+
+        df = self.load(key)
+        if df is not None:
+            logger.debug('Loaded "%s" from the data cache.', path)
+            return df
+
+        df = read_data_file(path, columns)
+        self.save(key, df)
+        return df
+
+    def to_eval_dict(self, data):
+        """ Converts a dataset to its evaluation dictionary. The dictionary is loaded from the
+        cache if a dataset with identical content and target columns was converted before.
+
+        Parameters
+        ----------
+        data : ccobra.CCobraData
+            Dataset to convert.
+
+        Returns
+        -------
+        dict(object, list)
+            Dictionary mapping from subject identifiers to lists of experimental data.
+
+        """
+
+        df = data.get()
+        hasher = self.make_hasher()
+        hasher.update(json.dumps(data.target_columns).encode('utf-8'))
+        hasher.update(json.dumps([[x, str(y)] for x, y in df.dtypes.items()]).encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+        key = 'eval_{}'.format(hasher.hexdigest())
+
+        eval_dict = self.load(key)
+        if eval_dict is not None:
+            logger.debug('Loaded evaluation dictionary from the data cache.')
+            return eval_dict
+
+        eval_dict = data.to_eval_dict()
+        self.save(key, eval_dict)
+        return eval_dict
@@ -2,12 +2,11 @@
 
 """
 
-import copy
-
-import pandas as pd
 import numpy as np
 
 from .. import tuple_to_string
+from ..helper import copy_lists
+from .result_sink import ResultColumns
 
 class EvaluationHandler():
     """ Evaluation handler class used to handle an evaluation setting.
@@ -41,11 +40,27 @@ class EvaluationHandler():
         self.comparator = comparator
         self.predict_fn_name = predict_fn_name
         self.adapt_fn_name = adapt_fn_name
+        self.predict_batch_fn_name = '{}_batch'.format(predict_fn_name)
+        self.adapt_batch_fn_name = None
+        if adapt_fn_name is not None:
+            self.adapt_batch_fn_name = '{}_batch'.format(adapt_fn_name)
         self.task_encoders = task_encoders
         self.resp_encoders = resp_encoders
 
-        # Prepare result dataframe
-        self.result = []
+        # Prepare typed result buffers
+        columns = [
+            'model', 'id', 'domain', 'response_type', 'sequence', 'task', 'choices', 'truth',
+            'prediction', 'score'
+        ]
+        if task_encoders:
+            columns.append('task_enc')
+        if resp_encoders:
+            columns.extend([
+                'truth_enc_{}'.format(data_column), 'prediction_enc_{}'.format(data_column)])
+        self.result = ResultColumns(columns, numeric_columns=['sequence', 'score'])
+
+        # Prediction cache of the currently evaluated model (None if caching is disabled)
+        self.prediction_cache = None
 
     def predict(self, model, modelname, item, target, aux):
         """ Queries a given model for the prediction to a given task and manages the results.
@@ -68,38 +83,104 @@ class EvaluationHandler():
             Dictionary containing auxiliary information that should be passed to the model.
 
         """
-        item = copy.deepcopy(item)
-        aux = copy.deepcopy(aux)
-
         # Obtain the model prediction
         pred_fn = getattr(model, self.predict_fn_name, None)
         if pred_fn is None:
             raise NotImplementedError("{} has to be implemented in {}".format(self.predict_fn_name, modelname))
 
-        prediction = pred_fn(item, **aux)
-        
+        if self.prediction_cache is not None:
+            prediction = self.prediction_cache.lookup(item, lambda: pred_fn(item, **aux))
+        else:
+            prediction = pred_fn(item, **aux)
+
+        self.add_result(modelname, item, target, prediction)
+
+    def predict_batch(self, model, modelname, items, targets, aux_list):
+        """ Queries a given model for the predictions to a list of tasks using its batch predict
+        function and manages the results. Falls back to querying the tasks individually if the
+        model does not provide a batch predict function.
+
+        Parameters
+        ----------
+        model : ccobra.CCobraModel
+            Model to query.
+
+        modelname : str
+            Name of the model in the results.
+
+        items : list(ccobra.Item)
+            The items that the model should base the predictions on.
+
+        targets : list(tuple)
+            True responses for the given items.
+
+        aux_list : list(dict(str, object))
+            Dictionaries containing auxiliary information that should be passed to the model.
+
+        """
+
+        # Cached predictions are obtained individually to avoid querying the model for them
+        if self.prediction_cache is not None:
+            for item, target, aux in zip(items, targets, aux_list):
+                self.predict(model, modelname, item, target, aux)
+            return
+
+        # Obtain the model predictions
+        pred_fn = getattr(model, self.predict_batch_fn_name, None)
+        if pred_fn is None:
+            for item, target, aux in zip(items, targets, aux_list):
+                self.predict(model, modelname, item, target, aux)
+            return
+
+        predictions = pred_fn(items, aux_list)
+        if len(predictions) != len(items):
+            raise ValueError("{} of {} returned {} predictions for {} items".format(
+                self.predict_batch_fn_name, modelname, len(predictions), len(items)))
+
+        for item, target, prediction in zip(items, targets, predictions):
+            self.add_result(modelname, item, target, prediction)
+
+    def add_result(self, modelname, item, target, prediction):
+        """ Scores a prediction and stores the evaluation result.
+
+        Parameters
+        ----------
+        modelname : str
+            Name of the model in the results.
+
+        item : ccobra.Item
+            The item the prediction is based on.
+
+        target : tuple
+            True response for the given item.
+
+        prediction : object
+            Response predicted by the model.
+
+        """
+
         score = self.comparator.compare(prediction, target, item.response_type, item.choices)
 
-        # Collect the evaluation result data
-        res_dict = {
-            'model': modelname,
-            'id': item.identifier,
-            'domain': item.domain,
-            'response_type': item.response_type,
-            'sequence': item.sequence_number,
-            'task': item.task_str,
-            'choices': item.choices_str,
-            'truth': tuple_to_string(target),
-            'prediction': tuple_to_string(prediction),
-            'score': score
-        }
+        # Collect the evaluation result data in the order of the result columns
+        row = [
+            modelname,
+            item.identifier,
+            item.domain,
+            item.response_type,
+            item.sequence_number,
+            item.task_str,
+            item.choices_str,
+            tuple_to_string(target),
+            tuple_to_string(prediction),
+            score
+        ]
 
         if self.task_encoders:
-            domain = res_dict['domain']
-            res_dict['task_enc'] = self.task_encoders[domain].encode_task(item.task) if domain in self.task_encoders else np.nan
+            domain = item.domain
+            row.append(self.task_encoders[domain].encode_task(item.task) if domain in self.task_encoders else np.nan)
 
         if self.resp_encoders:
-            domain = res_dict['domain']
+            domain = item.domain
             if item.response_type == "verify" or item.response_type == "accept":
                 if len(item.choices) != 1:
                     raise ValueError("Only a single choice is allowed for response types 'verify' and 'accept'")
@@ -113,10 +194,10 @@ class EvaluationHandler():
                     prediction_enc = "{};{}".format(verification_enc, prediction)
                     truth_enc = "{};{}".format(verification_enc, target)
 
-                res_dict['truth_enc_{}'.format(self.data_column)] = truth_enc
-                res_dict['prediction_enc_{}'.format(self.data_column)] = prediction_enc
+                row.append(truth_enc)
+                row.append(prediction_enc)
             elif item.response_type == "multiple-choice":
-                if not isinstance(prediction, list):
+                if not isinstance(prediction, (list, tuple)):
                     raise ValueError("A list of responses is required for multiple-choice predictions, but '{}' predicted '{}'".format(modelname, prediction))
                 
                 pred_encs = np.nan
@@ -124,16 +205,16 @@ class EvaluationHandler():
                 if domain in self.resp_encoders:
                     pred_encs = "|".join(sorted([self.resp_encoders[domain].encode_response(x, item.task) for x in prediction]))
                     truth_encs = "|".join(sorted([self.resp_encoders[domain].encode_response(x, item.task) for x in target]))
-                res_dict['prediction_enc_{}'.format(self.data_column)] = pred_encs
-                res_dict['truth_enc_{}'.format(self.data_column)] = truth_encs
+                row.append(truth_encs)
+                row.append(pred_encs)
                 
             else:
                 truth_enc = self.resp_encoders[domain].encode_response(target, item.task) if domain in self.resp_encoders else np.nan
                 prediction_enc = self.resp_encoders[domain].encode_response(prediction, item.task) if domain in self.resp_encoders else np.nan
-                res_dict['truth_enc_{}'.format(self.data_column)] = truth_enc
-                res_dict['prediction_enc_{}'.format(self.data_column)] = prediction_enc
+                row.append(truth_enc)
+                row.append(prediction_enc)
 
-        self.result.append(res_dict)
+        self.result.append(row)
 
     def adapt(self, model, item, full):
         """ Allows the given model to adapt to the true response to a given task.
@@ -147,23 +228,54 @@ class EvaluationHandler():
             The item that the model should base the prediction on.
 
         full : dict(str, object)
-            Dictionary containing the true response and the auxiliary information.
+            Dictionary containing the true response and the auxiliary information. Responses
+            are passed to the model as copies of their nested lists.
 
         """
         if self.adapt_fn_name is None:
             return
 
-        item = copy.deepcopy(item)
-        full = copy.deepcopy(full)
-
-        target = full[self.data_column]
-        aux = {x: y for x, y in full.items() if x != self.data_column}
         adapt_fn = getattr(model, self.adapt_fn_name, None)
         if adapt_fn is None:
             return
 
+        target = copy_lists(full[self.data_column])
+        aux = {x: copy_lists(y) for x, y in full.items() if x != self.data_column}
+
         adapt_fn(item, target, **aux)
 
+    def adapt_batch(self, model, items, fulls):
+        """ Allows the given model to adapt to the true responses to a list of tasks using its
+        batch adapt function. Falls back to adapting to the tasks individually if the model does
+        not provide a batch adapt function.
+
+        Parameters
+        ----------
+        model : ccobra.CCobraModel
+            Model to query.
+
+        items : list(ccobra.Item)
+            The items that the model should adapt to.
+
+        fulls : list(dict(str, object))
+            Dictionaries containing the true responses and the auxiliary information. Responses
+            are passed to the model as copies of their nested lists.
+
+        """
+        if self.adapt_fn_name is None:
+            return
+
+        adapt_fn = getattr(model, self.adapt_batch_fn_name, None)
+        if adapt_fn is None:
+            for item, full in zip(items, fulls):
+                self.adapt(model, item, full)
+            return
+
+        targets = [copy_lists(full[self.data_column]) for full in fulls]
+        aux_list = [
+            {x: copy_lists(y) for x, y in full.items() if x != self.data_column} for full in fulls]
+        adapt_fn(items, targets, aux_list)
+
     def get_result_df(self):
         """ Returns the results for the respective evaluation setting.
 
@@ -173,7 +285,7 @@ class EvaluationHandler():
             DataFrame containing the results for the evaluation setting.
 
         """
-        return pd.DataFrame(self.result)
+        return self.result.to_dataframe()
 
     def __repr__(self):
         s = 'EvaluationHandler(data_column={}, comparator={}, predict_fn_name={}, adapt_fn_name={}, task_encoders={}, resp_encoders={})'.format(
@@ -2,28 +2,234 @@
 
 """
 
-import copy
+import itertools
 import logging
+import multiprocessing
+import pickle
+import random
 import time
 
 import numpy as np
 import pandas as pd
 
+from ..data import CCobraData, DataArena, LazyEvalDict
+from ..item import feature_encoders
 from ..model import CCobraModel
 
 from . import contextmanager
 from . import modelimporter
+from .prediction_cache import PredictionCache
+from .result_sink import ResultSink
 
 
 # Initialize module-level logger
 logger = logging.getLogger(__name__)
 
+# Number of subjects used to verify the declaration of stateless models
+STATELESS_VALIDATION_SUBJECTS = 3
+
+# Maximum number of predictions cached per evaluation handler for cacheable models
+PREDICTION_CACHE_SIZE = 4096
+
+# State of evaluation worker processes
+_worker_state = None
+
+def make_unique_model_name(model_name, model_name_cache):
+    """ Ensures that model names are unique by appending apostrophes to duplicates. Shows a
+    warning if a duplicate is detected.
+
+    Parameters
+    ----------
+    model_name : str
+        Name of the model.
+
+    model_name_cache : set(str)
+        Set of model names already in use. Is extended by the resulting name.
+
+    Returns
+    -------
+    str
+        Unique model name.
+
+    """
+
+    original_model_name = model_name
+    changed = False
+    while model_name in model_name_cache:
+        model_name = model_name + '\''
+        changed = True
+    model_name_cache.add(model_name)
+
+    if changed:
+        logger.warning(
+            'Duplicate model name detected ("%s"). Changed to "%s".',
+            original_model_name, model_name
+        )
+
+    return model_name
+
+def overrides(model, fn_name):
+    """ Checks if a model overrides a function of the CCOBRA model interface.
+
+    Parameters
+    ----------
+    model : CCobraModel
+        Model to check.
+
+    fn_name : str
+        Name of the function.
+
+    Returns
+    -------
+    bool
+        True, if the model class provides its own implementation of the function.
+
+    """
+
+    return getattr(type(model), fn_name, None) is not getattr(CCobraModel, fn_name, None)
+
+def is_cacheable(model, fn_name):
+    """ Checks if the predictions of a model function can be cached across subjects.
+
+    Parameters
+    ----------
+    model : CCobraModel
+        Model to check.
+
+    fn_name : str
+        Name of the predict function.
+
+    Returns
+    -------
+    bool
+        True, if the model declares its predictions to be cacheable.
+
+    """
+
+    if model.cache_predictions:
+        return True
+    return getattr(getattr(model, fn_name, None), 'cacheable', False)
+
+def _init_model_worker(evaluator):
+    """ Initializes a worker process for the parallel evaluation of models.
+
+    Parameters
+    ----------
+    evaluator : Evaluator
+        Evaluator the worker evaluates models for.
+
+    """
+
+    global _worker_state
+    _worker_state = evaluator
+    evaluator.reset_streams()
+
+    # Worker processes of a pool are not allowed to create pools themselves
+    evaluator.n_jobs = 1
+
+    # Forked workers inherit the random state of the parent process
+    random.seed()
+    np.random.seed()
+
+def _evaluate_model_worker(model_idx):
+    """ Evaluates a single model within a worker process.
+
+    Parameters
+    ----------
+    model_idx : int
+        Index of the model in the benchmark.
+
+    Returns
+    -------
+    (str, list(ResultColumns), dict(str, dict(str, object)))
+        Tuple containing the name of the model, the results of the evaluation handlers and the
+        model logging information.
+
+    """
+
+    evaluator = _worker_state
+
+    # Only return the results of the current model
+    for eh in evaluator.benchmark.evaluation_handlers:
+        eh.result.clear()
+
+    model_name, model_logging_dict = evaluator.evaluate_model(
+        model_idx, evaluator.benchmark.models[model_idx], set())
+    return model_name, [eh.result for eh in evaluator.benchmark.evaluation_handlers], model_logging_dict
+
+def _init_subject_worker(evaluator, pre_models, model_name):
+    """ Initializes a worker process for the parallel evaluation of subjects.
+
+    Parameters
+    ----------
+    evaluator : Evaluator
+        Evaluator the worker evaluates subjects for.
+
+    pre_models : list(CCobraModel)
+        Pre-trained models for the crossvalidation folds.
+
+    model_name : str
+        Name of the model in the results.
+
+    """
+
+    global _worker_state
+    _worker_state = (evaluator, pre_models, model_name)
+    evaluator.reset_streams()
+
+    # Forked workers inherit the random state of the parent process
+    random.seed()
+    np.random.seed()
+
+def _evaluate_subject_worker(subj_key_identifier):
+    """ Evaluates a single subject within a worker process.
+
+    Parameters
+    ----------
+    subj_key_identifier : object
+        Key of the subject in the test dictionary.
+
+    Returns
+    -------
+    (list(ResultColumns), dict(str, dict(str, object)), float, list((int, int)))
+        Tuple containing the results of the evaluation handlers, the model logging information
+        for the subject, the time spent on copying model states, and the prediction cache hits
+        and misses of the evaluation handlers.
+
+    """
+
+    evaluator, pre_models, model_name = _worker_state
+    pre_model = pre_models[evaluator.subject_folds.get(subj_key_identifier, 0)]
+
+    # Only return the results and statistics of the current subject. Cached predictions are
+    # kept for the following subjects of the worker.
+    for eh in evaluator.benchmark.evaluation_handlers:
+        eh.result.clear()
+        if eh.prediction_cache is not None:
+            eh.prediction_cache.hits = 0
+            eh.prediction_cache.misses = 0
+    evaluator.copy_time = 0
+
+    model_logging_dict = evaluator.evaluate_subject(
+        pre_model, model_name, subj_key_identifier, evaluator.dict_test[subj_key_identifier])
+
+    cache_stats = []
+    for eh in evaluator.benchmark.evaluation_handlers:
+        if eh.prediction_cache is None:
+            cache_stats.append((0, 0))
+        else:
+            cache_stats.append((eh.prediction_cache.hits, eh.prediction_cache.misses))
+
+    return [eh.result for eh in evaluator.benchmark.evaluation_handlers], model_logging_dict, \
+        evaluator.copy_time, cache_stats
+
 class Evaluator():
     """ CCOBRA evaluation routine.
 
     """
 
-    def __init__(self, benchmark, is_silent=False, cache_df=None):
+    def __init__(self, benchmark, is_silent=False, cache_df=None, n_jobs=1, n_model_jobs=1,
+                 result_store=None, journal=None, result_sink=None, use_arena=False):
         """ Initializes the evaluator object by preparing the data representations and precomputing
         the required training and adaption steps.
 
@@ -38,6 +244,31 @@ class Evaluator():
         cache_df : pandas.DataFrame, option
             Cache result dataframe.
 
+        n_jobs : int, optional
+            Number of worker processes used to evaluate the subjects in parallel. Subjects are
+            evaluated sequentially for values smaller than 2.
+
+        n_model_jobs : int, optional
+            Number of worker processes used to evaluate the models in parallel. Models are
+            evaluated sequentially for values smaller than 2.
+
+        result_store : ccobra.benchmark.ResultStore, optional
+            Store for the results of the models. Models with stored results are not evaluated
+            again.
+
+        journal : ccobra.benchmark.RunJournal, optional
+            Journal the results of evaluated subjects are recorded in. Subjects already contained
+            in the journal are not evaluated again.
+
+        result_sink : ccobra.benchmark.ResultSink, optional
+            Sink the results of the models are written to. If not specified, the results are
+            collected in memory.
+
+        use_arena : bool, optional
+            Flag indicating that the datasets are kept in integer-coded data arenas instead of
+            evaluation dictionaries. The experimental data of the subjects is only constructed
+            on access, which keeps worker processes from duplicating the complete datasets.
+
         """
 
         logger.info('Setting up evaluator...')
@@ -46,9 +277,18 @@ class Evaluator():
         self.benchmark = benchmark
         self.is_silent = is_silent
         self.cache_df = cache_df
+        self.n_jobs = n_jobs
+        self.n_model_jobs = n_model_jobs
+        self.result_store = result_store
+        self.journal = journal
+        self.result_sink = result_sink
+        self.use_arena = use_arena
+
+        # Time spent on copying model states for the current model
+        self.copy_time = 0
 
         # Extract the dataset information
-        self.dict_test = benchmark.data_test.to_eval_dict()
+        self.dict_test = self.to_eval_dict(benchmark.data_test)
 
         self.dict_pre_train = None
         self.dict_pre_train_person = None
@@ -56,13 +296,16 @@ class Evaluator():
 
         if benchmark.data_pre_train is not None:
             logger.debug('Supplied training data to evaluation.')
-            self.dict_pre_train = benchmark.data_pre_train.to_eval_dict()
+            if benchmark.data_pre_train is benchmark.data_test:
+                self.dict_pre_train = self.dict_test
+            else:
+                self.dict_pre_train = self.to_eval_dict(benchmark.data_pre_train)
         if benchmark.data_pre_train_person is not None:
             logger.debug('Supplied person training data to evaluation.')
-            self.dict_pre_train_person = benchmark.data_pre_train_person.to_eval_dict()
+            self.dict_pre_train_person = self.to_eval_dict(benchmark.data_pre_train_person)
         if benchmark.data_pre_person_background is not None:
             logger.debug('Supplied person background data to evaluation.')
-            self.dict_pre_person_background = benchmark.data_pre_person_background.to_eval_dict()
+            self.dict_pre_person_background = self.to_eval_dict(benchmark.data_pre_person_background)
 
         if benchmark.type == 'coverage':
             self.dict_pre_train_person = self.dict_test
@@ -72,7 +315,10 @@ class Evaluator():
         # Extract the functionality to apply
         self.do_adapt = (benchmark.type == 'adaption')
         self.do_pre_train_global = (self.dict_pre_train is not None) and not benchmark.corresponding_data
-        self.do_pre_train_leaveoneout = (self.dict_pre_train is not None) and benchmark.corresponding_data
+        self.do_pre_train_leaveoneout = (self.dict_pre_train is not None) and benchmark.corresponding_data \
+            and benchmark.cv_folds is None
+        self.do_pre_train_crossvalidation = (self.dict_pre_train is not None) and benchmark.corresponding_data \
+            and benchmark.cv_folds is not None
         self.do_pre_train_person = (self.dict_pre_train_person is not None)
         self.do_pre_person_background = (self.dict_pre_person_background is not None)
 
@@ -80,173 +326,157 @@ class Evaluator():
         logger.debug('   do_adapt: %s', self.do_adapt)
         logger.debug('   do_pre_train_global: %s', self.do_pre_train_global)
         logger.debug('   do_pre_train_leaveoneout: %s', self.do_pre_train_leaveoneout)
+        logger.debug('   do_pre_train_crossvalidation: %s', self.do_pre_train_crossvalidation)
         logger.debug('   do_pre_train_person: %s', self.do_pre_train_person)
         logger.debug('   do_pre_person_background: %s', self.do_pre_person_background)
 
-    def evaluate(self):
+        # Randomly assign the test subjects to crossvalidation folds. The assignment is
+        # reproducible via the seed of the benchmark.
+        self.subject_folds = {}
+        if self.do_pre_train_crossvalidation:
+            subj_keys = list(self.dict_test.keys())
+            n_folds = min(benchmark.cv_folds, len(subj_keys))
+            rng = np.random.RandomState(benchmark.cv_seed)
+            subj_idxs = rng.permutation(len(subj_keys))
+            for fold_idx, fold_subj_idxs in enumerate(np.array_split(subj_idxs, n_folds)):
+                for subj_idx in fold_subj_idxs:
+                    self.subject_folds[subj_keys[subj_idx]] = fold_idx
+            logger.debug('   crossvalidation folds: %d (seed %d)', n_folds, benchmark.cv_seed)
+
+    def reset_streams(self):
+        """ Resets the positions of streamed datasets. Forked worker processes have to read
+        streamed data files on their own.
+
+        """
+
+        for eval_dict in [self.dict_test, self.dict_pre_train_person]:
+            if isinstance(eval_dict, LazyEvalDict):
+                eval_dict.reset()
+
+    def to_eval_dict(self, data):
+        """ Converts a dataset to its evaluation dictionary. Uses a data arena if requested or
+        the data cache of the benchmark if available.
+
+        Parameters
+        ----------
+        data : ccobra.CCobraData
+            Dataset to convert.
+
+        Returns
+        -------
+        dict(object, list)
+            Dictionary mapping from subject identifiers to lists of experimental data.
+
+        """
+
+        if not isinstance(data, CCobraData):
+            return data.to_eval_dict()
+        if self.use_arena:
+            return DataArena(data).to_eval_dict()
+        if self.benchmark.data_cache is not None:
+            return self.benchmark.data_cache.to_eval_dict(data)
+        return data.to_eval_dict()
+
+    def evaluate(self, build_result_df=True):
         """ Core evaluation routine.
 
+        Parameters
+        ----------
+        build_result_df : bool, optional
+            Flag indicating that the result dataframe is constructed from the result sink. Can be
+            disabled if the results are only written to a file.
+
         Returns
         -------
-        pd.DataFrame
-            Pandas dataframe containing the evaluation results.
+        (pd.DataFrame, dict(str, dict(str, dict(str, object))))
+            Pandas dataframe containing the evaluation results (None if build_result_df is
+            disabled) and the model logging information.
 
         """
 
-        logger.info('Starting evaluation routine...')
-
-        model_logging_results = {}
-        model_name_cache = set() if self.cache_df is None else set(self.cache_df['model'].unique())
-
-        # Activate model context
-        for model_idx, modelinfo in enumerate(self.benchmark.models):
-            # Print the progress
-            log_str = "Evaluating '{}' ({}/{})...".format(
-                modelinfo.path, model_idx + 1, len(self.benchmark.models))
-            logger.debug(''.join(['='] * 80))
-            logger.info(log_str)
-            logger.debug(''.join(['='] * 80))
-
-            if not self.is_silent:
-                print(log_str)
-
-            # Initialize the dictionary for the models logging output
-            model_logging_dict = {}
-
-            # Setup model context
-            with contextmanager.dir_context(modelinfo.path):
-                # Dynamically import the CCOBRA model
-                importer = modelimporter.ModelImporter(
-                    modelinfo.path, CCobraModel,
-                    load_specific_class=modelinfo.load_specific_class
-                )
-
-                # Instantiate and prepare the model for predictions
-                pre_model = importer.instantiate(modelinfo.args)
-                pre_model.setup_environment(self.benchmark.type)
-
-                # Check if model is applicable to domains/response types
-                self.check_model_applicability(pre_model)
-
-                # Only use the model's name if no override is specified
-                model_name = modelinfo.override_name
-                if not model_name:
-                    model_name = pre_model.name
-
-                # Ensure that names are unique and show a warning if duplicates are detected
-                original_model_name = model_name
-                changed = False
-                while model_name in model_name_cache:
-                    model_name = model_name + '\''
-                    changed = True
-                model_name_cache.add(model_name)
-
-                if changed:
-                    logger.warning(
-                        'Duplicate model name detected ("%s"). Changed to "%s".',
-                        original_model_name, model_name
-                    )
-
-                # Only perform general pre-training if training data is
-                # supplied and corresponding data is false. Otherwise, the
-                # model has to be re-trained for each subject.
-                if self.do_pre_train_global:
-                    logger.debug('General pre-training for %s...', model_name)
-                    pre_model.pre_train(list(self.dict_pre_train.values()))
-
-                # Iterate subject
-                for subj_key_identifier, subj_data in self.dict_test.items():
-                    start_subject = time.time()
-
-                    subj_id = subj_data[0]['item'].identifier
-                    model = copy.deepcopy(pre_model)
-
-                    # Set the model to new participant
-                    model.start_participant(id=subj_id)
-
-                    # Perform pre-training for individual subjects only if
-                    # corresponding data is set to true
-                    if self.do_pre_train_leaveoneout:
-                        logger.debug('Individual pre-training for %s...', model_name)
-                        cur_train_data = [
-                            value for key, value in self.dict_pre_train.items() if key != subj_id]
-                        model.pre_train(cur_train_data)
-
-                    # Perform background fitting
-                    if self.do_pre_person_background:
-                        logger.debug('Person background training for %s...', model_name)
-                        cur_train_data = self.dict_pre_person_background.get(subj_key_identifier, [])
-                        model.pre_person_background(cur_train_data)
-
-                    # Perform person training
-                    if (self.benchmark.type != 'loo-coverage') and self.do_pre_train_person:
-                        logger.debug('Person training for %s...', model_name)
-                        subj_person_train_data = self.dict_pre_train_person.get(subj_key_identifier, [])
-                        model.pre_train_person(subj_person_train_data)
-
-                    # Iterate over individual tasks
-                    start_eval = time.time()
-                    for task_idx, task in enumerate(subj_data):
-                        start_task = time.time()
-                        logger.debug('Querying for task %s/%s...', task_idx + 1, len(subj_data))
-
-                        # Integrity checks
-                        assert task['item'].identifier == subj_id
-
-                        # If there is no leave-one-out coverage
-                        if self.benchmark.type != 'loo-coverage':
-                            # Query models for predictions
-                            for eh in self.benchmark.evaluation_handlers:
-                                target = task[eh.data_column]
-                                eh.predict(model, model_name, task['item'], target, task['aux'])
-
-                            # Perform model adaption
-                            if self.do_adapt:
-                                for eh in self.benchmark.evaluation_handlers:
-                                    target = task[eh.data_column]
-                                    eh.adapt(model, task['item'], task['full'])
-                        # In LOO-coverage, the model has to be pretrained for every single task
-                        else:
-                            task_model = copy.deepcopy(model)
-                            
-                            logger.debug('Person training for %s...', model_name)
-                            subj_person_train_data = self.dict_pre_train_person.get(subj_key_identifier, [])
-                            subj_person_train_data = subj_person_train_data[:task_idx] + subj_person_train_data[task_idx + 1:]
-                            task_model.pre_train_person(subj_person_train_data)
-                            
-                            # Query models for predictions
-                            for eh in self.benchmark.evaluation_handlers:
-                                target = task[eh.data_column]
-                                eh.predict(task_model, model_name, task['item'], target, task['aux'])
-                            
-                            model_log = {}
-                            task_model.end_participant(subj_id, model_log)
-                            if len(model_log) > 0:
-                                model_logging_dict["{}_{}".format(subj_id, task_idx)] = model_log
-                        logger.debug(
-                            'Task {} took {:4f}s'.format(task_idx + 1, time.time() - start_task))
-
-                    # Finalize subject evaluation and allow the model to store parameters
-                    if (self.benchmark.type != 'loo-coverage'):
-                        model_log = {}
-                        model.end_participant(subj_id, model_log)
-                        if len(model_log) > 0:
-                            model_logging_dict[subj_id]= model_log
-
-                    logger.debug('Subject evaluation took {:.4}s'.format(time.time() - start_eval))
-                    logger.debug('Subject {} done. took {:.4}s'.format(
-                        subj_id, time.time() - start_subject))
+        # Item features are computed by the encoders of the response evaluation. The encoders
+        # are registered for the duration of the evaluation only, so that the previously
+        # registered encoders (e.g., of other evaluators in the process) are restored afterwards.
+        response_handler = self.benchmark.evaluation_handlers[0]
+        with feature_encoders(response_handler.task_encoders, response_handler.resp_encoders):
+            logger.info('Starting evaluation routine...')
+
+            sink = self.result_sink if self.result_sink is not None else ResultSink()
+            model_logging_results = {}
+            model_name_cache = set()
+            if self.cache_df is not None:
+                model_name_cache = set(self.cache_df['model'].unique())
+
+            # Load the results of unchanged models from the result store
+            fingerprints = {}
+            stored_results = {}
+            if self.result_store is not None:
+                for model_idx, modelinfo in enumerate(self.benchmark.models):
+                    fingerprints[model_idx] = self.result_store.fingerprint(modelinfo)
+                    stored = self.result_store.load(fingerprints[model_idx])
+                    if stored is not None:
+                        logger.info("Loading stored results of '%s'...", modelinfo.path)
+                        stored_results[model_idx] = stored
+                        model_name_cache.add(stored[0])
+
+            # Evaluate the remaining models. Results are obtained lazily in the order of the models.
+            model_idxs = [x for x in range(len(self.benchmark.models)) if x not in stored_results]
+            if self.n_model_jobs > 1:
+                model_results = self.evaluate_models_parallel(model_idxs, model_name_cache)
+            else:
+                model_results = self.evaluate_models(model_idxs, model_name_cache)
+
+            for model_idx in range(len(self.benchmark.models)):
+                if model_idx in stored_results:
+                    model_name, model_df, model_logging_dict = stored_results[model_idx]
+                else:
+                    _, model_name, model_logging_dict = next(model_results)
+                    model_df = self.collect_model_results()
+                    if self.result_store is not None:
+                        self.result_store.save(
+                            fingerprints[model_idx], model_name, model_df, model_logging_dict)
+
+                sink.append_frame(model_df)
 
                 # Save the models logging information if available
                 if len(model_logging_dict) > 0:
                     model_logging_results[model_name] = model_logging_dict
 
-                # Unload the imported model and its dependencies. Might cause garbage collection
-                # issues
-                importer.unimport()
+            # Integrate cache
+            if self.cache_df is not None:
+                if len(sink) == 0:
+                    logger.debug('Empty result dataframe. Returning cache only.')
+                    model_logging_results = {}
+                else:
+                    logger.debug('Merging cache and result dataframe...')
+                    assert sorted(sink.columns) == sorted(list(self.cache_df)), 'Incompatible cache'
+                sink.append_frame(self.cache_df)
+
+            if not build_result_df:
+                sink.close()
+                return None, model_logging_results
+
+            return sink.to_dataframe(), model_logging_results
+
+    def collect_model_results(self):
+        """ Combines the results of the evaluation handlers for the current model into a single
+        dataframe and clears the handler results. All handlers are queried for the same sequence
+        of tasks, so their results are aligned by position.
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe containing the results of the model.
+
+        Raises
+        ------
+        ValueError
+            Thrown if the results of the evaluation handlers are not aligned.
+
+        """
 
         res_df = None
-        on_list = [
+        key_columns = [
             'model',
             'id',
             'domain',
@@ -257,28 +487,978 @@ class Evaluator():
         ]
 
         for enc in self.benchmark.evaluation_handlers:
+            enc_df = enc.get_result_df()
+            enc.result.clear()
+
             if res_df is None:
                 logger.debug('Preparing new result dataframe based on evaluation handler')
-                res_df = enc.get_result_df()
-            else:
-                logger.debug('Adding evaluation handler result to result dataframe')
-                res_df = res_df.merge(enc.get_result_df(), on=on_list, suffixes=('', '_' + enc.data_column))
+                res_df = enc_df
+                continue
+
+            logger.debug('Adding evaluation handler result to result dataframe')
+            aligned = len(enc_df) == len(res_df) and all(
+                np.array_equal(enc_df[x].values, res_df[x].values) for x in ['id', 'sequence'])
+            if not aligned:
+                raise ValueError('Results of evaluation handler for "{}" are not aligned.'.format(
+                    enc.data_column))
+
+            # Shared columns are suffixed with the data column of the handler
+            enc_df = enc_df.drop(columns=key_columns)
+            enc_df.columns = [
+                x + '_' + enc.data_column if x in res_df else x for x in enc_df.columns]
+            res_df = pd.concat([res_df, enc_df], axis=1)
 
         # Rename score column
-        res_df = res_df.rename(columns={'score' : 'score_response'})
+        return res_df.rename(columns={'score' : 'score_response'})
+
+    def evaluate_models(self, model_idxs, model_name_cache):
+        """ Evaluates models of the benchmark sequentially. Models contained in the journal are
+        restored instead.
+
+        Parameters
+        ----------
+        model_idxs : list(int)
+            Indices of the models to evaluate.
+
+        model_name_cache : set(str)
+            Set of model names already in use. Is extended by the names of the models.
+
+        Yields
+        ------
+        (int, str, dict(str, dict(str, object)))
+            Tuple containing the index of the model, its name in the results and its model
+            logging information. The results of the model are stored in the evaluation handlers.
+
+        """
+
+        for model_idx in model_idxs:
+            if self.is_journaled(model_idx):
+                model_name, model_logging_dict = self.restore_model(model_idx, model_name_cache)
+            else:
+                model_name, model_logging_dict = self.evaluate_model(
+                    model_idx, self.benchmark.models[model_idx], model_name_cache)
+            yield model_idx, model_name, model_logging_dict
+
+    def evaluate_model(self, model_idx, modelinfo, model_name_cache):
+        """ Imports a model and evaluates it on all subjects. The results are stored in the
+        evaluation handlers of the benchmark.
+
+        Parameters
+        ----------
+        model_idx : int
+            Index of the model in the benchmark.
+
+        modelinfo : ModelInfo
+            Information about the model to evaluate.
+
+        model_name_cache : set(str)
+            Set of model names already in use. Is extended by the name of the model.
+
+        Returns
+        -------
+        (str, dict(str, dict(str, object)))
+            Tuple containing the name of the model in the results and its model logging
+            information.
+
+        """
+
+        # Print the progress
+        log_str = "Evaluating '{}' ({}/{})...".format(
+            modelinfo.path, model_idx + 1, len(self.benchmark.models))
+        logger.debug(''.join(['='] * 80))
+        logger.info(log_str)
+        logger.debug(''.join(['='] * 80))
+
+        if not self.is_silent:
+            print(log_str)
+
+        # Initialize the dictionary for the models logging output
+        model_logging_dict = {}
+
+        # Reset the time spent on copying model states
+        self.copy_time = 0
+        start_model = time.time()
+
+        # Setup model context
+        with contextmanager.dir_context(modelinfo.path):
+            # Dynamically import the CCOBRA model
+            importer = modelimporter.ModelImporter(
+                modelinfo.path, CCobraModel,
+                load_specific_class=modelinfo.load_specific_class
+            )
+
+            # Instantiate and prepare the model for predictions
+            pre_model = importer.instantiate(modelinfo.args)
+            pre_model.setup_environment(self.benchmark.type)
+
+            # Check if model is applicable to domains/response types
+            self.check_model_applicability(pre_model)
+
+            # Only use the model's name if no override is specified
+            model_name = modelinfo.override_name
+            if not model_name:
+                model_name = pre_model.name
+            model_name = make_unique_model_name(model_name, model_name_cache)
+
+            # Only perform general pre-training if training data is
+            # supplied and corresponding data is false. Otherwise, the
+            # model has to be re-trained for each subject unless it is able to
+            # remove subjects from its pre-training.
+            if self.do_pre_train_global:
+                logger.debug('General pre-training for %s...', model_name)
+                pre_model.pre_train(list(self.dict_pre_train.values()))
+            elif (self.do_pre_train_leaveoneout or self.do_pre_train_crossvalidation) \
+                and overrides(pre_model, 'pre_train_exclude'):
+                logger.debug('General pre-training for %s (subjects are excluded later)...', model_name)
+                pre_model.pre_train(list(self.dict_pre_train.values()))
+
+            # Prepare the models for the crossvalidation folds. Models without pre-training are
+            # shared by all folds.
+            pre_models = [pre_model]
+            if self.do_pre_train_crossvalidation and self.trains_subjects(pre_model):
+                pre_models = self.pre_train_folds(pre_model, model_name)
+            elif self.do_pre_train_crossvalidation:
+                pre_models = [pre_model] * (max(self.subject_folds.values()) + 1)
+
+            # Verify that models declared as stateless do not change during the evaluation
+            if pre_model.stateless and not self.validate_stateless(pre_models, model_name):
+                for model in [pre_model] + pre_models:
+                    model.stateless = False
+
+            # Cache predictions across subjects if the model declares them to be cacheable
+            self.setup_prediction_caches(pre_model, model_name)
+
+            # Skip subjects which are already contained in the journal
+            journaled = self.journal.completed(model_idx) if self.journal is not None else {}
+            result_offsets = [len(eh.result) for eh in self.benchmark.evaluation_handlers]
+            subj_keys = [x for x in self.dict_test.keys() if str(x) not in journaled]
+
+            # Iterate subjects
+            if self.uses_lockstep(pre_model):
+                model_logging_dict = self.evaluate_subjects_lockstep(
+                    pre_model, model_name, model_idx, subj_keys)
+            elif self.n_jobs > 1:
+                model_logging_dict = self.evaluate_subjects_parallel(
+                    pre_models, model_name, model_idx, subj_keys)
+            else:
+                model_logging_dict = self.evaluate_subjects(
+                    pre_models, model_name, model_idx, subj_keys)
+
+            if journaled:
+                model_logging_dict = self.restore_subjects(
+                    model_name, journaled, result_offsets, model_logging_dict)
+
+            # Unload the imported model and its dependencies. Might cause garbage collection
+            # issues
+            importer.unimport()
+
+        # Report and remove the prediction caches
+        for eh in self.benchmark.evaluation_handlers:
+            if eh.prediction_cache is not None:
+                cache = eh.prediction_cache
+                n_queries = max(cache.hits + cache.misses, 1)
+                logger.info(
+                    'Prediction cache of %s (%s): %d hits, %d misses (%.1f%% hit rate).',
+                    model_name, eh.data_column, cache.hits, cache.misses,
+                    100 * cache.hits / n_queries)
+            eh.prediction_cache = None
+
+        # Report the time spent on copying model states
+        model_time = time.time() - start_model
+        logger.info('Copying model states of %s took %.2fs (%.1f%% of %.2fs).',
+            model_name, self.copy_time, 100 * self.copy_time / max(model_time, 1e-9), model_time)
+
+        return model_name, model_logging_dict
+
+    def evaluate_models_parallel(self, model_idxs, model_name_cache):
+        """ Evaluates models of the benchmark in separate worker processes. Each model is
+        imported and evaluated in a fresh process with its own working directory and module
+        state. The results are streamed back in the order of the benchmark models.
+
+        Parameters
+        ----------
+        model_idxs : list(int)
+            Indices of the models to evaluate.
+
+        model_name_cache : set(str)
+            Set of model names already in use. Is extended by the names of the models.
+
+        Yields
+        ------
+        (int, str, dict(str, dict(str, object)))
+            Tuple containing the index of the model, its name in the results and its model
+            logging information. The results of the model are stored in the evaluation handlers.
+
+        """
+
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning(
+                'Parallel evaluation requires the "fork" start method. Falling back to ' \
+                'sequential evaluation.')
+            yield from self.evaluate_models(model_idxs, model_name_cache)
+            return
+
+        # Fully journaled models are restored in order without evaluating them
+        pending_idxs = [x for x in model_idxs if not self.is_journaled(x)]
+
+        if self.n_jobs > 1:
+            logger.warning('Subjects are evaluated sequentially when models run in parallel.')
+
+        n_workers = max(min(self.n_model_jobs, len(pending_idxs)), 1)
+        logger.debug('Evaluating models with %d worker processes...', n_workers)
+
+        # Every model is evaluated in a process of its own to isolate the imported modules
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(n_workers, initializer=_init_model_worker, initargs=(self,),
+                      maxtasksperchild=1) as pool:
+            model_results = pool.imap(_evaluate_model_worker, pending_idxs)
+            for model_idx in model_idxs:
+                if model_idx not in pending_idxs:
+                    model_name, model_logging_dict = self.restore_model(model_idx, model_name_cache)
+                    yield model_idx, model_name, model_logging_dict
+                    continue
+
+                model_name, handler_results, model_logging_dict = next(model_results)
+
+                # Names can only be made unique with respect to the other models here
+                unique_model_name = make_unique_model_name(model_name, model_name_cache)
+                for eh, eh_result in zip(self.benchmark.evaluation_handlers, handler_results):
+                    if unique_model_name != model_name:
+                        eh_result.fill('model', unique_model_name)
+                    eh.result.extend(eh_result)
+
+                yield model_idx, unique_model_name, model_logging_dict
+
+    def record_subject(self, model_idx, model_name, subj_key_identifier, handler_results,
+                       model_logging_dict):
+        """ Records the results of an evaluated subject in the journal if available.
+
+        Parameters
+        ----------
+        model_idx : int
+            Index of the model in the benchmark.
+
+        model_name : str
+            Name of the model in the results.
+
+        subj_key_identifier : object
+            Key of the subject in the test dictionary.
+
+        handler_results : list(ResultColumns)
+            Results of the evaluation handlers for the subject.
+
+        model_logging_dict : dict(str, dict(str, object))
+            Model logging information obtained for the subject.
+
+        """
+
+        if self.journal is not None:
+            self.journal.record(
+                model_idx, model_name, subj_key_identifier,
+                [x.to_records() for x in handler_results], model_logging_dict)
+
+    def is_journaled(self, model_idx):
+        """ Checks if the journal contains all subjects of a model.
+
+        Parameters
+        ----------
+        model_idx : int
+            Index of the model in the benchmark.
+
+        Returns
+        -------
+        bool
+            True, if the model does not need to be evaluated.
+
+        """
+
+        if self.journal is None:
+            return False
+
+        journaled = self.journal.completed(model_idx)
+        return all(str(x) in journaled for x in self.dict_test.keys())
+
+    def restore_model(self, model_idx, model_name_cache):
+        """ Restores the results of a fully journaled model into the evaluation handlers.
+
+        Parameters
+        ----------
+        model_idx : int
+            Index of the model in the benchmark.
+
+        model_name_cache : set(str)
+            Set of model names already in use. Is extended by the name of the model.
+
+        Returns
+        -------
+        (str, dict(str, dict(str, object)))
+            Tuple containing the name of the model in the results and its model logging
+            information.
+
+        """
+
+        logger.info("Restoring journaled results of '%s'...", self.benchmark.models[model_idx].path)
+
+        journaled = self.journal.completed(model_idx)
+        model_name = journaled[str(next(iter(self.dict_test.keys())))]['model']
+        model_name = make_unique_model_name(model_name, model_name_cache)
+
+        result_offsets = [len(eh.result) for eh in self.benchmark.evaluation_handlers]
+        model_logging_dict = self.restore_subjects(model_name, journaled, result_offsets, {})
+        return model_name, model_logging_dict
+
+    def restore_subjects(self, model_name, journaled, result_offsets, model_logging_dict):
+        """ Adds the journaled results of subjects to the results of a model. The results of the
+        model are sorted by the order of the subjects in the test data.
+
+        Parameters
+        ----------
+        model_name : str
+            Name of the model in the results.
+
+        journaled : dict(str, dict(str, object))
+            Journal entries of the subjects.
+
+        result_offsets : list(int)
+            Positions of the first results of the model in the evaluation handlers.
+
+        model_logging_dict : dict(str, dict(str, object))
+            Model logging information obtained for the evaluated subjects.
+
+        Returns
+        -------
+        dict(str, dict(str, object))
+            Model logging information of all subjects.
+
+        """
+
+        subj_order = {}
+        for subj_key_identifier in self.dict_test.keys():
+            subj_order[subj_key_identifier] = len(subj_order)
+
+        for subj_key_identifier in self.dict_test.keys():
+            entry = journaled.get(str(subj_key_identifier))
+            if entry is None:
+                continue
+
+            for eh, eh_result in zip(self.benchmark.evaluation_handlers, entry['results']):
+                for res_dict in eh_result:
+                    res_dict['model'] = model_name
+                eh.result.extend_records(eh_result)
+
+            for key, value in entry['model_log']:
+                model_logging_dict[key] = value
+
+        # Results of a subject are contiguous and keep their order in the stable sort
+        for eh, offset in zip(self.benchmark.evaluation_handlers, result_offsets):
+            subj_ids = eh.result['id'][offset:]
+            eh.result.reorder(
+                offset, sorted(range(len(subj_ids)), key=lambda x: subj_order[subj_ids[x]]))
+
+        return model_logging_dict
+
+    def uses_lockstep(self, model):
+        """ Checks if the subjects can be evaluated in lockstep for a model. Requires an adaption
+        benchmark in which the model is not pre-trained or trained for individual subjects and
+        test data that is not streamed.
+
+        Parameters
+        ----------
+        model : CCobraModel
+            Model to check.
+
+        Returns
+        -------
+        bool
+            True, if the subjects are evaluated in lockstep.
+
+        """
+
+        if not model.lockstep or self.benchmark.type != 'adaption':
+            return False
+
+        if self.do_pre_train_leaveoneout or self.do_pre_train_crossvalidation \
+            or self.do_pre_train_person or self.do_pre_person_background:
+            logger.info(
+                'Lockstep evaluation is disabled for %s because of subject-specific training.',
+                model.name)
+            return False
+
+        # Lockstep evaluation requires all subjects in memory
+        if self.benchmark.stream_test_data:
+            logger.info('Lockstep evaluation is disabled for %s because of streamed test data.',
+                model.name)
+            return False
+
+        return True
+
+    def evaluate_subjects_lockstep(self, pre_model, model_name, model_idx, subj_keys):
+        """ Evaluates a model on test subjects in lockstep. At each sequence position, a single
+        model instance is queried for the predictions to the tasks of all subjects at once and
+        subsequently adapted to the true responses. The results are stored in the evaluation
+        handlers in the order of the regular subject-wise evaluation.
+
+        Parameters
+        ----------
+        pre_model : CCobraModel
+            Globally pre-trained model.
+
+        model_name : str
+            Name of the model in the results.
+
+        model_idx : int
+            Index of the model in the benchmark.
+
+        subj_keys : list(object)
+            Keys of the subjects to evaluate.
+
+        Returns
+        -------
+        dict(str, dict(str, object))
+            Model logging information obtained for all subjects.
+
+        """
+
+        model_logging_dict = {}
+        start_eval = time.time()
+
+        if self.n_jobs > 1:
+            logger.info('Subjects of %s are evaluated in lockstep instead of in parallel.', model_name)
+
+        start_copy = time.time()
+        model = pre_model.clone()
+        self.copy_time += time.time() - start_copy
+
+        if not subj_keys:
+            return model_logging_dict
+
+        subjects = [self.dict_test[x] for x in subj_keys]
+        subj_ids = [subj_data[0]['item'].identifier for subj_data in subjects]
+        for subj_id in subj_ids:
+            model.start_participant(id=subj_id)
+
+        # Iterate over the sequence positions while keeping track of the result order
+        result_offsets = [len(eh.result) for eh in self.benchmark.evaluation_handlers]
+        result_keys = []
+        for task_idx in range(max(len(subj_data) for subj_data in subjects)):
+            active = [
+                subj_idx for subj_idx, subj_data in enumerate(subjects)
+                if task_idx < len(subj_data)]
+            tasks = [subjects[subj_idx][task_idx] for subj_idx in active]
+            items = [task['item'] for task in tasks]
+            logger.debug('Querying for task %s of %s subjects...', task_idx + 1, len(active))
+
+            for eh in self.benchmark.evaluation_handlers:
+                eh.predict_batch(
+                    model, model_name, items,
+                    [task[eh.data_column] for task in tasks],
+                    [task['aux'] for task in tasks])
+
+            if self.adapts(model):
+                for eh in self.benchmark.evaluation_handlers:
+                    eh.adapt_batch(model, items, [task['full'] for task in tasks])
+
+            result_keys.extend((subj_idx, task_idx) for subj_idx in active)
+
+        # Restore the subject-wise order of the results
+        order = sorted(range(len(result_keys)), key=lambda idx: result_keys[idx])
+        for eh, offset in zip(self.benchmark.evaluation_handlers, result_offsets):
+            eh.result.reorder(offset, order)
+
+        # Finalize subject evaluation and allow the model to store parameters
+        subj_offset = 0
+        for subj_key_identifier, subj_id, subj_data in zip(subj_keys, subj_ids, subjects):
+            subj_logging_dict = {}
+            model_log = {}
+            model.end_participant(subj_id, model_log)
+            if len(model_log) > 0:
+                subj_logging_dict[subj_id] = model_log
+            model_logging_dict.update(subj_logging_dict)
+
+            handler_results = [
+                eh.result.slice(offset + subj_offset, offset + subj_offset + len(subj_data))
+                for eh, offset in zip(self.benchmark.evaluation_handlers, result_offsets)]
+            self.record_subject(
+                model_idx, model_name, subj_key_identifier, handler_results, subj_logging_dict)
+            subj_offset += len(subj_data)
+
+        logger.debug('Lockstep evaluation took {:.4}s'.format(time.time() - start_eval))
+
+        return model_logging_dict
+
+    def adapts(self, model):
+        """ Checks if a model is adapted during the evaluation of a subject.
+
+        Parameters
+        ----------
+        model : CCobraModel
+            Model to check.
+
+        Returns
+        -------
+        bool
+            True, if adaption is performed and the model implements an adapt function or a batch
+            adapt function of the evaluation handlers.
+
+        """
+
+        if not self.do_adapt or model.stateless:
+            return False
+
+        return any(
+            eh.adapt_fn_name is not None and (
+                overrides(model, eh.adapt_fn_name) or overrides(model, eh.adapt_batch_fn_name))
+            for eh in self.benchmark.evaluation_handlers)
+
+    def trains_subjects(self, model):
+        """ Checks if a model is pre-trained individually for the subjects (leave-one-out) or the
+        crossvalidation folds. Models implementing neither pre_train nor pre_train_exclude are
+        not altered by these trainings.
+
+        Parameters
+        ----------
+        model : CCobraModel
+            Model to check.
+
+        Returns
+        -------
+        bool
+            True, if the leave-one-out or crossvalidation pre-training alters the model.
+
+        """
+
+        if not (self.do_pre_train_leaveoneout or self.do_pre_train_crossvalidation):
+            return False
+
+        return overrides(model, 'pre_train') or overrides(model, 'pre_train_exclude')
+
+    def trains_person(self, model):
+        """ Checks if a model is trained on the data of the individual subjects before their
+        evaluation. Person training functions which are not overriden by the model are only
+        considered if they fall back to a custom adapt function.
+
+        Parameters
+        ----------
+        model : CCobraModel
+            Model to check.
+
+        Returns
+        -------
+        bool
+            True, if the person training of the benchmark alters the model.
+
+        """
+
+        if self.do_pre_person_background and overrides(model, 'pre_person_background'):
+            return True
+
+        return self.do_pre_train_person and (
+            overrides(model, 'pre_train_person') or overrides(model, 'adapt'))
+
+    def validate_stateless(self, pre_models, model_name):
+        """ Verifies that a model declared as stateless does not change its state when being
+        evaluated on a sample of subjects. The sample is prepared exactly as in the evaluation
+        (i.e., including leave-one-out and person training), so that only the predictions and
+        adaption calls are required to leave the model unchanged.
+
+        Parameters
+        ----------
+        pre_models : list(CCobraModel)
+            Pre-trained models for the crossvalidation folds declared as stateless.
+
+        model_name : str
+            Name of the model in the results.
+
+        Returns
+        -------
+        bool
+            True, if the model did not change its state. Models failing the verification are
+            supposed to be evaluated as regular models.
+
+        """
+
+        sample = itertools.islice(self.dict_test.items(), STATELESS_VALIDATION_SUBJECTS)
+        for subj_key_identifier, subj_data in sample:
+            subj_id = subj_data[0]['item'].identifier
+            model = pre_models[self.subject_folds.get(subj_key_identifier, 0)].clone()
+            model.start_participant(id=subj_id)
+            self.train_subject(model, model_name, subj_key_identifier, subj_id)
+
+            try:
+                initial_state = pickle.dumps(model.__dict__)
+            except Exception: # pylint: disable=broad-except
+                logger.warning(
+                    'Could not verify the state of %s. Evaluating it as a regular model.', model_name)
+                return False
+
+            for task in subj_data:
+                for eh in self.benchmark.evaluation_handlers:
+                    getattr(model, eh.predict_fn_name)(task['item'], **task['aux'])
+                if self.do_adapt:
+                    for eh in self.benchmark.evaluation_handlers:
+                        eh.adapt(model, task['item'], task['full'])
+
+            model.end_participant(subj_id, {})
+
+            if pickle.dumps(model.__dict__) != initial_state:
+                logger.warning(
+                    'Model %s is declared stateless but changed its state during evaluation. ' \
+                    'Evaluating it as a regular model.', model_name)
+                return False
+
+        return True
+
+    def setup_prediction_caches(self, pre_model, model_name):
+        """ Attaches prediction caches to the evaluation handlers whose predict functions are
+        declared as cacheable by the model. Since cached predictions are shared across subjects,
+        caching requires a (validated) stateless model and is disabled if the model is trained
+        individually for the subjects or crossvalidation folds.
+
+        Parameters
+        ----------
+        pre_model : CCobraModel
+            Model to prepare the caches for.
+
+        model_name : str
+            Name of the model in the results.
+
+        """
+
+        for eh in self.benchmark.evaluation_handlers:
+            eh.prediction_cache = None
+            if not is_cacheable(pre_model, eh.predict_fn_name):
+                continue
+
+            if not pre_model.stateless:
+                logger.warning(
+                    'Prediction caching is disabled for %s because it is not stateless.', model_name)
+            elif self.trains_subjects(pre_model) or self.trains_person(pre_model):
+                logger.info(
+                    'Prediction caching is disabled for %s because it is trained ' \
+                    'individually for the subjects.', model_name)
+            else:
+                logger.debug('Caching predictions of %s (%s)...', model_name, eh.data_column)
+                eh.prediction_cache = PredictionCache(PREDICTION_CACHE_SIZE)
+
+    def pre_train_folds(self, pre_model, model_name):
+        """ Pre-trains a copy of the model for each crossvalidation fold. The training data of a
+        fold consists of all subjects which are not part of the fold.
+
+        Parameters
+        ----------
+        pre_model : CCobraModel
+            Model to pre-train. If the model implements pre_train_exclude, it is expected to be
+            pre-trained on the full training data already.
+
+        model_name : str
+            Name of the model in the results.
+
+        Returns
+        -------
+        list(CCobraModel)
+            List of pre-trained models for the folds.
+
+        """
+
+        fold_models = []
+        for fold_idx in range(max(self.subject_folds.values()) + 1):
+            logger.debug('Pre-training fold %d for %s...', fold_idx + 1, model_name)
+            fold_model = pre_model.clone()
+
+            if overrides(fold_model, 'pre_train_exclude'):
+                cur_exclude_data = [
+                    value for key, value in self.dict_pre_train.items()
+                    if self.subject_folds.get(key) == fold_idx]
+                fold_model.pre_train_exclude(cur_exclude_data)
+            else:
+                cur_train_data = [
+                    value for key, value in self.dict_pre_train.items()
+                    if self.subject_folds.get(key) != fold_idx]
+                fold_model.pre_train(cur_train_data)
+
+            fold_models.append(fold_model)
+
+        return fold_models
+
+    def train_subject(self, model, model_name, subj_key_identifier, subj_id):
+        """ Performs the training of a model for an individual subject prior to its evaluation,
+        i.e., leave-one-out pre-training, person background training and person training.
+
+        Parameters
+        ----------
+        model : CCobraModel
+            Model to train. Is altered in place.
+
+        model_name : str
+            Name of the model in the results.
+
+        subj_key_identifier : object
+            Key of the subject in the evaluation dictionaries.
+
+        subj_id : object
+            Identifier of the subject.
+
+        """
+
+        # Perform pre-training for individual subjects only if
+        # corresponding data is set to true
+        if self.do_pre_train_leaveoneout and overrides(model, 'pre_train_exclude'):
+            logger.debug('Excluding subject from pre-training for %s...', model_name)
+            cur_exclude_data = [
+                value for key, value in self.dict_pre_train.items() if key == subj_id]
+            if cur_exclude_data:
+                model.pre_train_exclude(cur_exclude_data)
+        elif self.do_pre_train_leaveoneout and overrides(model, 'pre_train'):
+            logger.debug('Individual pre-training for %s...', model_name)
+            cur_train_data = [
+                value for key, value in self.dict_pre_train.items() if key != subj_id]
+            model.pre_train(cur_train_data)
+
+        # Perform background fitting
+        if self.do_pre_person_background:
+            logger.debug('Person background training for %s...', model_name)
+            cur_train_data = self.dict_pre_person_background.get(subj_key_identifier, [])
+            model.pre_person_background(cur_train_data)
+
+        # Perform person training
+        if (self.benchmark.type != 'loo-coverage') and self.do_pre_train_person:
+            logger.debug('Person training for %s...', model_name)
+            subj_person_train_data = self.dict_pre_train_person.get(subj_key_identifier, [])
+            model.pre_train_person(subj_person_train_data)
+
+    def evaluate_subject(self, pre_model, model_name, subj_key_identifier, subj_data):
+        """ Evaluates a model on the data of a single subject. The results are stored in the
+        evaluation handlers of the benchmark.
+
+        Parameters
+        ----------
+        pre_model : CCobraModel
+            Globally pre-trained model. Is copied before the subject-specific training is
+            performed unless the model is stateless.
+
+        model_name : str
+            Name of the model in the results.
+
+        subj_key_identifier : object
+            Key of the subject in the evaluation dictionaries.
+
+        subj_data : list(dict(str, object))
+            Test data of the subject.
+
+        Returns
+        -------
+        dict(str, dict(str, object))
+            Model logging information obtained for the subject.
+
+        """
+
+        model_logging_dict = {}
+        start_subject = time.time()
+
+        subj_id = subj_data[0]['item'].identifier
+
+        # Stateless models can be shared across subjects unless they are trained individually
+        model = pre_model
+        trains_person = self.trains_person(pre_model)
+        trains_leaveoneout = self.do_pre_train_leaveoneout and self.trains_subjects(pre_model)
+        if not pre_model.stateless or trains_leaveoneout or trains_person:
+            start_copy = time.time()
+            model = pre_model.clone()
+            self.copy_time += time.time() - start_copy
+
+        # Set the model to new participant
+        model.start_participant(id=subj_id)
+
+        # Perform the subject-specific training
+        self.train_subject(model, model_name, subj_key_identifier, subj_id)
+
+        # In LOO-coverage, the model is reset for every task
+        resets_person = self.benchmark.type == 'loo-coverage' and (not model.stateless or trains_person)
+        if resets_person:
+            start_copy = time.time()
+            model_snapshot = model.snapshot()
+            self.copy_time += time.time() - start_copy
+
+        # Query batch predictions at once if the model does not adapt between the tasks
+        start_eval = time.time()
+        batch_handlers = []
+        if self.benchmark.type != 'loo-coverage' and not self.adapts(model):
+            batch_handlers = [
+                eh for eh in self.benchmark.evaluation_handlers
+                if overrides(model, eh.predict_batch_fn_name)]
+
+        for eh in batch_handlers:
+            logger.debug('Querying for %s batch predictions...', len(subj_data))
+            eh.predict_batch(
+                model, model_name,
+                [task['item'] for task in subj_data],
+                [task[eh.data_column] for task in subj_data],
+                [task['aux'] for task in subj_data])
+
+        # Iterate over individual tasks
+        for task_idx, task in enumerate(subj_data):
+            start_task = time.time()
+            logger.debug('Querying for task %s/%s...', task_idx + 1, len(subj_data))
+
+            # Integrity checks
+            assert task['item'].identifier == subj_id
+
+            # If there is no leave-one-out coverage
+            if self.benchmark.type != 'loo-coverage':
+                # Query models for predictions
+                for eh in self.benchmark.evaluation_handlers:
+                    if eh in batch_handlers:
+                        continue
+                    target = task[eh.data_column]
+                    eh.predict(model, model_name, task['item'], target, task['aux'])
+
+                # Perform model adaption
+                if self.do_adapt and not model.stateless:
+                    for eh in self.benchmark.evaluation_handlers:
+                        target = task[eh.data_column]
+                        eh.adapt(model, task['item'], task['full'])
+            # In LOO-coverage, the model has to be pretrained for every single task
+            else:
+                if resets_person:
+                    if task_idx > 0:
+                        start_copy = time.time()
+                        model.restore(model_snapshot)
+                        self.copy_time += time.time() - start_copy
+
+                    logger.debug('Person training for %s...', model_name)
+                    subj_person_train_data = self.dict_pre_train_person.get(subj_key_identifier, [])
+                    subj_person_train_data = subj_person_train_data[:task_idx] + subj_person_train_data[task_idx + 1:]
+                    model.pre_train_person(subj_person_train_data)
+
+                # Query models for predictions
+                for eh in self.benchmark.evaluation_handlers:
+                    target = task[eh.data_column]
+                    eh.predict(model, model_name, task['item'], target, task['aux'])
+
+                model_log = {}
+                model.end_participant(subj_id, model_log)
+                if len(model_log) > 0:
+                    model_logging_dict["{}_{}".format(subj_id, task_idx)] = model_log
+            logger.debug(
+                'Task {} took {:4f}s'.format(task_idx + 1, time.time() - start_task))
+
+        # Finalize subject evaluation and allow the model to store parameters
+        if (self.benchmark.type != 'loo-coverage'):
+            model_log = {}
+            model.end_participant(subj_id, model_log)
+            if len(model_log) > 0:
+                model_logging_dict[subj_id]= model_log
+
+        logger.debug('Subject evaluation took {:.4}s'.format(time.time() - start_eval))
+        logger.debug('Subject {} done. took {:.4}s'.format(
+            subj_id, time.time() - start_subject))
+
+        return model_logging_dict
+
+    def evaluate_subjects(self, pre_models, model_name, model_idx, subj_keys):
+        """ Evaluates a model on test subjects sequentially. The results of the subjects are
+        stored in the evaluation handlers and recorded in the journal.
+
+        Parameters
+        ----------
+        pre_models : list(CCobraModel)
+            Pre-trained models for the crossvalidation folds. Contains the globally pre-trained
+            model only if no crossvalidation is performed.
+
+        model_name : str
+            Name of the model in the results.
+
+        model_idx : int
+            Index of the model in the benchmark.
+
+        subj_keys : list(object)
+            Keys of the subjects to evaluate.
+
+        Returns
+        -------
+        dict(str, dict(str, object))
+            Model logging information obtained for the subjects.
+
+        """
+
+        model_logging_dict = {}
+        for subj_key_identifier in subj_keys:
+            subj_pre_model = pre_models[self.subject_folds.get(subj_key_identifier, 0)]
+            result_offsets = [len(eh.result) for eh in self.benchmark.evaluation_handlers]
+
+            subj_logging_dict = self.evaluate_subject(
+                subj_pre_model, model_name, subj_key_identifier, self.dict_test[subj_key_identifier])
+            model_logging_dict.update(subj_logging_dict)
+
+            handler_results = [
+                eh.result.slice(offset)
+                for eh, offset in zip(self.benchmark.evaluation_handlers, result_offsets)]
+            self.record_subject(
+                model_idx, model_name, subj_key_identifier, handler_results, subj_logging_dict)
+
+        return model_logging_dict
+
+    def evaluate_subjects_parallel(self, pre_models, model_name, model_idx, subj_keys):
+        """ Evaluates a model on test subjects using a pool of worker processes. Each worker
+        receives the pre-trained models once when it is started. The results of the subjects are
+        merged back into the evaluation handlers in the order of the test data.
+
+        Parameters
+        ----------
+        pre_models : list(CCobraModel)
+            Pre-trained models for the crossvalidation folds. Contains the globally pre-trained
+            model only if no crossvalidation is performed.
+
+        model_name : str
+            Name of the model in the results.
+
+        model_idx : int
+            Index of the model in the benchmark.
+
+        subj_keys : list(object)
+            Keys of the subjects to evaluate.
+
+        Returns
+        -------
+        dict(str, dict(str, object))
+            Model logging information obtained for all subjects.
+
+        """
+
+        model_logging_dict = {}
+
+        # Models are loaded dynamically from their source files and can therefore only be
+        # shared with the worker processes by forking the interpreter.
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning(
+                'Parallel evaluation requires the "fork" start method. Falling back to ' \
+                'sequential evaluation.')
+            return self.evaluate_subjects(pre_models, model_name, model_idx, subj_keys)
+
+        if not subj_keys:
+            return model_logging_dict
 
-        # Integrate cache
-        if self.cache_df is None:
-            logger.debug('Empty cache. Returning only result dataframe.')
-            return res_df, model_logging_results
+        n_workers = min(self.n_jobs, len(subj_keys))
+        logger.debug('Evaluating subjects of %s with %d worker processes...', model_name, n_workers)
 
-        if res_df.empty:
-            logger.debug('Empty result dataframe. Returning cache only.')
-            return self.cache_df, {}
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(n_workers, initializer=_init_subject_worker,
+                      initargs=(self, pre_models, model_name)) as pool:
+            subj_results = pool.imap(_evaluate_subject_worker, subj_keys)
+            for subj_key_identifier, (handler_results, subj_logging_dict, subj_copy_time,
+                                      cache_stats) in zip(subj_keys, subj_results):
+                self.record_subject(
+                    model_idx, model_name, subj_key_identifier, handler_results, subj_logging_dict)
+                for eh, eh_result, (hits, misses) in zip(
+                    self.benchmark.evaluation_handlers, handler_results, cache_stats):
+                    eh.result.extend(eh_result)
+                    if eh.prediction_cache is not None:
+                        eh.prediction_cache.hits += hits
+                        eh.prediction_cache.misses += misses
+                model_logging_dict.update(subj_logging_dict)
+                self.copy_time += subj_copy_time
 
-        logger.debug('Merging cache and result dataframe...')
-        assert sorted(list(res_df)) == sorted(list(self.cache_df)), 'Incompatible cache'
-        return pd.concat([res_df, self.cache_df]), model_logging_results
+        return model_logging_dict
 
     def check_model_applicability(self, pre_model):
         """ Verifies the applicability of a model by checking its supported domains and response
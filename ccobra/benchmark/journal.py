@@ -0,0 +1,159 @@
+""" CCOBRA run journal. Records the results of evaluated subjects on disk to allow for resuming
+interrupted evaluation runs.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from .result_store import ResultStore, to_json_type
+
+
+# Initialize module-level logger
+logger = logging.getLogger(__name__)
+
+class RunJournal():
+    """ Journal file storing the results of evaluated subjects as JSON lines. The first line
+    contains the fingerprint of the benchmark the journal was created for.
+
+    """
+
+    def __init__(self, path, benchmark, resume=False):
+        """ Initializes the journal. Either creates a new journal file or loads the entries of an
+        existing one.
+
+        Parameters
+        ----------
+        path : str
+            Path to the journal file.
+
+        benchmark : ccobra.Benchmark
+            Benchmark the journal is created for.
+
+        resume : bool, optional
+            Flag indicating that an existing journal is continued. Otherwise, the journal file
+            is overwritten.
+
+        Raises
+        ------
+        ValueError
+            Thrown if the journal to resume does not exist or belongs to a different benchmark.
+
+        """
+
+        self.path = path
+        self.fingerprint = self.fingerprint_benchmark(benchmark)
+
+        # Journaled subjects per model index
+        self.entries = {}
+
+        if not resume:
+            with open(path, 'w') as journal_file:
+                journal_file.write(json.dumps({'benchmark': self.fingerprint}) + '\n')
+            return
+
+        if not os.path.isfile(path):
+            raise ValueError('Journal to resume does not exist: {}'.format(path))
+
+        with open(path) as journal_file:
+            lines = journal_file.read().splitlines()
+
+        if not lines or json.loads(lines[0]).get('benchmark') != self.fingerprint:
+            raise ValueError('Journal {} was created for a different benchmark.'.format(path))
+
+        for line_idx, line in enumerate(lines[1:]):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Only the last entry can be incomplete if the run was interrupted
+                if line_idx != len(lines) - 2:
+                    raise
+                logger.warning('Removing incomplete journal entry from %s.', path)
+                with open(path, 'w') as journal_file:
+                    journal_file.write(''.join(x + '\n' for x in lines[:-1]))
+                continue
+            self.entries.setdefault(entry['model_idx'], {})[entry['subject']] = entry
+
+        logger.info('Resuming from journal %s (%d subjects).',
+            path, sum(len(x) for x in self.entries.values()))
+
+    @staticmethod
+    def fingerprint_benchmark(benchmark):
+        """ Computes the fingerprint of a benchmark including its models.
+
+        Parameters
+        ----------
+        benchmark : ccobra.Benchmark
+            Benchmark to compute the fingerprint for.
+
+        Returns
+        -------
+        str
+            Hexadecimal fingerprint.
+
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update(ResultStore.fingerprint_benchmark(benchmark).encode('utf-8'))
+        hasher.update(json.dumps([str(x) for x in benchmark.models]).encode('utf-8'))
+        return hasher.hexdigest()
+
+    def completed(self, model_idx):
+        """ Returns the journaled subjects of a model.
+
+        Parameters
+        ----------
+        model_idx : int
+            Index of the model in the benchmark.
+
+        Returns
+        -------
+        dict(str, dict(str, object))
+            Dictionary mapping from string representations of the subject keys to the journal
+            entries containing the results ('results') and the model logging information
+            ('model_log', list of key-value pairs) of the subjects.
+
+        """
+
+        return self.entries.get(model_idx, {})
+
+    def record(self, model_idx, model_name, subj_key_identifier, handler_results, model_log):
+        """ Appends the results of a subject to the journal.
+
+        Parameters
+        ----------
+        model_idx : int
+            Index of the model in the benchmark.
+
+        model_name : str
+            Name of the model in the results.
+
+        subj_key_identifier : object
+            Key of the subject in the evaluation dictionaries.
+
+        handler_results : list(list(dict(str, object)))
+            Results of the evaluation handlers for the subject.
+
+        model_log : dict(str, dict(str, object))
+            Model logging information obtained for the subject.
+
+        """
+
+        # Logging information is stored as pairs to retain the types of the keys
+        entry = {
+            'model_idx': model_idx,
+            'model': model_name,
+            'subject': str(subj_key_identifier),
+            'results': handler_results,
+            'model_log': [[key, value] for key, value in model_log.items()]
+        }
+        line = json.dumps(entry, default=to_json_type) + '\n'
+
+        # Entries are written with a single append so that parallel workers do not interleave
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, line.encode('utf-8'))
+        finally:
+            os.close(fd)
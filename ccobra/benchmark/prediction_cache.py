@@ -0,0 +1,83 @@
+""" CCOBRA prediction cache. Memoizes the predictions of deterministic models across subjects.
+
+"""
+
+import collections
+
+
+class PredictionCache():
+    """ Bounded prediction cache with least-recently-used eviction.
+
+    """
+
+    def __init__(self, maxsize):
+        """ Initializes the prediction cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of predictions to store. The least recently used prediction is
+            evicted if the cache is full.
+
+        """
+
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(item):
+        """ Constructs the cache key of an item. Predictions of cacheable models may only depend
+        on the fields contained in the key.
+
+        Parameters
+        ----------
+        item : ccobra.Item
+            Item to construct the key for.
+
+        Returns
+        -------
+        tuple(str)
+            Cache key of the item.
+
+        """
+
+        return (item.domain, item.response_type, item.task_str, item.choices_str)
+
+    def lookup(self, item, predict_fn):
+        """ Returns the cached prediction for an item. Queries the prediction function and stores
+        the result if the item is not contained in the cache.
+
+        Parameters
+        ----------
+        item : ccobra.Item
+            Item to obtain the prediction for.
+
+        predict_fn : callable
+            Function producing the prediction if the item is not contained in the cache.
+
+        Returns
+        -------
+        object
+            Prediction for the item.
+
+        """
+
+        key = self.make_key(item)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        prediction = predict_fn()
+        self.entries[key] = prediction
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return prediction
+
+    def __repr__(self):
+        return 'PredictionCache(maxsize={}, size={}, hits={}, misses={})'.format(
+            self.maxsize, len(self.entries), self.hits, self.misses)
@@ -0,0 +1,539 @@
+""" CCOBRA result sink. Collects evaluation results in columnar buffers and writes them to disk in
+chunks.
+
+"""
+
+import array
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Initialize module-level logger
+logger = logging.getLogger(__name__)
+
+#: Supported output formats and their file extensions
+FORMATS = {
+    'csv': ['.csv'],
+    'parquet': ['.parquet', '.pq'],
+    'arrow': ['.arrow', '.feather', '.ipc']
+}
+
+def import_pyarrow():
+    """ Imports the pyarrow modules required for reading and writing Parquet and Arrow files.
+
+    Returns
+    -------
+    (module, module, module)
+        Tuple containing the pyarrow, pyarrow.parquet and pyarrow.ipc modules.
+
+    Raises
+    ------
+    ImportError
+        Thrown if pyarrow is not installed.
+
+    """
+
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError(
+            'Parquet and Arrow files require pyarrow (pip install pyarrow).') from exc
+    return pyarrow, pyarrow.parquet, pyarrow.ipc
+
+class ResultColumns():
+    """ Typed append buffers for result rows. Numeric columns are stored in arrays of 64-bit
+    integers or floats, which are widened to object lists if other values occur. All other columns
+    are stored as lists referencing the (interned) result values. Rows are never materialized as
+    dictionaries.
+
+    """
+
+    def __init__(self, columns, numeric_columns=()):
+        """ Initializes the empty buffers.
+
+        Parameters
+        ----------
+        columns : list(str)
+            Names of the columns in order.
+
+        numeric_columns : iterable(str), optional
+            Names of the columns stored in typed arrays.
+
+        """
+
+        self.columns = list(columns)
+        self.numeric_columns = [x for x in self.columns if x in set(numeric_columns)]
+        self.column_idxs = {x: idx for idx, x in enumerate(self.columns)}
+        self.buffers = []
+        self.clear()
+
+    def __len__(self):
+        """ Returns the number of buffered rows.
+
+        Returns
+        -------
+        int
+            Number of rows.
+
+        """
+
+        return len(self.buffers[0]) if self.buffers else 0
+
+    def __getitem__(self, column):
+        """ Returns the buffer of a column.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+
+        Returns
+        -------
+        array.array or list
+            Buffer containing the values of the column.
+
+        """
+
+        return self.buffers[self.column_idxs[column]]
+
+    def clear(self):
+        """ Removes all rows from the buffers.
+
+        """
+
+        numeric = set(self.numeric_columns)
+        self.buffers = [array.array('q') if x in numeric else [] for x in self.columns]
+
+    def empty_copy(self):
+        """ Creates empty buffers with the same columns.
+
+        Returns
+        -------
+        ResultColumns
+            Empty result buffers.
+
+        """
+
+        return ResultColumns(self.columns, self.numeric_columns)
+
+    def widen(self, idx, value):
+        """ Widens the buffer of a column to a type which is able to hold a value. Integer arrays
+        are widened to float arrays, all other arrays to object lists.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the column.
+
+        value : object
+            Value which could not be appended to the buffer.
+
+        Returns
+        -------
+        array.array or list
+            Widened buffer.
+
+        """
+
+        buffer = self.buffers[idx]
+        if isinstance(buffer, array.array) and buffer.typecode == 'q' and \
+            isinstance(value, (float, np.floating)):
+            buffer = array.array('d', buffer)
+        else:
+            buffer = list(buffer)
+        self.buffers[idx] = buffer
+        return buffer
+
+    def append(self, values):
+        """ Appends a row to the buffers.
+
+        Parameters
+        ----------
+        values : tuple(object)
+            Values of the row in the order of the columns.
+
+        """
+
+        for idx, (buffer, value) in enumerate(zip(self.buffers, values)):
+            try:
+                buffer.append(value)
+            except (TypeError, OverflowError):
+                self.widen(idx, value).append(value)
+
+    def extend(self, other):
+        """ Appends the rows of other result buffers with the same columns.
+
+        Parameters
+        ----------
+        other : ResultColumns
+            Result buffers to append.
+
+        """
+
+        for idx, other_buffer in enumerate(other.buffers):
+            buffer = self.buffers[idx]
+            if isinstance(buffer, array.array) and (not isinstance(other_buffer, array.array) \
+                or other_buffer.typecode != buffer.typecode):
+                # Append value-wise to widen the buffer if necessary
+                for value in other_buffer:
+                    try:
+                        buffer.append(value)
+                    except (TypeError, OverflowError):
+                        buffer = self.widen(idx, value)
+                        buffer.append(value)
+            else:
+                buffer.extend(other_buffer)
+
+    def fill(self, column, value):
+        """ Sets a column to a single value for all rows.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+
+        value : object
+            Value to set.
+
+        """
+
+        self.buffers[self.column_idxs[column]] = [value] * len(self)
+
+    def slice(self, start, stop=None):
+        """ Copies a range of rows into new buffers.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first row.
+
+        stop : int, optional
+            Index after the last row. Defaults to the end of the buffers.
+
+        Returns
+        -------
+        ResultColumns
+            Buffers containing the rows.
+
+        """
+
+        result = self.empty_copy()
+        result.buffers = [x[start:stop] for x in self.buffers]
+        return result
+
+    def reorder(self, start, order):
+        """ Reorders the rows following a position.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first row to reorder.
+
+        order : list(int)
+            New order of the rows relative to start.
+
+        """
+
+        for idx, buffer in enumerate(self.buffers):
+            tail = buffer[start:]
+            reordered = [tail[x] for x in order]
+            if isinstance(buffer, array.array):
+                reordered = array.array(buffer.typecode, reordered)
+            buffer[start:] = reordered
+
+    def to_records(self):
+        """ Converts the rows into dictionaries, e.g., for serialization.
+
+        Returns
+        -------
+        list(dict(str, object))
+            Rows mapping from column names to values.
+
+        """
+
+        return [dict(zip(self.columns, row)) for row in zip(*self.buffers)]
+
+    def extend_records(self, records):
+        """ Appends rows given as dictionaries. Missing values are filled with NaN.
+
+        Parameters
+        ----------
+        records : list(dict(str, object))
+            Rows mapping from column names to values.
+
+        """
+
+        for record in records:
+            self.append(tuple(record.get(x, np.nan) for x in self.columns))
+
+    def to_dataframe(self):
+        """ Constructs a dataframe from the buffers. Numeric arrays are converted without
+        intermediate Python objects.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe containing the rows.
+
+        """
+
+        data = {}
+        for column, buffer in zip(self.columns, self.buffers):
+            data[column] = np.array(buffer) if isinstance(buffer, array.array) else buffer
+        return pd.DataFrame(data, columns=self.columns)
+
+class ResultSink():
+    """ Columnar result sink. Results are appended as typed dataframes which are combined into
+    chunks once enough rows are pending. Without a path, the chunks are kept in memory. With a
+    path, the chunks are written to the file and released (memory-bounded mode); the result
+    dataframe is only constructed from the file on request using the recorded column types.
+
+    """
+
+    def __init__(self, path=None, fmt=None, chunk_size=100000):
+        """ Initializes the result sink.
+
+        Parameters
+        ----------
+        path : str, optional
+            File to write the results to. If not specified, the results are kept in memory.
+
+        fmt : str, optional
+            Output format (csv, parquet, arrow). Is determined from the file extension if not
+            specified.
+
+        chunk_size : int, optional
+            Number of rows collected before a chunk is flushed.
+
+        Raises
+        ------
+        ValueError
+            Thrown if the output format is not supported.
+
+        """
+
+        self.path = path
+        self.chunk_size = chunk_size
+
+        self.fmt = fmt
+        if path is not None and fmt is None:
+            extension = os.path.splitext(path)[1].lower()
+            self.fmt = next((x for x, y in FORMATS.items() if extension in y), 'csv')
+        if self.fmt is not None and self.fmt not in FORMATS:
+            raise ValueError('Unsupported result format: {}'.format(self.fmt))
+
+        # Pending dataframes of the current chunk
+        self.columns = []
+        self.pending = []
+        self.n_buffered = 0
+
+        # Flushed chunks (in-memory mode) and file writer state
+        self.chunks = []
+        self.n_rows = 0
+        self.dtypes = {}
+        self.writer = None
+        self.schema = None
+        self.closed = False
+
+    def __len__(self):
+        """ Returns the number of rows contained in the sink.
+
+        Returns
+        -------
+        int
+            Number of flushed and buffered rows.
+
+        """
+
+        return self.n_rows + self.n_buffered
+
+    def append_rows(self, rows):
+        """ Appends result rows to the sink.
+
+        Parameters
+        ----------
+        rows : list(dict(str, object))
+            Result rows mapping from column names to values.
+
+        """
+
+        if rows:
+            self.append_frame(pd.DataFrame(rows))
+
+    def append_frame(self, df):
+        """ Appends a result dataframe to the sink. The typed columns of the dataframe are kept
+        until the chunk is flushed.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Result dataframe.
+
+        """
+
+        for column in df.columns:
+            if column not in self.columns:
+                self.add_column(column)
+
+        if len(df) == 0:
+            return
+
+        self.pending.append(df)
+        self.n_buffered += len(df)
+        if self.n_buffered >= self.chunk_size:
+            self.flush()
+
+    def add_column(self, column):
+        """ Adds a column to the sink. Previous rows are filled with missing values.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+
+        Raises
+        ------
+        ValueError
+            Thrown if a chunk was already written to a file.
+
+        """
+
+        if self.path is not None and self.n_rows > 0:
+            raise ValueError('Cannot add column "{}" after results were written.'.format(column))
+
+        self.columns.append(column)
+        for chunk in self.chunks:
+            chunk[column] = np.nan
+
+    def flush(self):
+        """ Converts the buffered rows into a typed chunk and writes it to the output file.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The flushed chunk. None if no rows were buffered.
+
+        """
+
+        if self.n_buffered == 0:
+            return None
+
+        pending = [
+            x if list(x.columns) == self.columns else x.reindex(columns=self.columns)
+            for x in self.pending]
+        chunk = pending[0] if len(pending) == 1 else pd.concat(pending, ignore_index=True)
+        self.pending = []
+        self.n_buffered = 0
+
+        logger.debug('Flushing %d result rows...', len(chunk))
+        if self.path is None:
+            self.chunks.append(chunk)
+            self.n_rows += len(chunk)
+            return chunk
+
+        # Record the column types for reading the results from the file
+        for column, dtype in chunk.dtypes.items():
+            prev_dtype = self.dtypes.get(column, dtype)
+            if prev_dtype == dtype:
+                self.dtypes[column] = dtype
+                continue
+            try:
+                self.dtypes[column] = np.result_type(prev_dtype, dtype)
+            except TypeError:
+                self.dtypes[column] = np.dtype(object)
+
+        if self.fmt == 'csv':
+            chunk.to_csv(self.path, mode='w' if self.n_rows == 0 else 'a',
+                header=(self.n_rows == 0), index=False)
+        else:
+            self.write_arrow_chunk(chunk)
+
+        self.n_rows += len(chunk)
+        return chunk
+
+    def write_arrow_chunk(self, chunk):
+        """ Writes a chunk to a Parquet or Arrow IPC file. The schema of the file is determined
+        by the first chunk.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            Chunk to write.
+
+        """
+
+        pa, pq, ipc = import_pyarrow()
+
+        if self.writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            self.schema = table.schema
+            if self.fmt == 'parquet':
+                self.writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self.writer = ipc.new_file(self.path, self.schema)
+        else:
+            table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+
+        self.writer.write_table(table)
+
+    def close(self):
+        """ Flushes the remaining rows and closes the output file.
+
+        """
+
+        if self.closed:
+            return
+
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        elif self.path is not None and self.n_rows == 0:
+            # Make sure that the output file exists even without results
+            empty_df = pd.DataFrame(columns=self.columns)
+            if self.fmt == 'csv':
+                empty_df.to_csv(self.path, index=False)
+            else:
+                self.write_arrow_chunk(empty_df)
+                self.writer.close()
+                self.writer = None
+        self.closed = True
+
+    def to_dataframe(self):
+        """ Constructs the result dataframe. In memory-bounded mode, the sink is closed. If no
+        results were written before, the remaining in-memory results are returned. Otherwise, the
+        results are read from the output file using the recorded column types. Since CSV files
+        do not distinguish missing values, None is read as NaN.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Dataframe containing all results.
+
+        """
+
+        if self.path is None:
+            self.flush()
+            if not self.chunks:
+                return pd.DataFrame(columns=self.columns)
+            if len(self.chunks) > 1:
+                self.chunks = [pd.concat(self.chunks, ignore_index=True)]
+            return self.chunks[0]
+
+        # Results which were not written yet are still available in memory
+        if not self.closed and self.n_rows == 0 and self.n_buffered > 0:
+            chunk = self.flush()
+            self.close()
+            return chunk
+
+        self.close()
+        if self.fmt == 'csv':
+            return pd.read_csv(self.path, dtype=self.dtypes, keep_default_na=False, na_values=[''])
+        if self.fmt == 'parquet':
+            return pd.read_parquet(self.path)
+        return pd.read_feather(self.path)
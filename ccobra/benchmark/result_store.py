@@ -0,0 +1,259 @@
+""" CCOBRA result store. Persists the evaluation results of models under a fingerprint of their
+source code, configuration, and the benchmark they were evaluated on. Allows to skip the
+evaluation of unchanged models when re-running a benchmark.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from ..version import __version__
+
+
+# Initialize module-level logger
+logger = logging.getLogger(__name__)
+
+#: Version of the structure of stored results
+STORE_FORMAT = 2
+
+def to_json_type(obj):
+    """ Converts numpy objects contained in the results to JSON-serializable types.
+
+    Parameters
+    ----------
+    obj : object
+        Object to convert.
+
+    Returns
+    -------
+    object
+        JSON-serializable object.
+
+    """
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
+def hash_file(path, hasher):
+    """ Feeds the content of a file into a hash object.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+
+    hasher : hashlib object
+        Hash object to update.
+
+    """
+
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            hasher.update(chunk)
+
+def model_source_files(model_path):
+    """ Determines the source files a model is loaded from. Comprises all python files in the
+    directory of the model (including subdirectories) since models can import modules located
+    next to them.
+
+    Parameters
+    ----------
+    model_path : str
+        Path to the model file or directory.
+
+    Returns
+    -------
+    list(str)
+        Sorted list of source file paths.
+
+    """
+
+    model_dir = os.path.abspath(model_path)
+    if os.path.isfile(model_dir):
+        model_dir = os.path.dirname(model_dir)
+
+    source_files = []
+    for root, dirs, files in os.walk(model_dir):
+        dirs[:] = [x for x in dirs if x != '__pycache__' and not x.startswith('.')]
+        source_files.extend(os.path.join(root, x) for x in files if x.endswith('.py'))
+    return sorted(source_files)
+
+class ResultStore():
+    """ Directory-based store for model evaluation results.
+
+    """
+
+    def __init__(self, path, benchmark):
+        """ Initializes the result store and computes the fingerprint of the benchmark.
+
+        Parameters
+        ----------
+        path : str
+            Directory the results are stored in. Is created if it does not exist.
+
+        benchmark : ccobra.Benchmark
+            Benchmark the results are obtained for.
+
+        """
+
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+        self.benchmark_fingerprint = self.fingerprint_benchmark(benchmark)
+        logger.debug('Benchmark fingerprint: %s', self.benchmark_fingerprint)
+
+    @staticmethod
+    def fingerprint_benchmark(benchmark):
+        """ Computes the fingerprint of the benchmark settings and its data files.
+
+        Parameters
+        ----------
+        benchmark : ccobra.Benchmark
+            Benchmark to compute the fingerprint for.
+
+        Returns
+        -------
+        str
+            Hexadecimal fingerprint.
+
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update(__version__.encode('utf-8'))
+
+        # Models are fingerprinted individually
+        settings = {key: value for key, value in benchmark.json_content.items() if key != 'models'}
+        hasher.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+
+        data_paths = [
+            benchmark.data_test_path,
+            benchmark.data_pre_train_path,
+            benchmark.data_pre_train_person_path,
+            benchmark.data_pre_person_background_path
+        ]
+        for data_path in data_paths:
+            hasher.update(b'\0')
+            if not data_path:
+                continue
+            for path in data_path.split(';'):
+                hash_file(path, hasher)
+
+        return hasher.hexdigest()
+
+    def fingerprint(self, modelinfo):
+        """ Computes the fingerprint of a model on the benchmark.
+
+        Parameters
+        ----------
+        modelinfo : ccobra.benchmark.ModelInfo
+            Information about the model.
+
+        Returns
+        -------
+        str
+            Hexadecimal fingerprint.
+
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update('{};{}'.format(self.benchmark_fingerprint, STORE_FORMAT).encode('utf-8'))
+
+        config = {
+            'filename': os.path.basename(os.path.abspath(modelinfo.path)),
+            'override_name': modelinfo.override_name,
+            'classname': modelinfo.load_specific_class,
+            'args': modelinfo.args
+        }
+        hasher.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+
+        model_dir = os.path.abspath(modelinfo.path)
+        if os.path.isfile(model_dir):
+            model_dir = os.path.dirname(model_dir)
+        for source_file in model_source_files(modelinfo.path):
+            hasher.update(os.path.relpath(source_file, model_dir).encode('utf-8'))
+            hash_file(source_file, hasher)
+
+        return hasher.hexdigest()
+
+    def load(self, fingerprint):
+        """ Loads the results stored for a fingerprint.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the model.
+
+        Returns
+        -------
+        (str, pandas.DataFrame, dict(str, dict(str, object)))
+            Tuple containing the name of the model, its results and its model logging
+            information. None if no results are stored for the fingerprint or they cannot be
+            read.
+
+        """
+
+        info_path = os.path.join(self.path, '{}.json'.format(fingerprint))
+        result_path = os.path.join(self.path, '{}.csv'.format(fingerprint))
+        if not os.path.isfile(info_path) or not os.path.isfile(result_path):
+            return None
+
+        try:
+            with open(info_path) as info_file:
+                info = json.load(info_file)
+            res_df = pd.read_csv(result_path)
+            model_log = {key: value for key, value in info['model_log']}
+        except Exception as exc: # pylint: disable=broad-except
+            logger.warning('Ignoring unreadable stored results %s: %s', info_path, exc)
+            return None
+
+        return info['model'], res_df, model_log
+
+    def save(self, fingerprint, model_name, res_df, model_log):
+        """ Stores the results of a model under its fingerprint.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the model.
+
+        model_name : str
+            Name of the model in the results.
+
+        res_df : pandas.DataFrame
+            Results of the model.
+
+        model_log : dict(str, dict(str, object))
+            Model logging information.
+
+        """
+
+        # Logging information is stored as pairs to retain the types of the subject keys
+        info = {
+            'model': model_name,
+            'model_log': [[key, value] for key, value in model_log.items()]
+        }
+
+        # Files are written to temporary files first and the info file is moved last to mark
+        # the entry as complete
+        result_path = os.path.join(self.path, '{}.csv'.format(fingerprint))
+        info_path = os.path.join(self.path, '{}.json'.format(fingerprint))
+        tmp_result_path = '{}.{}.tmp'.format(result_path, os.getpid())
+        tmp_info_path = '{}.{}.tmp'.format(info_path, os.getpid())
+        try:
+            with open(tmp_info_path, 'w') as info_file:
+                json.dump(info, info_file, default=to_json_type)
+            res_df.to_csv(tmp_result_path, index=False)
+            os.replace(tmp_result_path, result_path)
+            os.replace(tmp_info_path, info_path)
+        finally:
+            for tmp_path in [tmp_result_path, tmp_info_path]:
+                if os.path.isfile(tmp_path):
+                    os.remove(tmp_path)
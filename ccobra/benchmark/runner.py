@@ -22,6 +22,9 @@ import pandas as pd
 
 from . import benchmark as bmark
 from . import evaluator
+from . import journal
+from . import result_sink
+from . import result_store
 from .visualization import html_creator, viz_plot
 
 from ..version import __version__
@@ -41,13 +44,37 @@ def parse_arguments():
     parser.add_argument('benchmark', type=str, help='Benchmark file.')
     parser.add_argument(
         '-o', '--output', type=str, default='browser', help='Output style (browser/server/file/none).')
-    parser.add_argument('-s', '--save', type=str, help='Store results as csv table.')
+    parser.add_argument('-s', '--save', type=str, help='Store results as csv table (or as .parquet/.arrow file).')
     parser.add_argument('-ml', '--modellog', type=str, help='Store model log as a json file.')
     parser.add_argument('-m', '--model', type=str, help='Model file to include to the benchmark.')
     parser.add_argument(
         '-cn', '--classname', type=str, default=None,
         help='Load a specific class from a folder containing multiple classes.')
     parser.add_argument('-c', '--cache', type=str, help='Load specified cache file.')
+    parser.add_argument(
+        '-rs', '--resultstore', type=str, default=None,
+        help='Directory for storing model results. Unchanged models are loaded from the store.')
+    parser.add_argument(
+        '-jn', '--journal', type=str, default=None,
+        help='Record the results of evaluated subjects in a journal file.')
+    parser.add_argument(
+        '-r', '--resume', type=str, default=None,
+        help='Resume an interrupted run from its journal file.')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='Number of worker processes used to evaluate subjects in parallel.')
+    parser.add_argument(
+        '-mj', '--modeljobs', type=int, default=1,
+        help='Number of worker processes used to evaluate models in parallel.')
+    parser.add_argument(
+        '-dc', '--datacache', action='store_true',
+        help='Cache parsed datasets in a .ccobra_cache directory next to the benchmark.')
+    parser.add_argument(
+        '-st', '--stream', action='store_true',
+        help='Stream the test data subject by subject instead of loading it completely.')
+    parser.add_argument(
+        '-da', '--dataarena', action='store_true',
+        help='Keep the datasets integer-coded and construct the data of subjects on access.')
     parser.add_argument(
         '-ll', '--logginglevel', type=str, default='NONE',
         help='Set logging level [NONE, DEBUG, INFO, WARNING].'
@@ -113,22 +140,43 @@ def main(args):
     benchmark = bmark.Benchmark(
         args['benchmark'],
         argmodel=(args['model'], args['classname']),
-        cached=(cache_df is not None)
+        cached=(cache_df is not None),
+        use_data_cache=args.get('datacache', False),
+        stream_test_data=args.get('stream', False)
     )
 
     # Run the model evaluation
     is_silent = (args['output'] in ['html', 'server'])
-    eva = evaluator.Evaluator(benchmark, is_silent=is_silent, cache_df=cache_df)
+    store = None
+    if args.get('resultstore'):
+        store = result_store.ResultStore(args['resultstore'], benchmark)
+
+    run_journal = None
+    if args.get('resume'):
+        run_journal = journal.RunJournal(args['resume'], benchmark, resume=True)
+    elif args.get('journal'):
+        run_journal = journal.RunJournal(args['journal'], benchmark)
+
+    # Results are written to the save file in chunks while the models are evaluated
+    sink = None
+    if 'save' in args and args['save'] is not None:
+        sink = result_sink.ResultSink(args['save'])
+
+    eva = evaluator.Evaluator(
+        benchmark, is_silent=is_silent, cache_df=cache_df, n_jobs=args.get('jobs', 1),
+        n_model_jobs=args.get('modeljobs', 1), result_store=store, journal=run_journal,
+        result_sink=sink, use_arena=args.get('dataarena', False))
     with silence_stdout(is_silent):
-        res_df, model_log = eva.evaluate()
+        res_df, model_log = eva.evaluate(build_result_df=(args['output'] != 'none'))
 
-    if 'save' in args and args['save'] is not None:
-        res_df.to_csv(args['save'], index=False)
-    
     if 'modellog' in args and args['modellog'] is not None:
         with codecs.open(args['modellog'], 'w', 'utf-8') as modellogfile:
             json.dump(model_log, modellogfile)
 
+    # Without HTML output, the result dataframe is not required
+    if res_df is None:
+        return
+
     # Create metrics dictionary
     default_list = [
         viz_plot.AccuracyVisualizer(benchmark),
@@ -2,11 +2,17 @@
 
 """
 
-import copy
+import collections.abc
 import logging
+import os
+from multiprocessing import shared_memory
 
-from . import convert_to_basic_types
-from .item import Item
+import numpy as np
+import pandas as pd
+
+from . import convert_to_basic_types, tuple_to_string
+from .helper import FrozenDict, freeze
+from .item import Item, parse_task
 
 # Initialize module-level logger
 logger = logging.getLogger(__name__)
@@ -36,9 +42,10 @@ class CCobraData():
             'id', 'sequence', 'task', 'choices', 'response_type', 'domain'
         ] + target_columns
 
-        # Verify and store the data
+        # Verify and store the data. The container works on a shallow copy so that the
+        # internal columns are not added to the dataframe of the caller.
         self.verify_data(data)
-        self._data = data
+        self._data = data.copy(deep=False)
 
         # Normalize the data container
         self.prepare_data()
@@ -48,6 +55,9 @@ class CCobraData():
         self.domains = self._data['domain'].unique().tolist()
         self.response_types = self._data['response_type'].unique().tolist()
 
+        # Encoded tensors of the data per encoder configuration
+        self.tensor_cache = {}
+
     def verify_data(self, data):
         """ Verifies if all required fields are in the data.
 
@@ -89,6 +99,7 @@ class CCobraData():
         """
 
         self._data['_unique_id'] = self._data['_unique_id'].apply(lambda x: prefix + str(x))
+        self.tensor_cache = {}
 
     def get(self):
         """ Returns the contained data.
@@ -119,65 +130,947 @@ class CCobraData():
 
         """
 
-        # Prepare the dictionary of subjects containing lists of tasks they responded to
+        # Sort the data once by subject and sequence instead of per subject. The stable sort
+        # retains the order of the data for tasks sharing the same sequence number.
         df = self._data
+        df = df.loc[df['_unique_id'].notna()]
+        df = df.sort_values(['_unique_id', 'sequence'], kind='mergesort')
 
+        # Access the data column-wise. Values are converted to python types as in row access.
+        columns = {x: df[x].tolist() for x in df.columns}
+        tasks = build_tasks(columns, self.required_fields, self.target_columns)
+
+        # Prepare the dictionary of subjects containing lists of tasks they responded to
         dataset = {}
-        for subj, subj_df in df.groupby('_unique_id'):
-            assert subj not in dataset
-
-            subj_df = subj_df.sort_values('sequence')
-
-            subj_data = []
-            for _, task_series in subj_df.iterrows():
-                task_dict = {}
-
-                # Extract the task information
-                item = Item(
-                    task_series['id'], task_series['domain'],
-                    task_series['task'], task_series['response_type'],
-                    task_series['choices'], task_series['sequence']
-                )
-                task_dict['item'] = item
-
-                # Parse the main response
-                responses = None
-                if isinstance(task_series['response'], str):
-                    responses = []
-                    for response in task_series['response'].split('|'):
-                        responses.append([x.split(';') for x in response.split('/')])
-                    if task_series['response_type'] != 'multiple-choice':
-                        responses = responses[0]
-                else:
-                    responses = task_series['response']
-                task_dict['response'] = convert_to_basic_types(responses)
-
-                # Parse the auxiliary targets
-                for target_col in self.target_columns:
-                    if target_col == 'response':
-                        continue
-
-                    if isinstance(task_series[target_col], str):
-                        responses = []
-                        for response in task_series[target_col].split('|'):
-                            responses.append([x.split(';') for x in response.split('/')])
-                    else:
-                        responses = task_series[target_col]
-                    task_dict[target_col] = responses
-
-                # Add auxiliary elements from the data
-                aux = {}
-
-                for key, value in task_series.items():
-                    if key not in self.required_fields + ['_unique_id']:
-                        aux[key] = value
-                task_dict['aux'] = aux
-
-                task_dict['full'] = copy.deepcopy(task_dict['aux'])
-                for target_col in self.target_columns:
-                    task_dict['full'][target_col] = task_dict[target_col]
-
-                subj_data.append(task_dict)
-            dataset[subj] = subj_data
+        for subj, task_dict in zip(columns['_unique_id'], tasks):
+            subj_data = dataset.get(subj)
+            if subj_data is None:
+                subj_data = dataset[subj] = []
+            subj_data.append(task_dict)
 
         return dataset
+
+    def to_tensor(self, task_encoders=None, response_encoders=None, tasks=None, responses=None):
+        """ Encodes the dataset as a tensor of response counts (subjects x tasks x responses).
+        Each distinct task and response is encoded only once. The result is cached for the
+        given encoders and vocabularies.
+
+        Parameters
+        ----------
+        task_encoders : dict(str, ccobra.CCobraTaskEncoder), optional
+            Dictionary mapping from domains to task encoders. Tasks of domains without encoder
+            are represented by their task string.
+
+        response_encoders : dict(str, ccobra.CCobraResponseEncoder), optional
+            Dictionary mapping from domains to response encoders. Responses of domains without
+            encoder are represented by their string representation.
+
+        tasks : list(object), optional
+            Fixed task vocabulary (e.g., ccobra.syllogistic.SYLLOGISMS). If not specified, the
+            vocabulary consists of the encoded tasks in order of appearance.
+
+        responses : list(object), optional
+            Fixed response vocabulary (e.g., ccobra.syllogistic.RESPONSES). If not specified, the
+            vocabulary consists of the encoded responses in order of appearance.
+
+        Returns
+        -------
+        DatasetTensor
+            Encoded dataset.
+
+        Raises
+        ------
+        ValueError
+            Thrown if an encoded task or response is not contained in a fixed vocabulary.
+
+        """
+
+        key = (
+            tuple((task_encoders or {}).items()), tuple((response_encoders or {}).items()),
+            None if tasks is None else tuple(tasks),
+            None if responses is None else tuple(responses)
+        )
+        tensor = self.tensor_cache.get(key)
+        if tensor is not None:
+            return tensor
+
+        # Order the rows by subject and sequence as in to_eval_dict
+        df = self._data
+        df = df.loc[df['_unique_id'].notna()]
+        df = df.sort_values(['_unique_id', 'sequence'], kind='mergesort')
+        subj_codes, subjects = pd.factorize(df['_unique_id'])
+
+        # Tasks and responses are parsed and encoded once per distinct combination
+        key_columns = ['domain', 'task', 'response_type', 'response']
+        group_codes = df.groupby(key_columns, sort=False, dropna=False).ngroup().to_numpy()
+        groups = df[key_columns].drop_duplicates()
+        parsed_responses = parse_responses(
+            groups['response'].tolist(), groups['response_type'].tolist())
+
+        encoder = TensorEncoder(task_encoders, response_encoders, tasks, responses)
+        group_tasks = []
+        group_resps = []
+        for domain, task_str, response_type, response in zip(
+                groups['domain'].tolist(), groups['task'].tolist(),
+                groups['response_type'].tolist(), parsed_responses):
+            group_tasks.append(encoder.encode_task(domain, task_str))
+            group_resps.append(encoder.encode_responses(domain, task_str, response_type, response))
+
+        # Expand the groups to the rows. Multiple-choice rows can contain several responses.
+        n_resps = np.array([len(x) for x in group_resps], dtype=np.int64)
+        group_offsets = np.concatenate([[0], np.cumsum(n_resps)])
+        flat_resps = np.array([x for y in group_resps for x in y], dtype=np.int64)
+
+        row_counts = n_resps[group_codes]
+        row_starts = np.repeat(group_offsets[group_codes], row_counts)
+        entry_offsets = np.arange(row_counts.sum()) - np.repeat(
+            np.cumsum(row_counts) - row_counts, row_counts)
+
+        tensor = encoder.to_tensor(
+            subjects.tolist(),
+            np.repeat(subj_codes, row_counts),
+            np.repeat(np.array(group_tasks, dtype=np.int64)[group_codes], row_counts),
+            flat_resps[row_starts + entry_offsets])
+        self.tensor_cache[key] = tensor
+        return tensor
+
+class CCobraDataStream():
+    """ Streaming CCOBRA data container. Reads a CSV data file in chunks and provides the
+    subjects one at a time instead of keeping the complete dataset in memory. The rows of a
+    subject must be contiguous in the file. Subjects are provided in the order of the file.
+
+    """
+
+    def __init__(self, path, target_columns, chunk_size=100000):
+        """ Initializes the streaming data container. Scans the identifying columns of the data
+        file to determine the subjects, domains, and response types.
+
+        Parameters
+        ----------
+        path : str
+            Path to the CSV data file.
+
+        target_columns : list(str)
+            Data columns containing the targets of the evaluation handlers.
+
+        chunk_size : int, optional
+            Number of rows read at once.
+
+        Raises
+        ------
+        ValueError
+            Thrown if data does not contain required columns.
+
+        """
+
+        self.path = path
+        self.target_columns = target_columns
+        self.chunk_size = chunk_size
+        self.required_fields = [
+            'id', 'sequence', 'task', 'choices', 'response_type', 'domain'
+        ] + target_columns
+
+        # Verify the columns of the file
+        columns = pd.read_csv(path, nrows=0).columns
+        missing = set(self.required_fields) - set(columns)
+        if missing:
+            raise ValueError(
+                "Data does not contain columns: {}".format(missing))
+
+        # Extract meta information in order of appearance
+        subject_ids = {}
+        domains = {}
+        response_types = {}
+        scan_columns = ['id', 'domain', 'response_type']
+        with pd.read_csv(path, usecols=scan_columns, chunksize=chunk_size) as reader:
+            for chunk in reader:
+                subject_ids.update(dict.fromkeys(chunk['id'].dropna().tolist()))
+                domains.update(dict.fromkeys(chunk['domain'].unique().tolist()))
+                response_types.update(dict.fromkeys(chunk['response_type'].unique().tolist()))
+
+        self.subject_ids = list(subject_ids)
+        self.n_subjects = len(self.subject_ids)
+        self.domains = list(domains)
+        self.response_types = list(response_types)
+
+    def iter_subjects(self):
+        """ Reads the data file and yields the subjects one at a time.
+
+        Yields
+        ------
+        (object, list)
+            Tuple containing the subject identifier and the list of experimental data of the
+            subject.
+
+        Raises
+        ------
+        ValueError
+            Thrown if the rows of a subject are not contiguous in the file.
+
+        """
+
+        seen = set()
+        carry_df = None
+        with pd.read_csv(self.path, chunksize=self.chunk_size) as reader:
+            for chunk in reader:
+                if carry_df is not None:
+                    chunk = pd.concat([carry_df, chunk], ignore_index=True)
+
+                # The last subject of a chunk can continue in the next chunk
+                is_last = chunk['id'] == chunk['id'].iloc[-1]
+                carry_df = chunk.loc[is_last]
+                yield from self.chunk_subjects(chunk.loc[~is_last], seen)
+
+        if carry_df is not None:
+            yield from self.chunk_subjects(carry_df, seen)
+
+    def chunk_subjects(self, df, seen):
+        """ Converts the complete subjects of a chunk.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Rows of the subjects.
+
+        seen : set(object)
+            Identifiers of the subjects that were already provided. Is extended by the subjects
+            of the chunk.
+
+        Yields
+        ------
+        (object, list)
+            Tuple containing the subject identifier and the list of experimental data of the
+            subject.
+
+        """
+
+        if df.empty:
+            return
+
+        eval_dict = CCobraData(df, self.target_columns).to_eval_dict()
+        for subj in dict.fromkeys(df['id'].tolist()):
+            if subj not in eval_dict:
+                continue
+            if subj in seen:
+                raise ValueError(
+                    'Rows of subject {} are not contiguous in {}.'.format(subj, self.path))
+            seen.add(subj)
+            yield subj, eval_dict[subj]
+
+    def to_eval_dict(self):
+        """ Provides the dataset as a lazy evaluation dictionary.
+
+        Returns
+        -------
+        LazyEvalDict
+            Mapping from subject identifiers to lists of experimental data. Subjects are read
+            from the file on access.
+
+        """
+
+        return LazyEvalDict(self)
+
+class LazyEvalDict(collections.abc.Mapping):
+    """ Read-only evaluation dictionary backed by a data stream. Only the most recently accessed
+    subject is kept in memory. Accessing the subjects in order reads the data file once,
+    accessing a previous subject restarts the stream.
+
+    """
+
+    def __init__(self, stream):
+        """ Initializes the lazy evaluation dictionary.
+
+        Parameters
+        ----------
+        stream : CCobraDataStream
+            Streaming data container providing the subjects.
+
+        """
+
+        self.stream = stream
+        self.subject_ids = stream.subject_ids
+        self.subject_set = set(stream.subject_ids)
+
+        self.subjects = None
+        self.current = None
+
+    def reset(self):
+        """ Discards the current position of the stream. Required after forking the process
+        since the stream of the parent process cannot be continued.
+
+        """
+
+        self.subjects = None
+        self.current = None
+
+    def __getitem__(self, key):
+        if self.current is not None and self.current[0] == key:
+            return self.current[1]
+        if key not in self.subject_set:
+            raise KeyError(key)
+
+        # Continue the stream and restart it once if the subject was already passed
+        for _ in range(2):
+            if self.subjects is None:
+                self.subjects = self.stream.iter_subjects()
+            for subj, subj_data in self.subjects:
+                self.current = (subj, subj_data)
+                if subj == key:
+                    return subj_data
+            self.subjects = None
+
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.subject_set
+
+    def __iter__(self):
+        return iter(self.subject_ids)
+
+    def __len__(self):
+        return len(self.subject_ids)
+
+class DataArena():
+    """ Compact, array-backed representation of a dataset. The values of each column are
+    integer-coded with respect to a table of distinct values and the codes are stored in a single
+    integer matrix. The matrix can be published to shared memory or a memory-mapped file. Pickled
+    published arenas only contain the value tables and attach to the published matrix without
+    copying it. The experimental data of the subjects is reconstructed on access.
+
+    """
+
+    def __init__(self, data):
+        """ Initializes the arena from a dataset.
+
+        Parameters
+        ----------
+        data : CCobraData
+            Dataset to represent.
+
+        """
+
+        self.required_fields = data.required_fields
+        self.target_columns = data.target_columns
+
+        # Order the rows by subject and sequence as in CCobraData.to_eval_dict
+        df = data.get()
+        df = df.loc[df['_unique_id'].notna()]
+        df = df.sort_values(['_unique_id', 'sequence'], kind='mergesort')
+
+        self.columns = [x for x in df.columns if x != '_unique_id']
+        self.tables = {}
+        column_codes = []
+        for column in self.columns:
+            codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+            column_codes.append(codes)
+            self.tables[column] = uniques.tolist()
+
+        # Use the smallest code type covering all value tables
+        max_code = max([len(x) for x in self.tables.values()], default=0)
+        self.codes = np.empty(
+            (len(self.columns), len(df)), dtype=np.min_scalar_type(max_code))
+        for col_idx, codes in enumerate(column_codes):
+            self.codes[col_idx] = codes
+
+        # Rows of the subjects are contiguous after sorting
+        subj_codes, subj_ids = pd.factorize(df['_unique_id'])
+        self.subject_ids = subj_ids.tolist()
+        self.offsets = np.searchsorted(subj_codes, np.arange(len(self.subject_ids) + 1))
+
+        # Publication state
+        self.shm = None
+        self.path = None
+        self.owner_pid = None
+        self.attached = False
+
+    def __len__(self):
+        """ Returns the number of subjects contained in the arena.
+
+        Returns
+        -------
+        int
+            Number of subjects.
+
+        """
+
+        return len(self.subject_ids)
+
+    @property
+    def nbytes(self):
+        """ Size of the code matrix in bytes.
+
+        """
+
+        return self.codes.nbytes
+
+    def publish(self, path=None):
+        """ Moves the code matrix to shared memory or a memory-mapped file. Only the process
+        publishing the arena removes the shared memory when it is closed.
+
+        Parameters
+        ----------
+        path : str, optional
+            File to store the code matrix in. If not specified, a shared memory block is created.
+
+        Returns
+        -------
+        DataArena
+            The published arena.
+
+        Raises
+        ------
+        ValueError
+            Thrown if the arena is already published.
+
+        """
+
+        if self.shm is not None or self.path is not None:
+            raise ValueError('Data arena is already published.')
+
+        codes = self.codes
+        if path is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(codes.nbytes, 1))
+            self.codes = np.ndarray(codes.shape, dtype=codes.dtype, buffer=self.shm.buf)
+            self.codes[:] = codes
+            logger.debug('Published data arena to shared memory %s.', self.shm.name)
+        else:
+            memmap = np.memmap(path, dtype=codes.dtype, mode='w+', shape=codes.shape)
+            memmap[:] = codes
+            memmap.flush()
+            del memmap
+            self.path = path
+            self.codes = np.memmap(path, dtype=codes.dtype, mode='r', shape=codes.shape)
+            logger.debug('Published data arena to %s.', path)
+
+        self.owner_pid = os.getpid()
+        return self
+
+    def close(self):
+        """ Releases the published code matrix. The shared memory is removed if the arena was
+        published by the current process.
+
+        """
+
+        if self.shm is None:
+            return
+
+        self.codes = None
+        self.shm.close()
+        if not self.attached and self.owner_pid == os.getpid():
+            self.shm.unlink()
+        self.shm = None
+
+    def __getstate__(self):
+        """ Returns the state for pickling. The code matrix of published arenas is replaced by its
+        shape and type.
+
+        """
+
+        state = self.__dict__.copy()
+        state['attached'] = True
+        if self.shm is not None:
+            state['shm'] = self.shm.name
+            state['codes'] = (self.codes.shape, self.codes.dtype.str)
+        elif self.path is not None:
+            state['codes'] = (self.codes.shape, self.codes.dtype.str)
+        return state
+
+    def __setstate__(self, state):
+        """ Restores a pickled arena and attaches to the published code matrix.
+
+        """
+
+        self.__dict__.update(state)
+        if self.shm is None and self.path is None:
+            return
+
+        shape, dtype = self.codes
+        if self.path is not None:
+            self.codes = np.memmap(self.path, dtype=dtype, mode='r', shape=shape)
+            return
+
+        # Other processes attaching to the shared memory must not remove it on exit. Before
+        # Python 3.13, attaching registers the shared memory with the resource tracker again.
+        # Processes started via multiprocessing share the tracker of the publishing process,
+        # which already holds the registration and only removes it when the arena is closed.
+        try:
+            self.shm = shared_memory.SharedMemory(name=self.shm, track=False)
+        except TypeError:
+            self.shm = shared_memory.SharedMemory(name=self.shm)
+        self.codes = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+
+    def subject_data(self, subj_idx):
+        """ Reconstructs the experimental data of a subject.
+
+        Parameters
+        ----------
+        subj_idx : int
+            Index of the subject in the arena.
+
+        Returns
+        -------
+        list(dict(str, object))
+            List of experimental data of the subject.
+
+        """
+
+        start, end = self.offsets[subj_idx], self.offsets[subj_idx + 1]
+        columns = {}
+        for col_idx, column in enumerate(self.columns):
+            table = self.tables[column]
+            columns[column] = [table[x] for x in self.codes[col_idx, start:end].tolist()]
+        return build_tasks(columns, self.required_fields, self.target_columns)
+
+    def to_eval_dict(self):
+        """ Provides the dataset as a lazy evaluation dictionary.
+
+        Returns
+        -------
+        ArenaEvalDict
+            Mapping from subject identifiers to lists of experimental data. Subjects are
+            reconstructed on first access.
+
+        """
+
+        return ArenaEvalDict(self)
+
+class ArenaEvalDict(collections.abc.Mapping):
+    """ Read-only evaluation dictionary backed by a data arena. The experimental data of a subject
+    is reconstructed on access. Only the most recently accessed subject is kept in memory.
+
+    """
+
+    def __init__(self, arena):
+        """ Initializes the arena evaluation dictionary.
+
+        Parameters
+        ----------
+        arena : DataArena
+            Arena containing the data of the subjects.
+
+        """
+
+        self.arena = arena
+        self.subject_idxs = {x: idx for idx, x in enumerate(arena.subject_ids)}
+        self.current = None
+
+    def __getitem__(self, key):
+        if self.current is not None and self.current[0] == key:
+            return self.current[1]
+
+        subj_data = self.arena.subject_data(self.subject_idxs[key])
+        self.current = (key, subj_data)
+        return subj_data
+
+    def __contains__(self, key):
+        return key in self.subject_idxs
+
+    def __iter__(self):
+        return iter(self.arena.subject_ids)
+
+    def __len__(self):
+        return len(self.arena.subject_ids)
+
+class DatasetTensor():
+    """ Integer-coded representation of a dataset for vectorized models. Stores the number of
+    times each subject gave each response to each task in coordinate format together with the
+    vocabularies of subjects, encoded tasks, and encoded responses.
+
+    Attributes
+    ----------
+    subjects : list(object)
+        Subject identifiers (first dimension).
+
+    tasks : list(object)
+        Encoded tasks (second dimension).
+
+    responses : list(object)
+        Encoded responses (third dimension).
+
+    coords : np.ndarray
+        Integer array of shape (n_entries, 3) containing the subject, task, and response index
+        of each non-zero entry.
+
+    counts : np.ndarray
+        Integer array of shape (n_entries,) containing the counts of the entries.
+
+    """
+
+    def __init__(self, subjects, tasks, responses, coords, counts):
+        """ Initializes the dataset tensor.
+
+        Parameters
+        ----------
+        subjects : list(object)
+            Subject identifiers.
+
+        tasks : list(object)
+            Encoded tasks.
+
+        responses : list(object)
+            Encoded responses.
+
+        coords : np.ndarray
+            Indices of the non-zero entries of shape (n_entries, 3).
+
+        counts : np.ndarray
+            Counts of the non-zero entries.
+
+        """
+
+        self.subjects = subjects
+        self.tasks = tasks
+        self.responses = responses
+        self.coords = coords
+        self.counts = counts
+
+        self.subject_index = {x: idx for idx, x in enumerate(subjects)}
+        self.task_index = {x: idx for idx, x in enumerate(tasks)}
+        self.response_index = {x: idx for idx, x in enumerate(responses)}
+
+        self.dense = None
+
+    @property
+    def shape(self):
+        """ Shape of the dense tensor (subjects x tasks x responses).
+
+        """
+
+        return (len(self.subjects), len(self.tasks), len(self.responses))
+
+    def to_dense(self):
+        """ Returns the dense tensor of response counts. The tensor is constructed on the first
+        call and shared afterwards.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only integer array of shape (subjects x tasks x responses).
+
+        """
+
+        if self.dense is None:
+            dense = np.zeros(self.shape, dtype=np.int64)
+            dense[tuple(self.coords.T)] = self.counts
+            dense.flags.writeable = False
+            self.dense = dense
+        return self.dense
+
+class TensorEncoder():
+    """ Builds the vocabularies and entries of a dataset tensor. Encodings are cached per
+    distinct task and response.
+
+    """
+
+    def __init__(self, task_encoders=None, response_encoders=None, tasks=None, responses=None):
+        """ Initializes the tensor encoder.
+
+        Parameters
+        ----------
+        task_encoders : dict(str, ccobra.CCobraTaskEncoder), optional
+            Dictionary mapping from domains to task encoders.
+
+        response_encoders : dict(str, ccobra.CCobraResponseEncoder), optional
+            Dictionary mapping from domains to response encoders.
+
+        tasks : list(object), optional
+            Fixed task vocabulary.
+
+        responses : list(object), optional
+            Fixed response vocabulary.
+
+        """
+
+        self.task_encoders = task_encoders or {}
+        self.response_encoders = response_encoders or {}
+        self.fixed_tasks = tasks is not None
+        self.fixed_responses = responses is not None
+        self.task_index = {x: idx for idx, x in enumerate(tasks or [])}
+        self.response_index = {x: idx for idx, x in enumerate(responses or [])}
+
+        # Cache mapping from tasks to vocabulary indices
+        self.task_cache = {}
+
+    @staticmethod
+    def lookup(index, value, fixed, kind):
+        """ Determines the vocabulary index of a value. Values are added to vocabularies that
+        are not fixed.
+
+        """
+
+        idx = index.get(value)
+        if idx is None:
+            if fixed:
+                raise ValueError('Encoded {} not in vocabulary: {}'.format(kind, value))
+            idx = index[value] = len(index)
+        return idx
+
+    def encode_task(self, domain, task_str):
+        """ Returns the vocabulary index of a task.
+
+        Parameters
+        ----------
+        domain : str
+            Domain of the task.
+
+        task_str : str
+            Task in string representation.
+
+        Returns
+        -------
+        int
+            Index of the encoded task.
+
+        """
+
+        key = (domain, task_str)
+        task_idx = self.task_cache.get(key)
+        if task_idx is None:
+            encoded = task_str
+            if domain in self.task_encoders:
+                encoded = self.task_encoders[domain].encode_task(parse_task(task_str)[1])
+            task_idx = self.lookup(self.task_index, encoded, self.fixed_tasks, 'task')
+            self.task_cache[key] = task_idx
+        return task_idx
+
+    def encode_responses(self, domain, task_str, response_type, response):
+        """ Returns the vocabulary indices of a response. Multiple-choice responses are split into
+        their options.
+
+        Parameters
+        ----------
+        domain : str
+            Domain of the task.
+
+        task_str : str
+            Task in string representation.
+
+        response_type : str
+            Response type of the task.
+
+        response : object
+            Parsed response.
+
+        Returns
+        -------
+        list(int)
+            Indices of the encoded responses.
+
+        """
+
+        options = response if response_type == 'multiple-choice' else [response]
+        resp_idxs = []
+        for option in options:
+            if domain in self.response_encoders:
+                encoded = self.response_encoders[domain].encode_response(
+                    option, parse_task(task_str)[1])
+            else:
+                encoded = tuple_to_string(option)
+            resp_idxs.append(
+                self.lookup(self.response_index, encoded, self.fixed_responses, 'response'))
+        return resp_idxs
+
+    def to_tensor(self, subjects, subj_idxs, task_idxs, resp_idxs):
+        """ Constructs the dataset tensor from the encoded responses.
+
+        Parameters
+        ----------
+        subjects : list(object)
+            Subject identifiers.
+
+        subj_idxs : np.ndarray
+            Subject indices of the responses.
+
+        task_idxs : np.ndarray
+            Task indices of the responses.
+
+        resp_idxs : np.ndarray
+            Response indices of the responses.
+
+        Returns
+        -------
+        DatasetTensor
+            Encoded dataset.
+
+        """
+
+        # Count the entries by their index in the flattened tensor
+        shape = (len(subjects), len(self.task_index), len(self.response_index))
+        flat_idxs = np.ravel_multi_index(
+            (np.asarray(subj_idxs, dtype=np.int64), np.asarray(task_idxs, dtype=np.int64),
+             np.asarray(resp_idxs, dtype=np.int64)), shape)
+        flat_idxs, counts = np.unique(flat_idxs, return_counts=True)
+        coords = np.stack(np.unravel_index(flat_idxs, shape), axis=1).reshape(-1, 3)
+
+        return DatasetTensor(
+            subjects, list(self.task_index), list(self.response_index), coords, counts)
+
+def encode_dataset(dataset, task_encoders=None, response_encoders=None, tasks=None,
+                   responses=None):
+    """ Encodes a dataset as a tensor of response counts (subjects x tasks x responses).
+
+    Parameters
+    ----------
+    dataset : CCobraData, dict(object, list), or list(list(dict))
+        Dataset to encode. Besides data containers, evaluation dictionaries and the training
+        datasets passed to the models (e.g., pre_train) are supported. Encodings of data
+        containers are cached on the container.
+
+    task_encoders : dict(str, ccobra.CCobraTaskEncoder), optional
+        Dictionary mapping from domains to task encoders. Tasks of domains without encoder are
+        represented by their task string.
+
+    response_encoders : dict(str, ccobra.CCobraResponseEncoder), optional
+        Dictionary mapping from domains to response encoders. Responses of domains without
+        encoder are represented by their string representation.
+
+    tasks : list(object), optional
+        Fixed task vocabulary. If not specified, the encoded tasks in order of appearance.
+
+    responses : list(object), optional
+        Fixed response vocabulary. If not specified, the encoded responses in order of
+        appearance.
+
+    Returns
+    -------
+    DatasetTensor
+        Encoded dataset.
+
+    Raises
+    ------
+    ValueError
+        Thrown if an encoded task or response is not contained in a fixed vocabulary.
+
+    """
+
+    if isinstance(dataset, CCobraData):
+        return dataset.to_tensor(task_encoders, response_encoders, tasks, responses)
+
+    if isinstance(dataset, collections.abc.Mapping):
+        subjects = list(dataset.keys())
+        dataset = list(dataset.values())
+    else:
+        subjects = [x[0]['item'].identifier if x else None for x in dataset]
+
+    encoder = TensorEncoder(task_encoders, response_encoders, tasks, responses)
+    subj_idxs = []
+    task_idxs = []
+    resp_idxs = []
+    for subj_idx, subj_data in enumerate(dataset):
+        for task_data in subj_data:
+            item = task_data['item']
+            task_idx = encoder.encode_task(item.domain, item.task_str)
+            for resp_idx in encoder.encode_responses(
+                    item.domain, item.task_str, item.response_type, task_data['response']):
+                subj_idxs.append(subj_idx)
+                task_idxs.append(task_idx)
+                resp_idxs.append(resp_idx)
+
+    return encoder.to_tensor(subjects, subj_idxs, task_idxs, resp_idxs)
+
+def build_tasks(columns, required_fields, target_columns):
+    """ Constructs the experimental data of the tasks contained in data columns.
+
+    Parameters
+    ----------
+    columns : dict(str, list(object))
+        Dictionary mapping from column names to the values of the tasks.
+
+    required_fields : list(str)
+        Required columns of the data. All other columns except for '_unique_id' are provided as
+        auxiliary elements.
+
+    target_columns : list(str)
+        Data columns containing the targets of the evaluation handlers.
+
+    Returns
+    -------
+    list(dict(str, object))
+        Experimental data of the tasks in the order of the columns.
+
+    """
+
+    aux_columns = [x for x in columns if x not in required_fields + ['_unique_id']]
+
+    # Responses are parsed once per distinct string and copied for the individual tasks
+    responses = parse_responses(columns['response'], columns['response_type'])
+    targets = {
+        x: parse_responses(columns[x]) for x in target_columns if x != 'response'}
+
+    tasks = []
+    for row_idx in range(len(columns['id'])):
+        task_dict = {}
+
+        # Extract the task information
+        task_dict['item'] = Item(
+            columns['id'][row_idx], columns['domain'][row_idx],
+            columns['task'][row_idx], columns['response_type'][row_idx],
+            columns['choices'][row_idx], columns['sequence'][row_idx]
+        )
+
+        # Parse the main response and the auxiliary targets
+        task_dict['response'] = responses[row_idx]
+        for target_col, target_values in targets.items():
+            task_dict[target_col] = target_values[row_idx]
+
+        # Add auxiliary elements from the data. They are read-only so that they can be
+        # passed to the models without copying them. The targets keep their list structure and
+        # are copied when they are passed to the models (see EvaluationHandler.adapt).
+        aux = {x: freeze(columns[x][row_idx]) for x in aux_columns}
+        task_dict['aux'] = FrozenDict(aux)
+
+        for target_col in target_columns:
+            aux[target_col] = task_dict[target_col]
+        task_dict['full'] = FrozenDict(aux)
+
+        tasks.append(task_dict)
+
+    return tasks
+
+def parse_responses(values, response_types=None):
+    """ Parses a column of responses from their string representation. Each distinct response
+    string is only parsed once.
+
+    Parameters
+    ----------
+    values : list(object)
+        Response values of the data column.
+
+    response_types : list(str), optional
+        Response types of the tasks. If specified, the responses are converted to basic types
+        and responses that are not multiple-choice are unpacked. Otherwise, the raw parsed
+        responses are returned.
+
+    Returns
+    -------
+    list(object)
+        Parsed responses. Lists are not shared between the responses.
+
+    """
+
+    parsed_cache = {}
+    parsed_responses = []
+    for row_idx, value in enumerate(values):
+        if not isinstance(value, str):
+            if response_types is not None:
+                value = convert_to_basic_types(value)
+            parsed_responses.append(value)
+            continue
+
+        is_mc = response_types is None or response_types[row_idx] == 'multiple-choice'
+        parsed = parsed_cache.get((value, is_mc))
+        if parsed is None:
+            parsed = [[x.split(';') for x in response.split('/')] for response in value.split('|')]
+            if not is_mc:
+                parsed = parsed[0]
+            if response_types is not None:
+                parsed = convert_to_basic_types(parsed)
+            parsed_cache[(value, is_mc)] = parsed
+
+        # Copy the nested lists so that the tasks do not share mutable responses
+        if is_mc:
+            parsed_responses.append([[list(y) for y in x] for x in parsed])
+        else:
+            parsed_responses.append([list(x) for x in parsed])
+
+    return parsed_responses
@@ -50,3 +50,21 @@ class CCobraTaskEncoder():
         """
 
         raise NotImplementedError()
+
+    def task_features(self, task):
+        """ Computes additional features of a task which are provided to the models via the
+        features of the items. Features should be immutable since they are shared between items.
+
+        Parameters
+        ----------
+        task : list(list(str))
+            Task in tuple representation.
+
+        Returns
+        -------
+        dict(str, object)
+            Dictionary of task features. Empty by default.
+
+        """
+
+        return {}
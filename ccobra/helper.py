@@ -3,10 +3,11 @@
 """
 
 import copy
+import numbers
 
 def convert_to_basic_types(elem):
     """ Converts an element to primitive types. If the element
-    is a list, the inner elements will be converted instead.
+    is a list or tuple, the inner elements will be converted instead.
     The preference order is bool > int > float > string.
 
     Parameters
@@ -28,6 +29,8 @@ def convert_to_basic_types(elem):
         return elem
     if isinstance(elem, list):
         return [convert_to_basic_types(x) for x in elem]
+    if isinstance(elem, tuple):
+        return tuple(convert_to_basic_types(x) for x in elem)
 
     elem = str(elem)
     if elem == "True":
@@ -68,7 +71,7 @@ def tuple_to_string(tuptup):
         Parameters
         ----------
         tup : object
-            Element to join if list or list of lists.
+            Element to join if list or list of lists (or tuples).
 
         sep : str, optional
             Separation character to join the list elements by.
@@ -80,17 +83,14 @@ def tuple_to_string(tuptup):
 
         """
 
-        if not isinstance(tup, list):
+        if not isinstance(tup, (list, tuple)):
             return str(tup)
-        if not isinstance(tup[0], list):
+        if not isinstance(tup[0], (list, tuple)):
             return sep.join([str(x) for x in tup])
 
-        for idx, val in enumerate(tup):
-            tup[idx] = join_deepest(val, sep)
-        return tup
+        return [join_deepest(val, sep) for val in tup]
 
-    tup = copy.deepcopy(tuptup)
-    tup = join_deepest(tup, ';')
+    tup = join_deepest(tuptup, ';')
     tup = join_deepest(tup, '/')
     tup = join_deepest(tup, '|')
     return tup
@@ -112,9 +112,104 @@ def unnest(tup):
 
     """
     while True:
-        if not isinstance(tup, list):
+        if not isinstance(tup, (list, tuple)):
             return tup
         if len(tup) != 1:
             return tup
         
-        tup = tup[0]
\ No newline at end of file
+        tup = tup[0]
+
+def freeze(elem):
+    """ Converts an element to an immutable representation by recursively replacing lists with
+    tuples.
+
+    Parameters
+    ----------
+    elem : object
+        Element to freeze.
+
+    Returns
+    -------
+    object
+        Immutable representation of the element.
+
+    """
+
+    if isinstance(elem, (list, tuple)):
+        return tuple(freeze(x) for x in elem)
+    return elem
+
+def copy_lists(elem):
+    """ Recursively copies the lists contained in an element. Tuples and all other objects are
+    shared. Is used to hand mutable responses to models without deep copying them.
+
+    Parameters
+    ----------
+    elem : object
+        Element to copy.
+
+    Returns
+    -------
+    object
+        Element with copied lists.
+
+    """
+
+    if isinstance(elem, list):
+        return [copy_lists(x) for x in elem]
+    return elem
+
+def is_frozen(elem):
+    """ Checks if an element is immutable, i.e., only consists of tuples, frozen sets, read-only
+    dictionaries, and immutable scalars.
+
+    Parameters
+    ----------
+    elem : object
+        Element to check.
+
+    Returns
+    -------
+    bool
+        True, if the element is immutable.
+
+    """
+
+    if isinstance(elem, (tuple, frozenset)):
+        return all(is_frozen(x) for x in elem)
+    if isinstance(elem, FrozenDict):
+        return all(is_frozen(x) for x in elem.values())
+    return elem is None or isinstance(elem, (str, bytes, numbers.Number))
+
+class FrozenDict(dict):
+    """ Read-only dictionary. Used for passing auxiliary task information to models without
+    having to copy it for every call.
+
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('FrozenDict does not support item assignment')
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Only dictionaries of immutable values can be shared. Mutable values (e.g., the
+        # response lists of the full task information) are copied.
+        if is_frozen(self):
+            return self
+        return FrozenDict({key: copy.deepcopy(value, memo) for key, value in self.items()})
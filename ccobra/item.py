@@ -2,13 +2,200 @@
 
 """
 
+from contextlib import contextmanager
+
 from . import convert_to_basic_types
+from .helper import FrozenDict
+
+#: Process-wide intern tables mapping task and choice strings to their canonical string object
+#: and parsed representation. Parsed representations are immutable and shared between items.
+TASK_CACHE = {}
+CHOICES_CACHE = {}
+
+#: Domain encoders used to compute item features. Maps from domains to tuples containing the
+#: task encoder and the response encoder (or None).
+FEATURE_ENCODERS = {}
+
+#: Process-wide cache mapping from domain, task string, and choices string to the item features.
+FEATURE_CACHE = {}
+
+def set_feature_encoders(task_encoders, response_encoders=None):
+    """ Registers the domain encoders used to compute the features of items. Previously computed
+    features are discarded if the encoders differ from the registered ones. The registration is
+    process-wide, i.e., shared by all evaluations of the process (see feature_encoders for a
+    temporary registration).
+
+    Parameters
+    ----------
+    task_encoders : dict(str, ccobra.CCobraTaskEncoder)
+        Dictionary mapping from domains to task encoders. Items of other domains have no
+        features.
+
+    response_encoders : dict(str, ccobra.CCobraResponseEncoder), optional
+        Dictionary mapping from domains to response encoders used to encode the choices.
+
+    Returns
+    -------
+    dict(str, tuple)
+        Previously registered encoders mapping from domains to tuples containing the task
+        encoder and the response encoder.
+
+    """
+
+    response_encoders = response_encoders or {}
+    encoders = {
+        domain: (task_encoder, response_encoders.get(domain))
+        for domain, task_encoder in (task_encoders or {}).items()}
+
+    previous = dict(FEATURE_ENCODERS)
+    if encoders != FEATURE_ENCODERS:
+        FEATURE_ENCODERS.clear()
+        FEATURE_ENCODERS.update(encoders)
+        FEATURE_CACHE.clear()
+    return previous
+
+@contextmanager
+def feature_encoders(task_encoders, response_encoders=None):
+    """ Context manager registering the domain encoders used to compute the features of items.
+    The previously registered encoders are restored when the context is left.
+
+    Parameters
+    ----------
+    task_encoders : dict(str, ccobra.CCobraTaskEncoder)
+        Dictionary mapping from domains to task encoders.
+
+    response_encoders : dict(str, ccobra.CCobraResponseEncoder), optional
+        Dictionary mapping from domains to response encoders used to encode the choices.
+
+    """
+
+    previous = set_feature_encoders(task_encoders, response_encoders)
+    try:
+        yield
+    finally:
+        set_feature_encoders(
+            {x: y[0] for x, y in previous.items()}, {x: y[1] for x, y in previous.items()})
+
+def compute_features(domain, task, choices):
+    """ Computes the features of a task using the registered encoders of its domain.
+
+    Parameters
+    ----------
+    domain : str
+        Domain of the task.
+
+    task : tuple(tuple(str))
+        Task in tuple representation.
+
+    choices : tuple(tuple(tuple(object)))
+        Choices in tuple representation.
+
+    Returns
+    -------
+    ccobra.helper.FrozenDict
+        Read-only dictionary containing the encoded task ('task'), the encoded choices
+        ('choices', if a response encoder is registered), and the additional features provided
+        by the task encoder. None if no encoder is registered for the domain.
+
+    """
+
+    encoders = FEATURE_ENCODERS.get(domain)
+    if encoders is None:
+        return None
+
+    task_encoder, response_encoder = encoders
+    features = {'task': task_encoder.encode_task(task)}
+    if response_encoder is not None:
+        features['choices'] = tuple(response_encoder.encode_response(x, task) for x in choices)
+    features.update(task_encoder.task_features(task))
+    return FrozenDict(features)
+
+def parse_task(task):
+    """ Parses a task string into its tuple representation. Results are interned so that items
+    of the same task share a single representation.
+
+    Parameters
+    ----------
+    task : str
+        Task text in tuple string encoding (e.g., 'All;pilots;gardeners/Some;gardeners;cooks').
+
+    Returns
+    -------
+    (str, tuple(tuple(str)))
+        Tuple containing the interned task string and the parsed task.
+
+    """
+
+    entry = TASK_CACHE.get(task)
+    if entry is None:
+        entry = (task, tuple(tuple(x.split(';')) for x in task.split('/') if x))
+        TASK_CACHE[task] = entry
+    return entry
+
+def parse_choices(choices):
+    """ Parses a choices string into its tuple representation. Results are interned so that items
+    with the same choices share a single representation.
+
+    Parameters
+    ----------
+    choices : str
+        Response options in string representation (e.g., 'All;a;c|Some;a;c').
+
+    Returns
+    -------
+    (str, tuple(tuple(tuple(object))))
+        Tuple containing the interned choices string and the parsed choices.
+
+    """
+
+    entry = CHOICES_CACHE.get(choices)
+    if entry is None:
+        entry = (choices, convert_to_basic_types(tuple(
+            tuple(tuple(y.split(';')) for y in x.split('/')) for x in choices.split('|'))))
+        CHOICES_CACHE[choices] = entry
+    return entry
 
 class Item():
-    """ Container class for representing task items.
+    """ Container class for representing task items. Items are immutable: task and choices are
+    stored as nested tuples and attributes cannot be reassigned after construction. Items can
+    therefore be shared with models without copying them.
+
+    Attributes
+    ----------
+    identifier : object
+        Unique identifier of the participant.
+
+    response_type : str
+        Response type of the task.
+
+    task_str : str
+        Task string representation.
+
+    task : tuple(tuple(str))
+        Task in tuple representation.
+
+    choices_str : str
+        Choices string representation.
+
+    choices : tuple(tuple(tuple(object)))
+        Choices in tuple representation.
+
+    domain : str
+        Domain of the task.
+
+    sequence_number : int
+        Position of the task in the experimental sequence.
+
+    features : ccobra.helper.FrozenDict
+        Encoded task information computed by the registered domain encoders (see
+        ccobra.item.set_feature_encoders). None if no encoder is registered for the domain.
 
     """
 
+    __slots__ = (
+        'identifier', 'response_type', 'task_str', 'task', 'choices_str', 'choices', 'domain',
+        'sequence_number', '_hash')
+
     def __init__(self, identifier, domain, task, resp_type, choices, sequence_number):
         """ Constructs the task item container with information about the
         domain, task premises, response type, and response choices.
@@ -36,32 +223,68 @@ class Item():
 
         """
 
-        #: Unique identifier of the participant
-        self.identifier = identifier
+        task, parsed_task = parse_task(task)
+        choices, parsed_choices = parse_choices(choices)
+
+        # Attributes are set on the object directly since the item is immutable
+        object.__setattr__(self, 'identifier', identifier)
+        object.__setattr__(self, 'response_type', resp_type)
+        object.__setattr__(self, 'task_str', task)
+        object.__setattr__(self, 'task', parsed_task)
+        object.__setattr__(self, 'choices_str', choices)
+        object.__setattr__(self, 'choices', parsed_choices)
+        object.__setattr__(self, 'domain', domain)
+        object.__setattr__(self, 'sequence_number', sequence_number)
+        object.__setattr__(self, '_hash', hash((
+            identifier, resp_type, task, choices, domain, sequence_number)))
+
+    @property
+    def features(self):
+        """ Features of the task computed by the registered domain encoders. Features are
+        computed once per distinct task and shared between items.
 
-        #: Response type of the task
-        self.response_type = resp_type
+        Returns
+        -------
+        ccobra.helper.FrozenDict
+            Read-only dictionary of features. None if no encoder is registered for the domain.
+
+        """
 
-        #: Task string representation
-        self.task_str = task
+        key = (self.domain, self.task_str, self.choices_str)
+        features = FEATURE_CACHE.get(key)
+        if features is None and self.domain in FEATURE_ENCODERS:
+            features = compute_features(self.domain, self.task, self.choices)
+            FEATURE_CACHE[key] = features
+        return features
 
-        #: Task in list representation
-        self.task = [x.split(";") for x in task.split("/") if x]
+    def __setattr__(self, name, value):
+        raise AttributeError('Item is immutable (cannot set "{}")'.format(name))
 
-        #: Choices string representation
-        self.choices_str = choices
+    def __delattr__(self, name):
+        raise AttributeError('Item is immutable (cannot delete "{}")'.format(name))
 
-        #: Choices in list representation
-        self.choices = [x.split('/') for x in choices.split('|')]
-        for idx in range(len(self.choices)):
-            self.choices[idx] = [x.split(';') for x in self.choices[idx]]
-        self.choices = convert_to_basic_types(self.choices)
+    def __reduce__(self):
+        return (Item, (
+            self.identifier, self.domain, self.task_str, self.response_type, self.choices_str,
+            self.sequence_number))
 
-        #: Domain of the task
-        self.domain = domain
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __hash__(self):
+        """ Hash function consistent with the equality comparator.
+
+        Returns
+        -------
+        int
+            Hash value of the item.
+
+        """
 
-        #: Position of the task in the experimental sequence
-        self.sequence_number = sequence_number
+        return self._hash
 
     def __eq__(self, other):
         """ Equality comparator.
@@ -3,17 +3,58 @@ implement for being used in the CCOBRA framework.
 
 """
 
+import copy
 import logging
 
 
 # Initialize module-level logger
 logger = logging.getLogger(__name__)
 
+def cacheable_predict(predict_fn):
+    """ Decorator marking a predict function as cacheable. The predictions of a cacheable
+    function may only depend on the task, the choices, and the response type of the item, but not
+    on the auxiliary information or the participant. CCOBRA then reuses predictions across
+    participants instead of querying the model for every task. Caching is only performed for
+    stateless models which are not trained individually for the participants.
+
+    Parameters
+    ----------
+    predict_fn : callable
+        Predict function of a model.
+
+    Returns
+    -------
+    callable
+        The marked predict function.
+
+    """
+
+    predict_fn.cacheable = True
+    return predict_fn
+
 class CCobraModel():
     """ Base class for CCOBRA models.
 
     """
 
+    #: Flag declaring that the model does not change its state during the predictions of a
+    #: participant. CCOBRA skips the adaption functions of stateless models and evaluates them
+    #: using a single shared instance, i.e., does not copy them for each participant unless they
+    #: implement a person training function or are pre-trained per participant. CCOBRA verifies
+    #: the declaration on a sample of participants.
+    stateless = False
+
+    #: Flag declaring that all predict functions of the model are cacheable (see
+    #: ccobra.cacheable_predict).
+    cache_predictions = False
+
+    #: Flag declaring that the model can evaluate multiple participants at once. In adaption
+    #: evaluations, CCOBRA then advances all participants in lockstep: A single model instance
+    #: receives the tasks at the same position of all participants via predict_batch followed by
+    #: adapt_batch. The model is responsible for separating the participants based on the item
+    #: identifiers.
+    lockstep = False
+
     def __init__(self, name, supported_domains, supported_response_types):
         """ Base constructor of CCOBRA models.
 
@@ -52,6 +93,55 @@ class CCobraModel():
 
         self.evaluation_type = evaluation_type
 
+    def clone(self):
+        """ Creates an independent copy of the model. Is used by CCOBRA to obtain a fresh model
+        instance for each participant based on the pre-trained model.
+
+        If not overriden by the model implementation, a deep copy of the model is created. Models
+        can override this function to share large objects that are not altered during the
+        evaluation of a participant (e.g., training data).
+
+        Returns
+        -------
+        CCobraModel
+            Copy of the model.
+
+        """
+
+        return copy.deepcopy(self)
+
+    def snapshot(self):
+        """ Captures the state of the model which can be altered during the evaluation of a
+        participant. Together with restore, allows CCOBRA to reset a model without creating a
+        new copy (e.g., in the leave-one-out coverage setting).
+
+        If not overriden by the model implementation, a deep copy of all model attributes is
+        created. Models can override this function to only capture their mutable per-participant
+        state (e.g., network parameters or a history of responses).
+
+        Returns
+        -------
+        object
+            Snapshot of the model state.
+
+        """
+
+        return copy.deepcopy(self.__dict__)
+
+    def restore(self, snapshot):
+        """ Restores the model state from a snapshot created by snapshot. Since a snapshot can be
+        restored multiple times, implementations must not alter the snapshot.
+
+        Parameters
+        ----------
+        snapshot : object
+            Snapshot of the model state.
+
+        """
+
+        self.__dict__.clear()
+        self.__dict__.update(copy.deepcopy(snapshot))
+
     def start_participant(self, **kwargs):
         """ Callback to indicate participant start.
 
@@ -92,6 +182,27 @@ class CCobraModel():
 
         pass
 
+    def pre_train_exclude(self, dataset):
+        """ Removes the data of the given participants from the pre-training of the model. Allows
+        for efficient leave-one-out evaluations when training and test data correspond: Instead of
+        pre-training the model from scratch for every participant, CCOBRA pre-trains the model
+        once on the full training data and removes the participant to be predicted from a copy
+        afterwards.
+
+        Models not implementing this function are pre-trained on the remaining participants for
+        every participant instead.
+
+        Parameters
+        ----------
+        dataset : list(list(dict(str, object)))
+            Training data to remove from the model. List of participants which each contain
+            lists of tasks represented as dictionaries with the corresponding task information
+            (e.g., the item container and given response).
+
+        """
+
+        raise NotImplementedError()
+
     def pre_train_person(self, dataset):
         """ Excerpt of the prediction data containing responses of the individual. Is supposed to
         combat the cold-start problem by supplying models with information about the exact
@@ -153,6 +264,55 @@ class CCobraModel():
 
         raise NotImplementedError()
 
+    def predict_batch(self, items, aux_list):
+        """ Generates response predictions for a list of tasks. Allows models to vectorize their
+        predictions (e.g., a single forward pass of a neural network). The predictions must equal
+        the ones obtained by calling predict for the tasks in order.
+
+        CCOBRA only uses this function if it is overriden by the model implementation and if no
+        adaption takes place between the predictions (e.g., in prediction and coverage
+        evaluations). For predict functions other than predict, CCOBRA looks for a function with
+        the suffix "_batch" (e.g., predict_rating_batch).
+
+        Parameters
+        ----------
+        items : list(ccobra.Item)
+            Task information containers in the order of presentation.
+
+        aux_list : list(dict(str, object))
+            Auxiliary information for each of the tasks.
+
+        Returns
+        -------
+        list(object)
+            Response predictions for the tasks.
+
+        """
+
+        return [self.predict(item, **aux) for item, aux in zip(items, aux_list)]
+
+    def adapt_batch(self, items, targets, aux_list):
+        """ Trains the model based on a list of task-target combinations. Is used in lockstep
+        evaluations (see lockstep) to adapt to the tasks of multiple participants at once.
+
+        If not overriden by the model implementation, uses adapt to perform the training.
+
+        Parameters
+        ----------
+        items : list(ccobra.Item)
+            Task information containers.
+
+        targets : list(object)
+            True responses given by the human reasoners.
+
+        aux_list : list(dict(str, object))
+            Auxiliary information for each of the tasks.
+
+        """
+
+        for item, target, aux in zip(items, targets, aux_list):
+            self.adapt(item, target, **aux)
+
     def adapt(self, item, target, **kwargs):
         """ Trains the model based on a given task-target combination.
 
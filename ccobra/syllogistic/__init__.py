@@ -16,6 +16,21 @@ modeling and analyses in the domain of syllogistic reasoning.
     
     List containing the 9 response options.
 
+.. py:data:: SYLLOGISM_INDEX
+    :type: = dict(str, int)
+
+    Dictionary mapping from syllogisms to their index in SYLLOGISMS.
+
+.. py:data:: RESPONSE_INDEX
+    :type: = dict(str, int)
+
+    Dictionary mapping from responses to their index in RESPONSES.
+
+.. py:data:: QUANTIFIERS_SYLLOGISTIC_ENCODING
+    :type: = dict(str, str)
+
+    Dictionary mapping from quantifiers to their encoding (e.g., 'Some not' to 'O').
+
 .. py:data:: VALID_SYLLOGISMS
     :type: = list(str)
     
@@ -39,6 +54,7 @@ modeling and analyses in the domain of syllogistic reasoning.
 .. autofunction:: create_data_string_response
 .. autofunction:: decode_response
 .. autofunction:: encode_response
+.. autofunction:: encode_responses
 .. autofunction:: encode_task
 
 .. rubric:: Classes
@@ -56,6 +72,7 @@ modeling and analyses in the domain of syllogistic reasoning.
 from .task_encoder_syl import SyllogisticTaskEncoder
 from .resp_encoder_syl import SyllogisticResponseEncoder
 
-from .syllogism import decode_response, encode_response, encode_task, SYLLOGISMS, RESPONSES, \
+from .syllogism import decode_response, encode_response, encode_responses, encode_task, \
+    SYLLOGISMS, RESPONSES, SYLLOGISM_INDEX, RESPONSE_INDEX, QUANTIFIERS_SYLLOGISTIC_ENCODING, \
     Syllogism, VALID_SYLLOGISMS, INVALID_SYLLOGISMS, SYLLOGISTIC_FOL_RESPONSES, dataset_to_matrix, \
     create_data_string_task, create_data_string_choices, create_data_string_response
@@ -3,6 +3,7 @@
 """
 
 from ccobra import CCobraResponseEncoder
+from ccobra.syllogistic.task_encoder_syl import QUANTIFIERS_SYLLOGISTIC_ENCODING
 
 
 class SyllogisticResponseEncoder(CCobraResponseEncoder):
@@ -29,7 +30,7 @@ class SyllogisticResponseEncoder(CCobraResponseEncoder):
 
         """
 
-        if not isinstance(response[0], list):
+        if not isinstance(response[0], (list, tuple)):
             response = [response]
 
         if response[0] == 'NVC':
@@ -38,11 +39,9 @@ class SyllogisticResponseEncoder(CCobraResponseEncoder):
         if response[0][0] == 'NVC':
             return 'NVC'
 
-        object_sets = [set(x[1:]) for x in task]
-        midterm = object_sets[0].intersection(object_sets[1])
-        obj_a = object_sets[0] - midterm
+        # The a-term is the term of the first premise which does not occur in the second one
+        prem_1, prem_2 = task
+        obj_a = prem_1[1] if prem_1[1] != prem_2[1] and prem_1[1] != prem_2[2] else prem_1[2]
 
-        quant = response[0][0].replace('All', 'A').replace(
-            'Some not', 'O').replace('Some', 'I').replace('No', 'E')
-
-        return quant + ('ac' if response[0][1] == list(obj_a)[0] else 'ca')
+        quant = QUANTIFIERS_SYLLOGISTIC_ENCODING.get(response[0][0], response[0][0])
+        return quant + ('ac' if response[0][1] == obj_a else 'ca')
@@ -4,8 +4,9 @@
 
 import numpy as np
 
-from ..item import Item
-from .task_encoder_syl import SyllogisticTaskEncoder
+from ..helper import FrozenDict, freeze
+from ..item import parse_task
+from .task_encoder_syl import SyllogisticTaskEncoder, QUANTIFIERS_SYLLOGISTIC_ENCODING
 from .resp_encoder_syl import SyllogisticResponseEncoder
 
 #: List of syllogistic task identifiers.
@@ -22,6 +23,22 @@ for _quant in ['A', 'I', 'E', 'O']:
         RESPONSES.append(_quant + _direction)
 RESPONSES.append('NVC')
 
+#: Mapping from syllogistic task identifiers to their index in SYLLOGISMS.
+SYLLOGISM_INDEX = {x: idx for idx, x in enumerate(SYLLOGISMS)}
+
+#: Mapping from syllogistic responses to their index in RESPONSES.
+RESPONSE_INDEX = {x: idx for idx, x in enumerate(RESPONSES)}
+
+#: Mapping from quantifier encodings to quantifiers.
+QUANTIFIERS_SYLLOGISTIC_DECODING = {y: x for x, y in QUANTIFIERS_SYLLOGISTIC_ENCODING.items()}
+
+#: Shared Syllogism helpers per helper class and task string (see Syllogism.from_item). The
+#: oldest helpers are evicted once the cache holds SYLLOGISM_CACHE_SIZE helpers.
+SYLLOGISM_CACHE = {}
+
+#: Maximum number of shared helpers kept in SYLLOGISM_CACHE
+SYLLOGISM_CACHE_SIZE = 4096
+
 #: List of valid syllogisms
 VALID_SYLLOGISMS = [
     'AA1', 'AA2', 'AA4', 'AE1', 'AE2', 'AE3', 'AE4', 'AI2', 'AI4', 'AO3', 'AO4', 'EA1', 'EA2',
@@ -276,15 +293,65 @@ def decode_response(enc_response, task):
     if enc_response == [['NVC']]:
         return enc_response
 
-    obj_a = set(task[0][1:]) - set(task[1][1:])
-    obj_c = set(task[1][1:]) - set(task[0][1:])
+    # The end terms are the terms of each premise which do not occur in the other one
+    prem_1, prem_2 = task
+    obj_a = prem_1[1] if prem_1[1] != prem_2[1] and prem_1[1] != prem_2[2] else prem_1[2]
+    obj_c = prem_2[1] if prem_2[1] != prem_1[1] and prem_2[1] != prem_1[2] else prem_2[2]
 
-    quant = enc_response[0].replace('A', 'All').replace(
-        'I', 'Some').replace('O', 'Some not').replace('E', 'No')
+    quant = QUANTIFIERS_SYLLOGISTIC_DECODING.get(enc_response[0], enc_response[0])
     if enc_response[1:] == 'ac':
-        return [[quant, list(obj_a)[0], list(obj_c)[0]]]
+        return [[quant, obj_a, obj_c]]
+
+    return [[quant, obj_c, obj_a]]
+
+def encode_responses(responses, tasks):
+    """ Encodes a batch of syllogistic responses to their indices in RESPONSES. Responses and
+    tasks can be given in list representation or in the string representation of the CCOBRA data
+    format. Distinct combinations of string representations are only encoded once.
+
+    Parameters
+    ----------
+    responses : iterable
+        Syllogistic responses (e.g., ['All', 'models', 'clerks'] or 'All;models;clerks').
+
+    tasks : iterable
+        Syllogistic tasks of the responses (e.g., [['All', 'models', 'managers'],
+        ['All', 'managers', 'clerks']] or 'All;models;managers/All;managers;clerks').
+
+    Returns
+    -------
+    np.ndarray
+        Integer array containing the indices of the encoded responses in RESPONSES.
 
-    return [[quant, list(obj_c)[0], list(obj_a)[0]]]
+    Raises
+    ------
+    ValueError
+        Thrown if a response cannot be encoded as a syllogistic response.
+
+    """
+
+    codes = []
+    code_cache = {}
+    for response, task in zip(responses, tasks):
+        is_str = isinstance(response, str) and isinstance(task, str)
+        if is_str:
+            code = code_cache.get((response, task))
+            if code is not None:
+                codes.append(code)
+                continue
+
+        parsed_response = response.split(';') if isinstance(response, str) else response
+        parsed_task = parse_task(task)[1] if isinstance(task, str) else task
+        encoded = encode_response(parsed_response, parsed_task)
+        code = RESPONSE_INDEX.get(encoded)
+        if code is None:
+            raise ValueError('Invalid syllogistic response: {}'.format(response))
+
+        if is_str:
+            code_cache[(response, task)] = code
+        codes.append(code)
+
+    return np.array(codes, dtype=np.int64)
 
 def dataset_to_matrix(dataset):
     """ Convert a training dataset (e.g., pre_train) into a corresponding matrix representation of
@@ -315,11 +382,9 @@ def dataset_to_matrix(dataset):
         subj_mat = np.zeros((64, 9))
 
         for task_data in subj_data:
-            syllog = Syllogism(task_data['item'])
-            enc_resp = syllog.encode_response(task_data['response'])
-
-            syl_idx = SYLLOGISMS.index(syllog.encoded_task)
-            rsp_idx = RESPONSES.index(enc_resp)
+            task = task_data['item'].task
+            syl_idx = SYLLOGISM_INDEX[encode_task(task)]
+            rsp_idx = RESPONSE_INDEX[encode_response(task_data['response'], task)]
             subj_mat[syl_idx, rsp_idx] += 1
 
         # Normalize subject response data and add to overall result matrix
@@ -335,6 +400,9 @@ class Syllogism():
 
     """
 
+    #: Flag indicating a read-only helper shared between items (see from_item).
+    shared = False
+
     def __init__(self, item):
         """ Constructs the Syllogism based on a given task item.
 
@@ -345,15 +413,9 @@ class Syllogism():
 
         """
 
-        #: Instance of the item the Syllogism is constructed on. The instance
-        #: is copied in order to prevent reference mismatches from happening.
-        self.item = Item(
-            item.identifier,
-            item.domain,
-            item.task_str,
-            item.response_type,
-            item.choices_str,
-            item.sequence_number)
+        #: Instance of the item the Syllogism is constructed on. Items are
+        #: immutable and can be referenced without copying them.
+        self.item = item
 
         #: Reference to the task the Syllogism is constructed on.
         self.task = self.item.task
@@ -386,6 +448,54 @@ class Syllogism():
         elif self.figure == 4:
             self.A, self.B, self.C = self.task[0][2], self.task[0][1], self.task[1][2]
 
+        #: Tables mapping between the responses in list representation and their encodings.
+        #: Only available for helpers obtained from from_item.
+        self.encoding_table = None
+        self.decoding_table = None
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get('shared', False):
+            raise AttributeError('Shared Syllogism helpers are read-only (cannot set "{}")'.format(name))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if self.__dict__.get('shared', False):
+            raise AttributeError('Shared Syllogism helpers are read-only (cannot delete "{}")'.format(name))
+        object.__delattr__(self, name)
+
+    @classmethod
+    def from_item(cls, item):
+        """ Returns the shared helper for the task of an item. Helpers are created once per task
+        string and contain tables for encoding and decoding responses. Since they are shared
+        between items, the helpers are read-only and do not provide the item attribute.
+
+        Parameters
+        ----------
+        item : ccobra.Item
+            CCOBRA task item container.
+
+        Returns
+        -------
+        Syllogism
+            Shared helper for the task of the item.
+
+        """
+
+        key = (cls, item.task_str)
+        syllogism = SYLLOGISM_CACHE.get(key)
+        if syllogism is None:
+            syllogism = cls(item)
+            del syllogism.item
+            decoding_table = {x: freeze(decode_response(x, syllogism.task)) for x in RESPONSES}
+            syllogism.decoding_table = FrozenDict(decoding_table)
+            syllogism.encoding_table = FrozenDict({y[0]: x for x, y in decoding_table.items()})
+            syllogism.shared = True
+
+            if len(SYLLOGISM_CACHE) >= SYLLOGISM_CACHE_SIZE:
+                del SYLLOGISM_CACHE[next(iter(SYLLOGISM_CACHE))]
+            SYLLOGISM_CACHE[key] = syllogism
+        return syllogism
+
     def encode_response(self, response):
         """ Encodes a given syllogistic response based on the information
         contained in the premises.
@@ -403,7 +513,14 @@ class Syllogism():
 
         """
 
-        return encode_response(response, self.item.task)
+        if self.encoding_table is not None:
+            option = response if isinstance(response[0], (list, tuple)) else [response]
+            if isinstance(option[0], (list, tuple)):
+                encoded = self.encoding_table.get(tuple(option[0]))
+                if encoded is not None:
+                    return encoded
+
+        return encode_response(response, self.task)
 
     def decode_response(self, encoded_response):
         """ Decodes a syllogistic response in string representation based on
@@ -422,7 +539,12 @@ class Syllogism():
 
         """
 
-        return decode_response(encoded_response, self.item.task)
+        if self.decoding_table is not None and isinstance(encoded_response, str):
+            decoded = self.decoding_table.get(encoded_response)
+            if decoded is not None:
+                return [list(x) for x in decoded]
+
+        return decode_response(encoded_response, self.task)
 
     def is_valid_syllogism(self):
         """ Returns true if syllogism is valid, i.e., has a logically valid conclusion.
@@ -4,6 +4,14 @@
 
 from ccobra import CCobraTaskEncoder
 
+# Quantifier encodings
+QUANTIFIERS_SYLLOGISTIC_ENCODING = {
+    'All': 'A',
+    'Some': 'I',
+    'No': 'E',
+    'Some not': 'O'
+}
+
 class SyllogisticTaskEncoder(CCobraTaskEncoder):
     """ Syllogistic encoder. Provides functions for abbreviating syllogistic tasks.
 
@@ -32,10 +40,8 @@ class SyllogisticTaskEncoder(CCobraTaskEncoder):
 
         prem_1, prem_2 = task
 
-        quant1 = prem_1[0].replace('All', 'A').replace(
-            'Some not', 'O').replace('Some', 'I').replace('No', 'E')
-        quant2 = prem_2[0].replace('All', 'A').replace(
-            'Some not', 'O').replace('Some', 'I').replace('No', 'E')
+        quant1 = QUANTIFIERS_SYLLOGISTIC_ENCODING.get(prem_1[0], prem_1[0])
+        quant2 = QUANTIFIERS_SYLLOGISTIC_ENCODING.get(prem_2[0], prem_2[0])
         figure = 1
 
         if prem_1[1] == prem_2[1]:
@@ -51,6 +57,41 @@ class SyllogisticTaskEncoder(CCobraTaskEncoder):
 
         return quant1 + quant2 + str(figure)
 
+    @staticmethod
+    def task_features(task):
+        """ Computes the features of a syllogistic task.
+
+        Parameters
+        ----------
+        task : list(list(str))
+            List representation of the syllogism (e.g., [['All', 'A', 'B'], ['Some', 'B', 'C']]).
+
+        Returns
+        -------
+        dict(str, object)
+            Dictionary containing the index of the syllogism in ccobra.syllogistic.SYLLOGISMS
+            ('task_id'), the figure ('figure'), and the terms in the order of the encoding
+            ('terms', e.g., ('A', 'B', 'C')).
+
+        """
+
+        encoded_task = SyllogisticTaskEncoder.encode_task(task)
+        figure = int(encoded_task[-1])
+        task_id = ('AIEO'.index(encoded_task[0]) * 4 + 'AIEO'.index(encoded_task[1])) * 4 + \
+            figure - 1
+
+        prem_1, prem_2 = task
+        if figure == 1:
+            terms = (prem_1[1], prem_1[2], prem_2[2])
+        elif figure == 2:
+            terms = (prem_1[2], prem_1[1], prem_2[1])
+        elif figure == 3:
+            terms = (prem_1[1], prem_1[2], prem_2[1])
+        else:
+            terms = (prem_1[2], prem_1[1], prem_2[2])
+
+        return {'task_id': task_id, 'figure': figure, 'terms': terms}
+
     @staticmethod
     def encode_response(response, task):
         """ Encodes a response to its syllogistic encoding.
@@ -70,7 +111,7 @@ class SyllogisticTaskEncoder(CCobraTaskEncoder):
 
         """
 
-        if not isinstance(response[0], list):
+        if not isinstance(response[0], (list, tuple)):
             response = [response]
 
         if response[0] == 'NVC':
@@ -79,11 +120,9 @@ class SyllogisticTaskEncoder(CCobraTaskEncoder):
         if response[0][0] == 'NVC':
             return 'NVC'
 
-        object_sets = [set(x[1:]) for x in task]
-        midterm = object_sets[0].intersection(object_sets[1])
-        obj_a = object_sets[0] - midterm
-
-        quant = response[0][0].replace('All', 'A').replace(
-            'Some not', 'O').replace('Some', 'I').replace('No', 'E')
+        # The a-term is the term of the first premise which does not occur in the second one
+        prem_1, prem_2 = task
+        obj_a = prem_1[1] if prem_1[1] != prem_2[1] and prem_1[1] != prem_2[2] else prem_1[2]
 
-        return quant + ('ac' if response[0][1] == list(obj_a)[0] else 'ca')
+        quant = QUANTIFIERS_SYLLOGISTIC_ENCODING.get(response[0][0], response[0][0])
+        return quant + ('ac' if response[0][1] == obj_a else 'ca')
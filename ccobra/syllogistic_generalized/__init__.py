@@ -1,6 +1,13 @@
 """ Generalized Syllogistic submodule that contains utility functionality to facilitate
 modeling and analyses in the domain of syllogistic reasoning with generalized quantifiers.
 
+.. rubric:: Constants
+
+.. py:data:: RESPONSES
+    :type: = list(str)
+
+    List containing the generalized syllogistic response encodings.
+
 .. rubric:: Functions
 
 .. autofunction:: decode_response
@@ -20,4 +27,4 @@ modeling and analyses in the domain of syllogistic reasoning with generalized qu
 
 from .task_encoder_sylgen import GeneralizedSyllogisticTaskEncoder, QUANTIFIERS_SYLLOGISTIC_GENERALIZED_ENCODING
 from .resp_encoder_sylgen import GeneralizedSyllogisticResponseEncoder
-from .syllogism_gen import decode_response, encode_response, encode_task, GeneralizedSyllogism
+from .syllogism_gen import decode_response, encode_response, encode_task, GeneralizedSyllogism, RESPONSES
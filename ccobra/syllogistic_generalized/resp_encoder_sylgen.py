@@ -44,7 +44,7 @@ class GeneralizedSyllogisticResponseEncoder(CCobraResponseEncoder):
 
         """
 
-        if not isinstance(response[0], list):
+        if not isinstance(response[0], (list, tuple)):
             response = [response]
 
         if response[0] == 'NVC':
@@ -2,10 +2,21 @@
 
 """
 
+from ..helper import FrozenDict, freeze
 from .task_encoder_sylgen import GeneralizedSyllogisticTaskEncoder, QUANTIFIERS_SYLLOGISTIC_GENERALIZED_ENCODING
 from .resp_encoder_sylgen import GeneralizedSyllogisticResponseEncoder
-from ..item import Item
 
+#: List of generalized syllogistic responses.
+RESPONSES = [
+    x + y for x in QUANTIFIERS_SYLLOGISTIC_GENERALIZED_ENCODING.values() for y in ['ac', 'ca']
+] + ['NVC']
+
+#: Shared GeneralizedSyllogism helpers per helper class and task string (see GeneralizedSyllogism.from_item). The
+#: oldest helpers are evicted once the cache holds SYLLOGISM_CACHE_SIZE helpers.
+SYLLOGISM_CACHE = {}
+
+#: Maximum number of shared helpers kept in SYLLOGISM_CACHE
+SYLLOGISM_CACHE_SIZE = 4096
 
 def encode_task(task):
     """ Encodes a generalized syllogistic task.
@@ -94,6 +105,9 @@ class GeneralizedSyllogism():
 
     """
 
+    #: Flag indicating a read-only helper shared between items (see from_item).
+    shared = False
+
     def __init__(self, item):
         """ Constructs the generalized Syllogism based on a given task item.
 
@@ -104,15 +118,9 @@ class GeneralizedSyllogism():
 
         """
 
-        #: Instance of the item the Syllogism is constructed on. The instance
-        #: is copied in order to prevent reference mismatches from happening.
-        self.item = Item(
-            item.identifier,
-            item.domain,
-            item.task_str,
-            item.response_type,
-            item.choices_str,
-            item.sequence_number)
+        #: Instance of the item the Syllogism is constructed on. Items are
+        #: immutable and can be referenced without copying them.
+        self.item = item
 
         #: Reference to the task the Syllogism is constructed on.
         self.task = self.item.task
@@ -145,6 +153,54 @@ class GeneralizedSyllogism():
         elif self.figure == 4:
             self.A, self.B, self.C = self.task[0][2], self.task[0][1], self.task[1][2]
 
+        #: Tables mapping between the responses in list representation and their encodings.
+        #: Only available for helpers obtained from from_item.
+        self.encoding_table = None
+        self.decoding_table = None
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get('shared', False):
+            raise AttributeError('Shared GeneralizedSyllogism helpers are read-only (cannot set "{}")'.format(name))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if self.__dict__.get('shared', False):
+            raise AttributeError('Shared GeneralizedSyllogism helpers are read-only (cannot delete "{}")'.format(name))
+        object.__delattr__(self, name)
+
+    @classmethod
+    def from_item(cls, item):
+        """ Returns the shared helper for the task of an item. Helpers are created once per task
+        string and contain tables for encoding and decoding responses. Since they are shared
+        between items, the helpers are read-only and do not provide the item attribute.
+
+        Parameters
+        ----------
+        item : ccobra.Item
+            CCOBRA task item container.
+
+        Returns
+        -------
+        GeneralizedSyllogism
+            Shared helper for the task of the item.
+
+        """
+
+        key = (cls, item.task_str)
+        syllogism = SYLLOGISM_CACHE.get(key)
+        if syllogism is None:
+            syllogism = cls(item)
+            del syllogism.item
+            decoding_table = {x: freeze(decode_response(x, syllogism.task)) for x in RESPONSES}
+            syllogism.decoding_table = FrozenDict(decoding_table)
+            syllogism.encoding_table = FrozenDict({y[0]: x for x, y in decoding_table.items()})
+            syllogism.shared = True
+
+            if len(SYLLOGISM_CACHE) >= SYLLOGISM_CACHE_SIZE:
+                del SYLLOGISM_CACHE[next(iter(SYLLOGISM_CACHE))]
+            SYLLOGISM_CACHE[key] = syllogism
+        return syllogism
+
     def encode_response(self, response):
         """ Encodes a given syllogistic response based on the information
         contained in the premises.
@@ -162,7 +218,14 @@ class GeneralizedSyllogism():
 
         """
 
-        return encode_response(response, self.item.task)
+        if self.encoding_table is not None:
+            option = response if isinstance(response[0], (list, tuple)) else [response]
+            if isinstance(option[0], (list, tuple)):
+                encoded = self.encoding_table.get(tuple(option[0]))
+                if encoded is not None:
+                    return encoded
+
+        return encode_response(response, self.task)
 
     def decode_response(self, encoded_response):
         """ Decodes a syllogistic response in string representation based on
@@ -181,7 +244,12 @@ class GeneralizedSyllogism():
 
         """
 
-        return decode_response(encoded_response, self.item.task)
+        if self.decoding_table is not None and isinstance(encoded_response, str):
+            decoded = self.decoding_table.get(encoded_response)
+            if decoded is not None:
+                return [list(x) for x in decoded]
+
+        return decode_response(encoded_response, self.task)
 
     def is_classical(self):
         """ Checks if the represented syllogism is in the classical set of 64 problems.
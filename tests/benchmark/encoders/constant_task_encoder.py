@@ -0,0 +1,15 @@
+""" Task encoder mapping all tasks to the same encoding.
+
+"""
+
+import ccobra
+
+
+class ConstantTaskEncoder(ccobra.CCobraTaskEncoder):
+    """ Encodes all tasks as 'task'.
+
+    """
+
+    @staticmethod
+    def encode_task(task):
+        return 'task'
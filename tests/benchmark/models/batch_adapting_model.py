@@ -0,0 +1,39 @@
+""" Lockstep counting model which only implements the batch adapt function.
+
+"""
+
+import ccobra
+
+import counting_model
+import lockstep_model
+
+
+class BatchAdaptingCountingModel(lockstep_model.LockstepCountingModel):
+    """ Lockstep counting model without a single-task adapt function. Logs the number of tasks
+    adapted to.
+
+    """
+
+    adapt = ccobra.CCobraModel.adapt
+
+    def __init__(self, name='CountingModel'):
+        super(BatchAdaptingCountingModel, self).__init__(name)
+
+        self.n_adapted = {}
+
+    def pre_train(self, dataset):
+        for subj_data in dataset:
+            for task_data in subj_data:
+                counting_model.CountingModel.adapt(self, task_data['item'], task_data['response'])
+
+    def adapt_batch(self, items, targets, aux_list):
+        global_counts = self.counts
+        for item, target in zip(items, targets):
+            self.counts = self.subject_counts[item.identifier]
+            counting_model.CountingModel.adapt(self, item, target)
+            self.n_adapted[item.identifier] = self.n_adapted.get(item.identifier, 0) + 1
+        self.counts = global_counts
+
+    def end_participant(self, identifier, model_log, **kwargs):
+        super(BatchAdaptingCountingModel, self).end_participant(identifier, model_log, **kwargs)
+        model_log['n_adapted'] = self.n_adapted.get(identifier, 0)
@@ -0,0 +1,23 @@
+""" Counting model which supports batch predictions.
+
+"""
+
+import counting_model
+
+
+class BatchCountingModel(counting_model.CountingModel):
+    """ Counting model implementing predict_batch. Logs the number of batch queries.
+
+    """
+
+    def __init__(self, name='CountingModel'):
+        super(BatchCountingModel, self).__init__(name)
+
+        self.n_batches = 0
+
+    def predict_batch(self, items, aux_list):
+        self.n_batches += 1
+        return [self.predict(item, **aux) for item, aux in zip(items, aux_list)]
+
+    def end_participant(self, identifier, model_log, **kwargs):
+        model_log['n_batches'] = self.n_batches
@@ -0,0 +1,13 @@
+""" Stateless counting model with cacheable predictions.
+
+"""
+
+import frozen_model
+
+
+class CachedCountingModel(frozen_model.FrozenCountingModel):
+    """ Frozen counting model declaring its predictions as cacheable.
+
+    """
+
+    cache_predictions = True
@@ -0,0 +1,13 @@
+""" Adapting counting model which wrongly declares its predictions as cacheable.
+
+"""
+
+import counting_model
+
+
+class CachedStatefulCountingModel(counting_model.CountingModel):
+    """ Counting model declaring cacheable predictions despite adapting its counts.
+
+    """
+
+    cache_predictions = True
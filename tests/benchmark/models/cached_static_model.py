@@ -0,0 +1,13 @@
+""" Stateless model without any training with cacheable predictions.
+
+"""
+
+import static_model
+
+
+class CachedStaticModel(static_model.StaticModel):
+    """ Static model declaring its predictions as cacheable.
+
+    """
+
+    cache_predictions = True
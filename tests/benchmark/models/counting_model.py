@@ -0,0 +1,36 @@
+""" Deterministic response counting model used for testing the evaluation routines.
+
+"""
+
+import ccobra
+
+
+class CountingModel(ccobra.CCobraModel):
+    """ Predicts the most frequent response to a task. Ties are resolved by the order of the
+    response choices.
+
+    """
+
+    def __init__(self, name='CountingModel'):
+        super(CountingModel, self).__init__(name, ['syllogistic'], ['single-choice'])
+
+        self.counts = {}
+
+    def pre_train(self, dataset):
+        for subj_data in dataset:
+            for task_data in subj_data:
+                self.adapt(task_data['item'], task_data['response'])
+
+    def predict(self, item, **kwargs):
+        task_counts = self.counts.get(item.task_str, {})
+        choices = [ccobra.tuple_to_string(x) for x in item.choices]
+        best_idx = max(range(len(choices)), key=lambda idx: (task_counts.get(choices[idx], 0), -idx))
+        return item.choices[best_idx]
+
+    def adapt(self, item, target, **kwargs):
+        task_counts = self.counts.setdefault(item.task_str, {})
+        response = ccobra.tuple_to_string(target)
+        task_counts[response] = task_counts.get(response, 0) + 1
+
+    def end_participant(self, identifier, model_log, **kwargs):
+        model_log['n_tasks'] = len(self.counts)
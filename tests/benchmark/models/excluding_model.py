@@ -0,0 +1,18 @@
+""" Counting model which supports removing subjects from its pre-training.
+
+"""
+
+import counting_model
+
+
+class ExcludingCountingModel(counting_model.CountingModel):
+    """ Counting model implementing the subtractive leave-one-out pre-training.
+
+    """
+
+    def pre_train_exclude(self, dataset):
+        for subj_data in dataset:
+            for task_data in subj_data:
+                task_counts = self.counts[task_data['item'].task_str]
+                response = counting_model.ccobra.tuple_to_string(task_data['response'])
+                task_counts[response] -= 1
@@ -0,0 +1,24 @@
+""" Counting model which logs the item features it receives.
+
+"""
+
+import counting_model
+
+
+class FeatureCountingModel(counting_model.CountingModel):
+    """ Counting model logging the encoded tasks provided by the item features.
+
+    """
+
+    def __init__(self, name='CountingModel'):
+        super(FeatureCountingModel, self).__init__(name)
+
+        self.encoded_tasks = set()
+
+    def predict(self, item, **kwargs):
+        if item.features is not None:
+            self.encoded_tasks.add(item.features['task'])
+        return super(FeatureCountingModel, self).predict(item, **kwargs)
+
+    def end_participant(self, identifier, model_log, **kwargs):
+        model_log['n_encoded_tasks'] = len(self.encoded_tasks)
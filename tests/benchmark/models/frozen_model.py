@@ -0,0 +1,21 @@
+""" Counting model which does not change after pre-training.
+
+"""
+
+import counting_model
+
+
+class FrozenCountingModel(counting_model.CountingModel):
+    """ Counting model declared as stateless. Only the pre-training updates the counts.
+
+    """
+
+    stateless = True
+
+    def pre_train(self, dataset):
+        for subj_data in dataset:
+            for task_data in subj_data:
+                counting_model.CountingModel.adapt(self, task_data['item'], task_data['response'])
+
+    def adapt(self, item, target, **kwargs):
+        pass
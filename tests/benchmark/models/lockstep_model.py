@@ -0,0 +1,50 @@
+""" Counting model which evaluates all subjects in lockstep.
+
+"""
+
+import copy
+
+import counting_model
+
+
+class LockstepCountingModel(counting_model.CountingModel):
+    """ Counting model keeping separate counts for each subject. Logs the number of batch
+    queries.
+
+    """
+
+    lockstep = True
+
+    def __init__(self, name='CountingModel'):
+        super(LockstepCountingModel, self).__init__(name)
+
+        self.subject_counts = {}
+        self.n_batches = 0
+
+    def start_participant(self, **kwargs):
+        self.subject_counts[kwargs['id']] = copy.deepcopy(self.counts)
+
+    def predict_batch(self, items, aux_list):
+        self.n_batches += 1
+
+        predictions = []
+        global_counts = self.counts
+        for item, aux in zip(items, aux_list):
+            self.counts = self.subject_counts[item.identifier]
+            predictions.append(self.predict(item, **aux))
+        self.counts = global_counts
+        return predictions
+
+    def predict_age(self, item, **kwargs):
+        return item.sequence_number
+
+    def adapt_batch(self, items, targets, aux_list):
+        global_counts = self.counts
+        for item, target, aux in zip(items, targets, aux_list):
+            self.counts = self.subject_counts[item.identifier]
+            self.adapt(item, target, **aux)
+        self.counts = global_counts
+
+    def end_participant(self, identifier, model_log, **kwargs):
+        model_log['n_tasks'] = len(self.subject_counts[identifier])
+        model_log['n_batches'] = self.n_batches
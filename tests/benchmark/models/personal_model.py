@@ -0,0 +1,16 @@
+""" Stateless counting model which is trained on the data of the individual subjects.
+
+"""
+
+import counting_model
+import frozen_model
+
+
+class PersonalCountingModel(frozen_model.FrozenCountingModel):
+    """ Frozen counting model which updates its counts during person training only.
+
+    """
+
+    def pre_train_person(self, dataset):
+        for task_data in dataset:
+            counting_model.CountingModel.adapt(self, task_data['item'], task_data['response'])
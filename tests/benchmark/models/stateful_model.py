@@ -0,0 +1,13 @@
+""" Counting model which wrongly declares itself as stateless.
+
+"""
+
+import counting_model
+
+
+class StatefulCountingModel(counting_model.CountingModel):
+    """ Counting model declared as stateless despite adapting its counts.
+
+    """
+
+    stateless = True
@@ -0,0 +1,26 @@
+""" Stateless model without any training used for testing the sharing of model instances.
+
+"""
+
+import ccobra
+
+# Keeps the evaluated instances alive so that their identifiers are not reused
+INSTANCES = []
+
+
+class StaticModel(ccobra.CCobraModel):
+    """ Always predicts the first response choice. Reports its instance in the model log.
+
+    """
+
+    stateless = True
+
+    def __init__(self, name='StaticModel'):
+        super(StaticModel, self).__init__(name, ['syllogistic'], ['single-choice'])
+
+    def predict(self, item, **kwargs):
+        return item.choices[0]
+
+    def end_participant(self, identifier, model_log, **kwargs):
+        INSTANCES.append(self)
+        model_log['instance'] = id(self)
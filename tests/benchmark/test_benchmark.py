@@ -0,0 +1,105 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+import ccobra
+
+FIXTURE_PATH = os.path.dirname(os.path.abspath(__file__))
+DATA_PATH = os.path.join(FIXTURE_PATH, 'data', 'ragni2016_small.csv')
+
+class BenchmarkTestCase(unittest.TestCase):
+    """ Tests the data handling of benchmarks.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def create_benchmark(self, **settings):
+        content = {
+            'type': 'adaption',
+            'data.test': DATA_PATH,
+            'corresponding_data': True,
+            'models': []
+        }
+        content.update(settings)
+
+        json_path = os.path.join(self.tmp_dir, 'benchmark.json')
+        with open(json_path, 'w') as json_file:
+            json.dump(content, json_file)
+
+        return ccobra.benchmark.Benchmark(json_path, argmodel=(None, None))
+
+    def test_shared_data_file(self):
+        benchmark = self.create_benchmark(**{'data.pre_train': DATA_PATH})
+        self.assertIs(benchmark.data_test, benchmark.data_pre_train)
+        self.assertIsNone(benchmark.data_pre_train_person)
+        self.assertIsNone(benchmark.data_pre_person_background)
+
+        # Identical files at different paths share the dataframe as well
+        copy_path = os.path.join(self.tmp_dir, 'copy.csv')
+        shutil.copy(DATA_PATH, copy_path)
+        benchmark = self.create_benchmark(**{'data.pre_train': copy_path})
+        self.assertIs(benchmark.data_test, benchmark.data_pre_train)
+
+        # Training data of non-corresponding benchmarks is prefixed separately
+        benchmark = self.create_benchmark(corresponding_data=False, **{'data.pre_train': DATA_PATH})
+        self.assertIsNot(benchmark.data_test, benchmark.data_pre_train)
+        self.assertNotIn('_unique_id', benchmark.data_files[os.path.realpath(DATA_PATH)])
+
+    def test_corresponding_data_split(self):
+        df = pd.read_csv(DATA_PATH)
+        person_df = df.loc[df['sequence'] < 3].copy()
+        person_df['sequence'] += 100
+        background_df = df.loc[df['sequence'] < 2].copy()
+        background_df['domain'] = 'other'
+        background_df['sequence'] += 200
+
+        train_path = os.path.join(self.tmp_dir, 'train.csv')
+        pd.concat([df, person_df, background_df]).to_csv(train_path, index=False)
+
+        background_path = os.path.join(self.tmp_dir, 'background.csv')
+        background_df.assign(sequence=background_df['sequence'] + 100).to_csv(
+            background_path, index=False)
+
+        benchmark = self.create_benchmark(**{
+            'data.pre_train': train_path,
+            'data.pre_person_background': background_path
+        })
+        self.assertEqual(len(person_df), len(benchmark.data_pre_train_person.get()))
+        self.assertEqual(
+            2 * len(background_df), len(benchmark.data_pre_person_background.get()))
+        self.assertEqual(
+            ['other'], list(benchmark.data_pre_person_background.get()['domain'].unique()))
+
+    def test_data_formats(self):
+        df = pd.read_csv(DATA_PATH)
+        shard_dir = os.path.join(self.tmp_dir, 'shards')
+        os.makedirs(shard_dir)
+        for idx, (_, subj_df) in enumerate(df.groupby('id')):
+            subj_df.to_csv(os.path.join(shard_dir, 'shard-{}.csv.gz'.format(idx)), index=False)
+
+        # Compressed shards matched by a glob pattern are combined
+        benchmark = self.create_benchmark(**{'data.test': 'shards/shard-*.csv.gz'})
+        test_df = benchmark.data_test.get()
+        self.assertEqual(len(df), len(test_df))
+        self.assertEqual(sorted(df['id'].unique()), sorted(test_df['id'].unique()))
+        self.assertIn('gender', test_df.columns)
+
+        # Declared auxiliary columns restrict the columns that are read
+        benchmark = self.create_benchmark(aux_columns=['age'])
+        self.assertIn('age', benchmark.data_test.get().columns)
+        self.assertNotIn('gender', benchmark.data_test.get().columns)
+
+        with self.assertRaises(ValueError):
+            self.create_benchmark(**{'data.test': 'shards/missing-*.csv'})
+
+if __name__ == '__main__':
+    unittest.main()
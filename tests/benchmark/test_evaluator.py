@@ -0,0 +1,423 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import ccobra
+
+FIXTURE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+def create_benchmark(tmp_dir, use_data_cache=False, stream_test_data=False, **settings):
+    """ Creates a benchmark file referencing the test fixtures and loads it.
+
+    """
+
+    content = {
+        'type': 'adaption',
+        'data.test': os.path.join(FIXTURE_PATH, 'data', 'ragni2016_small.csv'),
+        'data.pre_train': os.path.join(FIXTURE_PATH, 'data', 'ragni2016_small.csv'),
+        'corresponding_data': True,
+        'models': [os.path.join(FIXTURE_PATH, 'models', 'counting_model.py')]
+    }
+    content.update(settings)
+
+    json_path = os.path.join(tmp_dir, 'benchmark.json')
+    with open(json_path, 'w') as json_file:
+        json.dump(content, json_file)
+
+    return ccobra.benchmark.Benchmark(
+        json_path, argmodel=(None, None), use_data_cache=use_data_cache,
+        stream_test_data=stream_test_data)
+
+class EvaluatorTestCase(unittest.TestCase):
+    """ Tests the evaluation routine on a small syllogistic dataset.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def evaluate(self, n_jobs=1, n_model_jobs=1, store_path=None, journal_path=None,
+                 resume=False, result_sink=None, use_data_cache=False, stream_test_data=False,
+                 use_arena=False, **settings):
+        benchmark = create_benchmark(
+            self.tmp_dir, use_data_cache=use_data_cache, stream_test_data=stream_test_data,
+            **settings)
+        result_store = None
+        if store_path is not None:
+            result_store = ccobra.benchmark.ResultStore(store_path, benchmark)
+
+        journal = None
+        if journal_path is not None:
+            journal = ccobra.benchmark.RunJournal(journal_path, benchmark, resume=resume)
+
+        evaluator = ccobra.benchmark.Evaluator(
+            benchmark, is_silent=True, n_jobs=n_jobs, n_model_jobs=n_model_jobs,
+            result_store=result_store, journal=journal, result_sink=result_sink,
+            use_arena=use_arena)
+        return evaluator.evaluate()
+
+    def test_adaption_results(self):
+        res_df, model_log = self.evaluate()
+
+        self.assertEqual(384, len(res_df))
+        self.assertEqual(['CountingModel'], list(res_df['model'].unique()))
+        self.assertEqual(6, len(model_log['CountingModel']))
+
+    def test_parallel_subjects(self):
+        seq_df, seq_log = self.evaluate()
+        par_df, par_log = self.evaluate(n_jobs=3)
+
+        self.assertTrue(seq_df.equals(par_df))
+        self.assertEqual(seq_log, par_log)
+
+    def test_parallel_models(self):
+        model_path = os.path.join(FIXTURE_PATH, 'models', 'counting_model.py')
+        models = [model_path, {'filename': model_path, 'override_name': 'Other'}, model_path]
+
+        seq_df, seq_log = self.evaluate(models=models)
+        par_df, par_log = self.evaluate(n_model_jobs=2, models=models)
+
+        self.assertEqual(
+            ['CountingModel', 'Other', 'CountingModel\''], list(par_df['model'].unique()))
+        self.assertTrue(seq_df.equals(par_df))
+        self.assertEqual(seq_log, par_log)
+
+    def test_pre_train_exclude(self):
+        loo_df, loo_log = self.evaluate()
+        exclude_df, exclude_log = self.evaluate(models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'excluding_model.py'),
+            'override_name': 'CountingModel'
+        }])
+
+        self.assertTrue(loo_df.equals(exclude_df))
+        self.assertEqual(loo_log, exclude_log)
+
+    def test_crossvalidation(self):
+        loo_df, _ = self.evaluate()
+        cv_df, _ = self.evaluate(cv_folds=6)
+        self.assertTrue(loo_df.equals(cv_df))
+
+        cv_df, _ = self.evaluate(cv_folds=2)
+        exclude_df, _ = self.evaluate(cv_folds=2, n_jobs=2, models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'excluding_model.py'),
+            'override_name': 'CountingModel'
+        }])
+        self.assertTrue(cv_df.equals(exclude_df))
+
+    def test_crossvalidation_folds(self):
+        def folds(**settings):
+            benchmark = create_benchmark(self.tmp_dir, cv_folds=2, **settings)
+            return ccobra.benchmark.Evaluator(benchmark, is_silent=True).subject_folds
+
+        self.assertEqual(folds(), folds(cv_seed=0))
+        self.assertEqual([3, 3], sorted(list(folds().values()).count(x) for x in [0, 1]))
+        self.assertTrue(any(folds() != folds(cv_seed=x) for x in range(1, 10)))
+
+        with self.assertRaises(ValueError):
+            folds(cv_seed=-1)
+
+    def test_stateless(self):
+        counting_df, _ = self.evaluate(type='prediction', corresponding_data=False)
+        frozen_df, frozen_log = self.evaluate(type='prediction', corresponding_data=False, models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'frozen_model.py'),
+            'override_name': 'CountingModel'
+        }])
+
+        self.assertTrue(counting_df.equals(frozen_df))
+        self.assertEqual(6, len(frozen_log['CountingModel']))
+
+    def test_stateless_person_training(self):
+        personal_model = {
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'personal_model.py'),
+            'override_name': 'CountingModel'
+        }
+
+        for benchmark_type in ['coverage', 'loo-coverage']:
+            counting_df, counting_log = self.evaluate(type=benchmark_type)
+            with self.assertNoLogs('ccobra.benchmark.evaluator', level='WARNING'):
+                personal_df, personal_log = self.evaluate(
+                    type=benchmark_type, models=[personal_model])
+
+            self.assertTrue(counting_df.equals(personal_df))
+            self.assertEqual(counting_log, personal_log)
+
+    def test_stateless_sharing(self):
+        static_model = os.path.join(FIXTURE_PATH, 'models', 'static_model.py')
+
+        # Models without pre-training are shared despite the corresponding data
+        for settings in [{}, {'cv_folds': 2}]:
+            _, static_log = self.evaluate(models=[static_model], **settings)
+            instances = set(x['instance'] for x in static_log['StaticModel'].values())
+            self.assertEqual(6, len(static_log['StaticModel']))
+            self.assertEqual(1, len(instances))
+
+    def test_stateless_validation(self):
+        counting_df, _ = self.evaluate()
+        with self.assertLogs('ccobra.benchmark.evaluator', level='WARNING'):
+            stateful_df, _ = self.evaluate(models=[{
+                'filename': os.path.join(FIXTURE_PATH, 'models', 'stateful_model.py'),
+                'override_name': 'CountingModel'
+            }])
+
+        self.assertTrue(counting_df.equals(stateful_df))
+
+    def test_prediction_cache(self):
+        frozen_df, _ = self.evaluate(type='prediction', corresponding_data=False, models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'frozen_model.py'),
+            'override_name': 'CountingModel'
+        }])
+
+        for n_jobs in [1, 2]:
+            with self.assertLogs('ccobra.benchmark.evaluator', level='INFO') as logs:
+                cached_df, _ = self.evaluate(
+                    n_jobs=n_jobs, type='prediction', corresponding_data=False, models=[{
+                        'filename': os.path.join(FIXTURE_PATH, 'models', 'cached_model.py'),
+                        'override_name': 'CountingModel'
+                    }])
+
+            self.assertTrue(frozen_df.equals(cached_df))
+            cache_logs = [x for x in logs.output if 'Prediction cache' in x]
+            self.assertEqual(1, len(cache_logs))
+            self.assertIn('hits', cache_logs[0])
+
+    def test_prediction_cache_corresponding_data(self):
+        static_df, _ = self.evaluate(models=[os.path.join(FIXTURE_PATH, 'models', 'static_model.py')])
+
+        # Models without pre-training share predictions despite the corresponding data
+        for settings in [{}, {'cv_folds': 2}]:
+            with self.assertLogs('ccobra.benchmark.evaluator', level='INFO') as logs:
+                cached_df, _ = self.evaluate(models=[{
+                    'filename': os.path.join(FIXTURE_PATH, 'models', 'cached_static_model.py'),
+                    'override_name': 'StaticModel'
+                }], **settings)
+
+            self.assertTrue(static_df.equals(cached_df))
+            cache_logs = [x for x in logs.output if 'Prediction cache' in x]
+            self.assertEqual(1, len(cache_logs))
+            self.assertNotIn(': 0 hits', cache_logs[0])
+
+    def test_prediction_cache_disabled(self):
+        counting_df, _ = self.evaluate()
+        with self.assertLogs('ccobra.benchmark.evaluator', level='WARNING') as logs:
+            cached_df, _ = self.evaluate(models=[{
+                'filename': os.path.join(FIXTURE_PATH, 'models', 'cached_stateful_model.py'),
+                'override_name': 'CountingModel'
+            }])
+        self.assertTrue(counting_df.equals(cached_df))
+        self.assertTrue(any('not stateless' in x for x in logs.output))
+
+        # Models trained on the individual subjects do not share predictions
+        with self.assertLogs('ccobra.benchmark.evaluator', level='INFO') as logs:
+            self.evaluate(type='coverage', corresponding_data=False, models=[{
+                'filename': os.path.join(FIXTURE_PATH, 'models', 'cached_model.py'),
+                'override_name': 'CountingModel'
+            }])
+        self.assertTrue(any('trained individually' in x for x in logs.output))
+        self.assertFalse(any('Prediction cache' in x for x in logs.output))
+
+    def test_predict_batch(self):
+        batch_model = {
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'batch_model.py'),
+            'override_name': 'CountingModel'
+        }
+
+        for benchmark_type in ['prediction', 'coverage']:
+            counting_df, _ = self.evaluate(type=benchmark_type)
+            batch_df, batch_log = self.evaluate(type=benchmark_type, models=[batch_model])
+
+            self.assertTrue(counting_df.equals(batch_df))
+            self.assertTrue(all(x['n_batches'] == 1 for x in batch_log['CountingModel'].values()))
+
+        # Models adapting between the predictions are queried individually
+        counting_df, _ = self.evaluate()
+        batch_df, batch_log = self.evaluate(models=[batch_model])
+        self.assertTrue(counting_df.equals(batch_df))
+        self.assertTrue(all(x['n_batches'] == 0 for x in batch_log['CountingModel'].values()))
+
+    def test_lockstep(self):
+        counting_df, counting_log = self.evaluate(corresponding_data=False)
+        lockstep_df, lockstep_log = self.evaluate(corresponding_data=False, models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'lockstep_model.py'),
+            'override_name': 'CountingModel'
+        }])
+
+        self.assertTrue(counting_df.equals(lockstep_df))
+        for subj_id, subj_log in lockstep_log['CountingModel'].items():
+            self.assertEqual(counting_log['CountingModel'][subj_id]['n_tasks'], subj_log['n_tasks'])
+            self.assertEqual(64, subj_log['n_batches'])
+
+    def test_lockstep_batch_adapt(self):
+        counting_df, _ = self.evaluate(corresponding_data=False)
+        lockstep_df, lockstep_log = self.evaluate(corresponding_data=False, models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'batch_adapting_model.py'),
+            'override_name': 'CountingModel'
+        }])
+        self.assertTrue(counting_df.equals(lockstep_df))
+        self.assertTrue(all(x['n_adapted'] == 64 for x in lockstep_log['CountingModel'].values()))
+
+    def test_lockstep_aux_evaluations(self):
+        lockstep_df, _ = self.evaluate(corresponding_data=False, models=[{
+            'filename': os.path.join(FIXTURE_PATH, 'models', 'lockstep_model.py'),
+            'override_name': 'CountingModel'
+        }], aux_evaluations=[{
+            'data_column': 'age',
+            'prediction_fn_name': 'predict_age',
+            'adapt_fn_name': None
+        }])
+
+        self.assertEqual(384, len(lockstep_df))
+        self.assertEqual(
+            [str(x) for x in lockstep_df['sequence']], list(lockstep_df['prediction_age']))
+
+    def test_feature_encoders(self):
+        feature_model = os.path.join(FIXTURE_PATH, 'models', 'feature_model.py')
+        encoder_benchmark = create_benchmark(
+            self.tmp_dir, models=[feature_model], corresponding_data=False, task_encoders={
+                'syllogistic': '%ccobra%/syllogistic/task_encoder_syl.py'
+            })
+        constant_benchmark = create_benchmark(
+            self.tmp_dir, models=[feature_model], corresponding_data=False, task_encoders={
+                'syllogistic': os.path.join(FIXTURE_PATH, 'encoders', 'constant_task_encoder.py')
+            })
+
+        # Evaluators only use the encoders of their benchmark during the evaluation
+        encoder_evaluator = ccobra.benchmark.Evaluator(encoder_benchmark, is_silent=True)
+        constant_evaluator = ccobra.benchmark.Evaluator(constant_benchmark, is_silent=True)
+        for evaluator, n_encoded_tasks in [(encoder_evaluator, 64), (constant_evaluator, 1)] * 2:
+            _, model_log = evaluator.evaluate()
+            self.assertTrue(all(
+                x['n_encoded_tasks'] == n_encoded_tasks for x in model_log['CountingModel'].values()))
+            self.assertEqual({}, ccobra.item.FEATURE_ENCODERS)
+
+    def test_result_store(self):
+        store_path = os.path.join(self.tmp_dir, 'store')
+        model_path = os.path.join(FIXTURE_PATH, 'models', 'counting_model.py')
+        models = [model_path, {'filename': model_path, 'args': {'name': 'Other'}}]
+
+        res_df, model_log = self.evaluate(models=models)
+        store_df, store_log = self.evaluate(store_path=store_path, models=models)
+        self.assertTrue(res_df.equals(store_df))
+        self.assertEqual(model_log, store_log)
+
+        # Only models with changed fingerprints are evaluated again
+        models[1]['args']['name'] = 'Changed'
+        with self.assertLogs('ccobra.benchmark.evaluator', level='INFO') as logs:
+            store_df, store_log = self.evaluate(n_model_jobs=2, store_path=store_path, models=models)
+
+        self.assertEqual(1, len([x for x in logs.output if 'Loading stored results' in x]))
+        self.assertEqual(['CountingModel', 'Changed'], list(store_df['model'].unique()))
+        self.assertEqual(['CountingModel', 'Changed'], list(store_log.keys()))
+        self.assertEqual(
+            list(res_df.loc[res_df['model'] == 'Other', 'prediction']),
+            list(store_df.loc[store_df['model'] == 'Changed', 'prediction']))
+
+        # Changes to the benchmark settings invalidate all models
+        with self.assertLogs('ccobra.benchmark.evaluator', level='INFO') as logs:
+            self.evaluate(store_path=store_path, models=models, cv_folds=2)
+        self.assertFalse(any('Loading stored results' in x for x in logs.output))
+
+    def test_resume(self):
+        journal_path = os.path.join(self.tmp_dir, 'journal.jsonl')
+        model_path = os.path.join(FIXTURE_PATH, 'models', 'counting_model.py')
+        models = [model_path, {'filename': model_path, 'override_name': 'Other'}]
+
+        res_df, model_log = self.evaluate(journal_path=journal_path, models=models)
+        with open(journal_path) as journal_file:
+            lines = journal_file.readlines()
+        self.assertEqual(13, len(lines))
+
+        # Simulate an interruption during the second subject of the second model
+        for n_jobs, n_model_jobs in [(1, 1), (2, 1), (1, 2)]:
+            with open(journal_path, 'w') as journal_file:
+                journal_file.writelines(lines[:8] + [lines[8][:100]])
+
+            with self.assertLogs('ccobra.benchmark.evaluator', level='INFO') as logs:
+                resume_df, resume_log = self.evaluate(
+                    n_jobs=n_jobs, n_model_jobs=n_model_jobs, journal_path=journal_path,
+                    resume=True, models=models)
+
+            self.assertTrue(res_df.equals(resume_df))
+            self.assertEqual(model_log, resume_log)
+            self.assertEqual(1, len([x for x in logs.output if 'Restoring journaled' in x]))
+
+            with open(journal_path) as journal_file:
+                self.assertEqual(lines, journal_file.readlines())
+
+        # Journals can only be resumed for the same benchmark
+        with self.assertRaises(ValueError):
+            self.evaluate(journal_path=journal_path, resume=True)
+
+    def test_result_sink(self):
+        model_path = os.path.join(FIXTURE_PATH, 'models', 'counting_model.py')
+        models = [model_path, {'filename': model_path, 'override_name': 'Other'}]
+        res_df, model_log = self.evaluate(models=models)
+
+        save_path = os.path.join(self.tmp_dir, 'results.csv')
+        for n_model_jobs in [1, 2]:
+            sink = ccobra.benchmark.ResultSink(save_path, chunk_size=100)
+            sink_df, sink_log = self.evaluate(
+                n_model_jobs=n_model_jobs, result_sink=sink, models=models)
+
+            self.assertEqual(model_log, sink_log)
+            self.assertEqual(len(res_df), len(sink_df))
+            self.assertEqual(list(res_df.columns), list(sink_df.columns))
+            self.assertEqual(list(res_df['prediction']), list(sink_df['prediction']))
+            self.assertEqual(list(res_df['model']), list(sink_df['model']))
+
+    def test_aux_evaluations(self):
+        res_df, _ = self.evaluate(aux_evaluations=[{
+            'data_column': 'age',
+            'prediction_fn_name': 'predict',
+            'adapt_fn_name': 'adapt'
+        }])
+
+        self.assertEqual(384, len(res_df))
+        self.assertEqual(
+            ['truth_age', 'prediction_age', 'score_age'], list(res_df.columns[-3:]))
+        self.assertEqual(list(res_df['prediction']), list(res_df['prediction_age']))
+
+    def test_data_cache(self):
+        res_df, model_log = self.evaluate()
+        cache_df, cache_log = self.evaluate(use_data_cache=True)
+        self.assertTrue(res_df.equals(cache_df))
+        self.assertEqual(model_log, cache_log)
+
+        # Unchanged datasets are loaded from the cache
+        with self.assertLogs('ccobra.benchmark.data_cache', level='DEBUG') as logs:
+            cache_df, cache_log = self.evaluate(use_data_cache=True)
+        self.assertTrue(res_df.equals(cache_df))
+        self.assertEqual(model_log, cache_log)
+        self.assertEqual(1, len([x for x in logs.output if 'from the data cache' in x and '.csv' in x]))
+        self.assertEqual(1, len([x for x in logs.output if 'Loaded evaluation dictionary' in x]))
+
+    def test_stream_test_data(self):
+        for benchmark_type in ['adaption', 'prediction', 'coverage']:
+            res_df, model_log = self.evaluate(type=benchmark_type)
+            for n_jobs in [1, 2]:
+                stream_df, stream_log = self.evaluate(
+                    n_jobs=n_jobs, stream_test_data=True, type=benchmark_type)
+                self.assertTrue(res_df.equals(stream_df))
+                self.assertEqual(model_log, stream_log)
+
+    def test_data_arena(self):
+        for benchmark_type in ['adaption', 'prediction', 'coverage']:
+            res_df, model_log = self.evaluate(type=benchmark_type)
+            for n_jobs in [1, 2]:
+                arena_df, arena_log = self.evaluate(
+                    n_jobs=n_jobs, use_arena=True, type=benchmark_type)
+                self.assertTrue(res_df.equals(arena_df))
+                self.assertEqual(model_log, arena_log)
+
+    def test_loo_coverage(self):
+        res_df, model_log = self.evaluate(type='loo-coverage')
+
+        self.assertEqual(384, len(res_df))
+        self.assertEqual(384, len(model_log['CountingModel']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+import ccobra
+from ccobra.benchmark.prediction_cache import PredictionCache
+
+def create_item(task):
+    return ccobra.Item(0, 'syllogistic', task, 'single-choice', 'All;a;c|Some;a;c|NVC', 0)
+
+class PredictionCacheTestCase(unittest.TestCase):
+    """ Tests the least-recently-used prediction cache.
+
+    """
+
+    def test_hits_and_misses(self):
+        cache = PredictionCache(10)
+        item = create_item('All;a;b/All;b;c')
+
+        self.assertEqual('Aac', cache.lookup(item, lambda: 'Aac'))
+        self.assertEqual('Aac', cache.lookup(create_item('All;a;b/All;b;c'), lambda: 'Iac'))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_eviction(self):
+        cache = PredictionCache(2)
+        first = create_item('All;a;b/All;b;c')
+        second = create_item('Some;a;b/All;b;c')
+        third = create_item('No;a;b/All;b;c')
+
+        cache.lookup(first, lambda: 1)
+        cache.lookup(second, lambda: 2)
+        cache.lookup(first, lambda: 1)
+        cache.lookup(third, lambda: 3)
+
+        self.assertEqual(2, len(cache.entries))
+        self.assertEqual(1, cache.lookup(first, lambda: None))
+        self.assertEqual(None, cache.lookup(second, lambda: None))
+
+if __name__ == '__main__':
+    unittest.main()
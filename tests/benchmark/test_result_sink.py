@@ -0,0 +1,104 @@
+import array
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ccobra.benchmark.result_sink import ResultColumns, ResultSink
+
+def create_columns(rows):
+    columns = ResultColumns(['id', 'sequence', 'score'], numeric_columns=['sequence', 'score'])
+    for row in rows:
+        columns.append(row)
+    return columns
+
+class ResultColumnsTestCase(unittest.TestCase):
+    """ Tests the typed result buffers.
+
+    """
+
+    def test_typed_buffers(self):
+        columns = create_columns([('a', 0, 1), ('b', 1, 0)])
+        self.assertIsInstance(columns['sequence'], array.array)
+        self.assertEqual('q', columns['score'].typecode)
+
+        df = columns.to_dataframe()
+        self.assertEqual(['id', 'sequence', 'score'], list(df.columns))
+        self.assertEqual(np.int64, df['score'].dtype)
+        self.assertTrue(df.equals(pd.DataFrame(columns.to_records())))
+
+    def test_widening(self):
+        columns = create_columns([('a', 0, 1), ('b', 1, 0.5), ('c', 2, 'x')])
+        self.assertEqual([1, 0.5, 'x'], columns['score'])
+
+        columns = create_columns([('a', 0, 1), ('b', 1, 0.5)])
+        self.assertEqual('d', columns['score'].typecode)
+
+        other = create_columns([('c', 2, np.nan)])
+        other.extend(columns)
+        self.assertEqual('d', other['score'].typecode)
+        self.assertEqual(['c', 'a', 'b'], other['id'])
+
+    def test_reorder_and_slice(self):
+        columns = create_columns([('a', 0, 1), ('b', 1, 0), ('c', 2, 1)])
+        columns.reorder(1, [1, 0])
+        self.assertEqual(['a', 'c', 'b'], columns['id'])
+        self.assertEqual([0, 2, 1], list(columns['sequence']))
+
+        part = columns.slice(1)
+        self.assertEqual(2, len(part))
+        self.assertEqual([2, 1], list(part['sequence']))
+
+        restored = columns.empty_copy()
+        restored.extend_records(part.to_records())
+        self.assertTrue(restored.to_dataframe().equals(part.to_dataframe()))
+
+class ResultSinkTestCase(unittest.TestCase):
+    """ Tests the chunked result sink.
+
+    """
+
+    def test_append_frames(self):
+        sink = ResultSink(chunk_size=2)
+        sink.append_frame(create_columns([('a', 0, 1)]).to_dataframe())
+        sink.append_frame(pd.DataFrame({'id': ['b', 'c'], 'extra': [1.5, 2.5]}))
+
+        df = sink.to_dataframe()
+        self.assertEqual(3, len(sink))
+        self.assertEqual(['id', 'sequence', 'score', 'extra'], list(df.columns))
+        self.assertEqual(['a', 'b', 'c'], list(df['id']))
+        self.assertTrue(np.isnan(df['extra'][0]))
+
+    def test_file_types(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        save_path = os.path.join(tmp_dir, 'results.csv')
+
+        frames = [
+            pd.DataFrame({'id': ['007', '010'], 'prediction': ['NA', None], 'score': [1, 0]}),
+            pd.DataFrame({'id': [7, 'x'], 'prediction': ['a', 'b'], 'score': [0.5, 1.0]})
+        ]
+
+        def sink_dataframe(path, chunk_size):
+            sink = ResultSink(path, chunk_size=chunk_size)
+            for df in frames:
+                sink.append_frame(df)
+            return sink.to_dataframe()
+
+        # Results which were not written yet are returned from memory
+        memory_df = sink_dataframe(None, 10)
+        self.assertTrue(memory_df.equals(sink_dataframe(save_path, 10)))
+        self.assertEqual(['007', '010', 7, 'x'], list(memory_df['id']))
+
+        # Written results are read with the types of the in-memory results
+        file_df = sink_dataframe(save_path, 2)
+        self.assertEqual(list(memory_df.dtypes), list(file_df.dtypes))
+        self.assertEqual(['007', '010', '7', 'x'], list(file_df['id']))
+        self.assertEqual(['NA', 'a', 'b'], list(file_df['prediction'].dropna()))
+        self.assertEqual([1.0, 0.0, 0.5, 1.0], list(file_df['score']))
+
+if __name__ == '__main__':
+    unittest.main()
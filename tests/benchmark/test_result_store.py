@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ccobra.benchmark.result_store import ResultStore
+
+from .test_evaluator import create_benchmark
+
+class ResultStoreTestCase(unittest.TestCase):
+    """ Tests the persistence of model results.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = ResultStore(os.path.join(self.tmp_dir, 'store'), create_benchmark(self.tmp_dir))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_round_trip(self):
+        res_df = pd.DataFrame({'model': ['M', 'M'], 'id': [1, 2], 'score': [1.0, 0.0]})
+        model_log = {
+            1: {'n_tasks': np.int64(64), 'weights': np.array([0.5, 0.25])},
+            'b': {'score': np.float64(0.5)}
+        }
+        self.store.save('entry', 'M', res_df, model_log)
+
+        model_name, store_df, store_log = self.store.load('entry')
+        self.assertEqual('M', model_name)
+        self.assertTrue(res_df.equals(store_df))
+        self.assertEqual({1: {'n_tasks': 64, 'weights': [0.5, 0.25]}, 'b': {'score': 0.5}}, store_log)
+        self.assertEqual([], [x for x in os.listdir(self.store.path) if x.endswith('.tmp')])
+
+    def test_failed_save(self):
+        res_df = pd.DataFrame({'model': ['M'], 'id': [1]})
+        with self.assertRaises(TypeError):
+            self.store.save('entry', 'M', res_df, {1: {'obj': object()}})
+
+        self.assertEqual([], os.listdir(self.store.path))
+        self.assertIsNone(self.store.load('entry'))
+
+    def test_unreadable_entry(self):
+        res_df = pd.DataFrame({'model': ['M'], 'id': [1]})
+        self.store.save('entry', 'M', res_df, {1: {}})
+
+        info_path = os.path.join(self.store.path, 'entry.json')
+        with open(info_path) as info_file:
+            content = info_file.read()
+        with open(info_path, 'w') as info_file:
+            info_file.write(content[:10])
+
+        with self.assertLogs('ccobra.benchmark.result_store', level='WARNING'):
+            self.assertIsNone(self.store.load('entry'))
@@ -0,0 +1,73 @@
+import os
+import timeit
+import unittest
+
+import pandas as pd
+
+import ccobra
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmark', 'data',
+    'ragni2016_small.csv')
+
+#: Environment variable enabling the timing comparisons. Run them with
+#: CCOBRA_PERFORMANCE_TESTS=1 python -m pytest -s tests/syllogistic/test_performance.py
+PERFORMANCE_TESTS = os.environ.get('CCOBRA_PERFORMANCE_TESTS')
+
+def legacy_encode_response(response, task):
+    """ Reference implementation of the response encoding based on sets, string replacements,
+    and list scans.
+
+    """
+
+    response = response.split(';')
+    task = [x.split(';') for x in task.split('/')]
+    if response[0] == 'NVC':
+        return ccobra.syllogistic.RESPONSES.index('NVC')
+
+    object_sets = [set(x[1:]) for x in task]
+    midterm = object_sets[0].intersection(object_sets[1])
+    obj_a = object_sets[0] - midterm
+    quant = response[0].replace('All', 'A').replace(
+        'Some not', 'O').replace('Some', 'I').replace('No', 'E')
+    encoded = quant + ('ac' if response[1] == list(obj_a)[0] else 'ca')
+    return ccobra.syllogistic.RESPONSES.index(encoded)
+
+class PerformanceTestCase(unittest.TestCase):
+    """ Tests the lookup-based encodings of syllogistic responses against the reference
+    implementation they replace and compares their timings.
+
+    """
+
+    def test_encode_responses(self):
+        df = pd.read_csv(DATA_PATH)
+        responses = df['response'].tolist()
+        tasks = df['task'].tolist()
+
+        codes = ccobra.syllogistic.encode_responses(responses, tasks)
+        expected = [legacy_encode_response(x, y) for x, y in zip(responses, tasks)]
+        self.assertEqual(expected, codes.tolist())
+
+        # Single encodings agree with the batch encoding
+        for response, task, code in zip(responses, tasks, expected):
+            task = [x.split(';') for x in task.split('/')]
+            encoded = ccobra.syllogistic.encode_response(response.split(';'), task)
+            self.assertEqual(code, ccobra.syllogistic.RESPONSE_INDEX[encoded])
+
+    @unittest.skipUnless(PERFORMANCE_TESTS, 'timing comparisons require CCOBRA_PERFORMANCE_TESTS')
+    def test_encode_responses_timing(self):
+        df = pd.read_csv(DATA_PATH)
+        responses = df['response'].tolist() * 10
+        tasks = df['task'].tolist() * 10
+
+        # Timings depend on the machine and are only reported
+        batch_time = min(timeit.repeat(
+            lambda: ccobra.syllogistic.encode_responses(responses, tasks), number=5, repeat=3))
+        legacy_time = min(timeit.repeat(
+            lambda: [legacy_encode_response(x, y) for x, y in zip(responses, tasks)],
+            number=5, repeat=3))
+        print('\nEncoding {} responses: batch {:.4f}s, legacy {:.4f}s ({:.1f}x speed-up)'.format(
+            len(responses), batch_time / 5, legacy_time / 5, legacy_time / batch_time))
+
+if __name__ == '__main__':
+    unittest.main()
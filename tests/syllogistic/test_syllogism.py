@@ -0,0 +1,86 @@
+import unittest
+import ccobra
+
+class SyllogismTestCase(unittest.TestCase):
+    """ Tests the shared syllogistic helper objects.
+
+    """
+
+    def setUp(self):
+        self.item = ccobra.Item(
+            1, 'syllogistic', 'All;models;managers/Some;clerks;managers', 'single-choice',
+            'All;models;clerks|Some;clerks;models|NVC', 0)
+
+    def test_from_item(self):
+        syllogism = ccobra.syllogistic.Syllogism.from_item(self.item)
+        other = ccobra.Item(
+            2, 'syllogistic', 'All;models;managers/Some;clerks;managers', 'single-choice',
+            'All;models;clerks|Some;clerks;models|NVC', 4)
+        self.assertIs(syllogism, ccobra.syllogistic.Syllogism.from_item(other))
+        self.assertEqual('AI3', syllogism.encoded_task)
+
+        # Table lookups are consistent with the encoding functions
+        for encoded in ccobra.syllogistic.RESPONSES:
+            decoded = syllogism.decode_response(encoded)
+            self.assertEqual(
+                ccobra.syllogistic.decode_response(encoded, self.item.task), decoded)
+            self.assertEqual(encoded, syllogism.encode_response(decoded))
+            self.assertEqual(encoded, syllogism.encode_response(decoded[0]))
+
+        self.assertEqual('Ica', syllogism.encode_response(self.item.choices[1]))
+        self.assertEqual('NVC', syllogism.encode_response('NVC'))
+        self.assertEqual([['NVC']], syllogism.decode_response(['NVC']))
+
+        # Decoded responses can be modified without affecting the shared tables
+        syllogism.decode_response('Aac')[0][0] = 'No'
+        self.assertEqual([['All', 'models', 'clerks']], syllogism.decode_response('Aac'))
+
+    def test_shared_read_only(self):
+        syllogism = ccobra.syllogistic.Syllogism.from_item(self.item)
+        self.assertTrue(syllogism.shared)
+        self.assertFalse(hasattr(syllogism, 'item'))
+        with self.assertRaises(AttributeError):
+            syllogism.figure = 2
+        with self.assertRaises(AttributeError):
+            del syllogism.A
+        with self.assertRaises(TypeError):
+            syllogism.decoding_table['Aac'] = None
+
+        # Helpers constructed directly keep their item and remain mutable
+        syllogism = ccobra.syllogistic.Syllogism(self.item)
+        self.assertIs(self.item, syllogism.item)
+        syllogism.figure = 2
+
+    def test_cache_size(self):
+        cache = ccobra.syllogistic.syllogism.SYLLOGISM_CACHE
+        size = ccobra.syllogistic.syllogism.SYLLOGISM_CACHE_SIZE
+        try:
+            ccobra.syllogistic.syllogism.SYLLOGISM_CACHE_SIZE = len(cache) + 2
+            for term in ['x', 'y', 'z']:
+                ccobra.syllogistic.Syllogism.from_item(ccobra.Item(
+                    1, 'syllogistic', 'All;{0};b/All;b;c'.format(term), 'single-choice',
+                    'All;a;c|NVC', 0))
+            self.assertEqual(len(cache), ccobra.syllogistic.syllogism.SYLLOGISM_CACHE_SIZE)
+        finally:
+            ccobra.syllogistic.syllogism.SYLLOGISM_CACHE_SIZE = size
+
+    def test_generalized_from_item(self):
+        item = ccobra.Item(
+            1, 'syllogistic-generalized', 'Most;models;managers/Few;managers;clerks',
+            'single-choice', 'Most;models;clerks|NVC', 0)
+        syllogism = ccobra.syllogistic_generalized.GeneralizedSyllogism.from_item(item)
+        self.assertIs(
+            syllogism, ccobra.syllogistic_generalized.GeneralizedSyllogism.from_item(item))
+        self.assertIsNot(syllogism, ccobra.syllogistic.Syllogism.from_item(item))
+        self.assertFalse(hasattr(syllogism, 'item'))
+        with self.assertRaises(AttributeError):
+            syllogism.encoding_table = {}
+
+        self.assertEqual('Tac', syllogism.encode_response(['Most', 'models', 'clerks']))
+        self.assertEqual([['Few', 'clerks', 'models']], syllogism.decode_response('Bca'))
+        for encoded in ccobra.syllogistic_generalized.RESPONSES:
+            self.assertEqual(encoded, syllogism.encode_response(
+                syllogism.decode_response(encoded)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,346 @@
+import copy
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import ccobra
+from ccobra.syllogistic import SYLLOGISMS, RESPONSES, SyllogisticResponseEncoder, \
+    SyllogisticTaskEncoder, dataset_to_matrix
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'benchmark', 'data', 'ragni2016_small.csv')
+
+BENCHMARK_DATA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'syllogistic',
+    'data')
+
+def arena_responses(arena):
+    """ Reads the responses of all subjects from an arena. Used in child processes.
+
+    """
+
+    arena_dict = arena.to_eval_dict()
+    responses = {x: [y['response'] for y in arena_dict[x]] for x in arena_dict}
+    arena.close()
+    return responses
+
+def reference_eval_dict(data):
+    """ Reference implementation of the evaluation dictionary constructing the experimental data
+    row by row for each subject.
+
+    """
+
+    dataset = {}
+    for subj, subj_df in data.get().groupby('_unique_id'):
+        subj_data = []
+        for _, task_series in subj_df.sort_values('sequence').iterrows():
+            task_dict = {}
+            task_dict['item'] = ccobra.Item(
+                task_series['id'], task_series['domain'],
+                task_series['task'], task_series['response_type'],
+                task_series['choices'], task_series['sequence']
+            )
+
+            responses = task_series['response']
+            if isinstance(responses, str):
+                responses = [
+                    [x.split(';') for x in response.split('/')]
+                    for response in responses.split('|')]
+                if task_series['response_type'] != 'multiple-choice':
+                    responses = responses[0]
+            task_dict['response'] = ccobra.convert_to_basic_types(responses)
+
+            for target_col in data.target_columns:
+                if target_col == 'response':
+                    continue
+
+                responses = task_series[target_col]
+                if isinstance(responses, str):
+                    responses = [
+                        [x.split(';') for x in response.split('/')]
+                        for response in responses.split('|')]
+                task_dict[target_col] = responses
+
+            aux = {}
+            for key, value in task_series.items():
+                if key not in data.required_fields + ['_unique_id']:
+                    aux[key] = value
+            task_dict['aux'] = aux
+
+            task_dict['full'] = copy.deepcopy(task_dict['aux'])
+            for target_col in data.target_columns:
+                task_dict['full'][target_col] = task_dict[target_col]
+
+            subj_data.append(task_dict)
+        dataset[subj] = subj_data
+
+    return dataset
+
+class RecordingModel(ccobra.CCobraModel):
+    """ Model recording the targets it is adapted to and mutating them afterwards.
+
+    """
+
+    def __init__(self):
+        super(RecordingModel, self).__init__('Recording', ['syllogistic'], ['single-choice'])
+        self.targets = []
+
+    def adapt(self, item, target, **kwargs):
+        self.targets.append(copy.deepcopy(target))
+        target.append('mutated')
+
+class EvalDictTestCase(unittest.TestCase):
+    """ Tests the evaluation dictionaries of datasets.
+
+    """
+
+    def setUp(self):
+        self.eval_dict = ccobra.CCobraData(pd.read_csv(DATA_PATH), ['response']).to_eval_dict()
+
+    def assert_same_values(self, expected, actual):
+        self.assertEqual(list(expected), list(actual))
+        for key, value in expected.items():
+            if isinstance(value, float) and np.isnan(value):
+                self.assertTrue(np.isnan(actual[key]), key)
+            else:
+                self.assertEqual(value, actual[key], key)
+                self.assertIs(type(value), type(actual[key]), key)
+
+    def assert_reference(self, data):
+        expected = reference_eval_dict(data)
+        actual = data.to_eval_dict()
+
+        self.assertEqual(list(expected), list(actual))
+        for subj, subj_data in expected.items():
+            self.assertEqual(len(subj_data), len(actual[subj]))
+            for task, actual_task in zip(subj_data, actual[subj]):
+                self.assertEqual(list(task), list(actual_task))
+                self.assertEqual(task['item'], actual_task['item'])
+                self.assertEqual(task['item'].sequence_number, actual_task['item'].sequence_number)
+                for key in task:
+                    if key == 'item':
+                        continue
+                    if isinstance(task[key], dict):
+                        self.assert_same_values(task[key], actual_task[key])
+                    else:
+                        self.assertEqual(task[key], actual_task[key])
+                        self.assertIs(type(task[key]), type(actual_task[key]))
+
+    def test_reference_structure(self):
+        for filename in ['Ragni2016.csv', 'Veser2018.csv']:
+            df = pd.read_csv(os.path.join(BENCHMARK_DATA_PATH, filename))
+            self.assert_reference(ccobra.CCobraData(df, ['response']))
+
+        # Auxiliary targets, missing values and multiple-choice responses
+        df = pd.read_csv(DATA_PATH)
+        df['age'] = df['age'].astype(float)
+        df.loc[::5, 'age'] = np.nan
+        df['second'] = df['response']
+        df.loc[::3, 'response'] = df.loc[::3, 'response'] + '|NVC'
+        df.loc[::3, 'response_type'] = 'multiple-choice'
+        self.assert_reference(ccobra.CCobraData(df, ['response', 'second']))
+
+    def test_response_types(self):
+        task = self.eval_dict[1][0]
+        self.assertIsInstance(task['response'], list)
+        self.assertIsInstance(task['full']['response'], list)
+        self.assertEqual(task['response'], task['full']['response'])
+        with self.assertRaises(TypeError):
+            task['aux']['gender'] = None
+
+    def test_deepcopy(self):
+        task = self.eval_dict[1][0]
+        self.assertIs(task['aux'], copy.deepcopy(task['aux']))
+
+        # Mutable targets of the full task information are copied
+        task_copy = copy.deepcopy(task)
+        self.assertEqual(task['full'], task_copy['full'])
+        self.assertIsInstance(task_copy['full'], ccobra.helper.FrozenDict)
+        self.assertIsNot(task['full']['response'], task_copy['full']['response'])
+        task_copy['full']['response'][0].append('x')
+        self.assertEqual(task['response'], task['full']['response'])
+        self.assertNotIn('x', task['full']['response'][0])
+
+    def test_adapt_targets(self):
+        handler = ccobra.benchmark.EvaluationHandler(
+            'response', None, 'predict', 'adapt', {}, {})
+        model = RecordingModel()
+        tasks = self.eval_dict[1][:2]
+        responses = [copy.deepcopy(task['response']) for task in tasks]
+
+        handler.adapt(model, tasks[0]['item'], tasks[0]['full'])
+        handler.adapt_batch(model, [tasks[1]['item']], [tasks[1]['full']])
+
+        # Models receive the nested lists also passed to pre_train and cannot alter the data
+        self.assertEqual(responses, model.targets)
+        self.assertTrue(all(isinstance(x, list) for x in model.targets))
+        self.assertEqual(responses, [task['response'] for task in tasks])
+        self.assertEqual(responses, [task['full']['response'] for task in tasks])
+
+class DataStreamTestCase(unittest.TestCase):
+    """ Tests the streaming data container.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_iter_subjects(self):
+        eval_dict = ccobra.CCobraData(pd.read_csv(DATA_PATH), ['response']).to_eval_dict()
+
+        # Subjects spanning several chunks are combined
+        stream = ccobra.CCobraDataStream(DATA_PATH, ['response'], chunk_size=7)
+        self.assertEqual(list(eval_dict), stream.subject_ids)
+        self.assertEqual(['syllogistic'], stream.domains)
+
+        for subj, subj_data in stream.iter_subjects():
+            self.assertEqual(len(eval_dict[subj]), len(subj_data))
+            for task, stream_task in zip(eval_dict[subj], subj_data):
+                self.assertEqual(task, stream_task)
+
+        # Accessing previous subjects restarts the stream
+        lazy_dict = stream.to_eval_dict()
+        last_subj = stream.subject_ids[-1]
+        first_subj = stream.subject_ids[0]
+        self.assertEqual(eval_dict[last_subj], lazy_dict[last_subj])
+        self.assertEqual(eval_dict[first_subj], lazy_dict[first_subj])
+        with self.assertRaises(KeyError):
+            lazy_dict['unknown']
+
+    def test_non_contiguous_subjects(self):
+        df = pd.read_csv(DATA_PATH)
+        path = os.path.join(self.tmp_dir, 'data.csv')
+        pd.concat([df, df.iloc[:1]]).to_csv(path, index=False)
+
+        stream = ccobra.CCobraDataStream(path, ['response'], chunk_size=10)
+        with self.assertRaises(ValueError):
+            list(stream.iter_subjects())
+
+class DataArenaTestCase(unittest.TestCase):
+    """ Tests the array-backed data arena.
+
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data = ccobra.CCobraData(pd.read_csv(DATA_PATH), ['response'])
+        self.eval_dict = self.data.to_eval_dict()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def assert_eval_dict(self, arena):
+        arena_dict = arena.to_eval_dict()
+        self.assertEqual(list(self.eval_dict), list(arena_dict))
+        for subj, subj_data in self.eval_dict.items():
+            self.assertEqual(subj_data, arena_dict[subj])
+        self.assertIs(arena_dict[1], arena_dict[1])
+
+    def test_to_eval_dict(self):
+        arena = ccobra.DataArena(self.data)
+        self.assertEqual(len(self.eval_dict), len(arena))
+        self.assertEqual(2, arena.codes.itemsize)
+        self.assert_eval_dict(arena)
+        self.assert_eval_dict(pickle.loads(pickle.dumps(arena)))
+
+    def test_publish(self):
+        # Pickled published arenas attach to the code matrix
+        arena = ccobra.DataArena(self.data).publish()
+        attached = pickle.loads(pickle.dumps(arena))
+        self.assertLess(len(pickle.dumps(arena)), len(pickle.dumps(ccobra.DataArena(self.data))))
+        self.assert_eval_dict(attached)
+        attached.close()
+        arena.close()
+
+        arena = ccobra.DataArena(self.data).publish(os.path.join(self.tmp_dir, 'arena.bin'))
+        self.assert_eval_dict(pickle.loads(pickle.dumps(arena)))
+        with self.assertRaises(ValueError):
+            arena.publish()
+
+    def test_child_process(self):
+        responses = {x: [y['response'] for y in self.eval_dict[x]] for x in self.eval_dict}
+        for path in [None, os.path.join(self.tmp_dir, 'arena.bin')]:
+            arena = ccobra.DataArena(self.data).publish(path)
+            ctx = multiprocessing.get_context('spawn')
+            with ctx.Pool(1) as pool:
+                self.assertEqual(responses, pool.apply(arena_responses, (arena,)))
+
+            # The published code matrix outlives the child process
+            self.assert_eval_dict(arena)
+            self.assert_eval_dict(pickle.loads(pickle.dumps(arena)))
+            arena.close()
+
+    def test_recent_subject(self):
+        arena_dict = ccobra.DataArena(self.data).to_eval_dict()
+        subj_data = arena_dict[1]
+        self.assertIs(subj_data, arena_dict[1])
+
+        # Subjects are reconstructed after accessing other subjects
+        arena_dict[2]
+        self.assertIsNot(subj_data, arena_dict[1])
+        self.assertEqual(subj_data, arena_dict[1])
+
+class DatasetTensorTestCase(unittest.TestCase):
+    """ Tests the tensor encoding of datasets.
+
+    """
+
+    def setUp(self):
+        self.data = ccobra.CCobraData(pd.read_csv(DATA_PATH), ['response'])
+        self.task_encoders = {'syllogistic': SyllogisticTaskEncoder()}
+        self.response_encoders = {'syllogistic': SyllogisticResponseEncoder()}
+
+    def test_syllogistic_tensor(self):
+        tensor = self.data.to_tensor(
+            self.task_encoders, self.response_encoders, SYLLOGISMS, RESPONSES)
+        self.assertIs(tensor, self.data.to_tensor(
+            self.task_encoders, self.response_encoders, SYLLOGISMS, RESPONSES))
+        self.assertEqual((6, 64, 9), tensor.shape)
+        self.assertEqual(6 * 64, tensor.counts.sum())
+
+        # The normalized tensor corresponds to the syllogistic dataset matrix
+        dataset = list(self.data.to_eval_dict().values())
+        dense = tensor.to_dense() / tensor.to_dense().sum(axis=2, keepdims=True)
+        self.assertTrue(np.allclose(dataset_to_matrix(dataset), dense.reshape(6, -1).T))
+
+        # Training datasets passed to the models are encoded identically
+        list_tensor = ccobra.encode_dataset(
+            dataset, self.task_encoders, self.response_encoders, SYLLOGISMS, RESPONSES)
+        self.assertEqual(tensor.subjects, list_tensor.subjects)
+        self.assertTrue(np.array_equal(tensor.to_dense(), list_tensor.to_dense()))
+
+        with self.assertRaises(ValueError):
+            self.data.to_tensor(self.task_encoders, self.response_encoders, SYLLOGISMS, ['NVC'])
+
+    def test_multiple_choice(self):
+        df = pd.DataFrame({
+            'id': [1, 1, 2],
+            'sequence': [0, 1, 0],
+            'task': ['a', 'b', 'a'],
+            'choices': ['x|y|z', 'x|y|z', 'x|y|z'],
+            'response': ['x|z', 'y', 'z'],
+            'response_type': ['multiple-choice', 'single-choice', 'multiple-choice'],
+            'domain': ['test', 'test', 'test']
+        })
+        data = ccobra.CCobraData(df, ['response'])
+        tensor = data.to_tensor()
+        self.assertEqual([1, 2], tensor.subjects)
+        self.assertEqual(['a', 'b'], tensor.tasks)
+        self.assertEqual(['x', 'z', 'y'], tensor.responses)
+        self.assertEqual(
+            [[[1, 1, 0], [0, 0, 1]], [[0, 1, 0], [0, 0, 0]]], tensor.to_dense().tolist())
+
+        list_tensor = ccobra.encode_dataset(data.to_eval_dict())
+        self.assertTrue(np.array_equal(tensor.to_dense(), list_tensor.to_dense()))
+
+if __name__ == '__main__':
+    unittest.main()
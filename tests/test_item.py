@@ -0,0 +1,94 @@
+import copy
+import pickle
+import unittest
+
+import ccobra
+from ccobra.item import FEATURE_CACHE, FEATURE_ENCODERS, feature_encoders, set_feature_encoders
+from ccobra.syllogistic import SyllogisticResponseEncoder, SyllogisticTaskEncoder
+
+class ItemTestCase(unittest.TestCase):
+    """ Tests the immutable task item container.
+
+    """
+
+    def setUp(self):
+        self.item = ccobra.Item(
+            1, 'syllogistic', 'All;a;b/Some;b;c', 'single-choice', 'All;a;c|Some;c;a|NVC', 0)
+
+    def tearDown(self):
+        set_feature_encoders({})
+
+    def test_parsing(self):
+        self.assertEqual((('All', 'a', 'b'), ('Some', 'b', 'c')), self.item.task)
+        self.assertEqual(3, len(self.item.choices))
+        self.assertEqual((('NVC',),), self.item.choices[2])
+        self.assertEqual('All;a;c', ccobra.tuple_to_string(self.item.choices[0]))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.item.task = None
+        with self.assertRaises(AttributeError):
+            del self.item.domain
+        with self.assertRaises(TypeError):
+            self.item.task[0][0] = 'No'
+
+    def test_hash(self):
+        other = ccobra.Item(
+            1, 'syllogistic', 'All;a;b/Some;b;c', 'single-choice', 'All;a;c|Some;c;a|NVC', 0)
+        self.assertEqual(self.item, other)
+        self.assertEqual(hash(self.item), hash(other))
+        self.assertEqual(1, len({self.item, other}))
+
+    def test_interning(self):
+        other = ccobra.Item(
+            2, 'syllogistic', ''.join(['All;a;b/', 'Some;b;c']), 'single-choice',
+            ''.join(['All;a;c|', 'Some;c;a|NVC']), 3)
+        self.assertIs(self.item.task, other.task)
+        self.assertIs(self.item.choices, other.choices)
+        self.assertIs(self.item.task_str, other.task_str)
+
+    def test_copy(self):
+        self.assertIs(self.item, copy.deepcopy(self.item))
+        self.assertEqual(self.item, pickle.loads(pickle.dumps(self.item)))
+
+    def test_features(self):
+        self.assertIsNone(self.item.features)
+
+        set_feature_encoders(
+            {'syllogistic': SyllogisticTaskEncoder()},
+            {'syllogistic': SyllogisticResponseEncoder()})
+        features = self.item.features
+        self.assertEqual('AI1', features['task'])
+        self.assertEqual(('Aac', 'Ica', 'NVC'), features['choices'])
+        self.assertEqual(ccobra.syllogistic.SYLLOGISMS.index('AI1'), features['task_id'])
+        self.assertEqual(('a', 'b', 'c'), features['terms'])
+
+        # Features are shared between items of the same task
+        other = ccobra.Item(
+            2, 'syllogistic', 'All;a;b/Some;b;c', 'single-choice', 'All;a;c|Some;c;a|NVC', 5)
+        self.assertIs(features, other.features)
+        with self.assertRaises(TypeError):
+            features['task'] = 'AA1'
+
+    def test_feature_encoders(self):
+        task_encoders = {'syllogistic': SyllogisticTaskEncoder()}
+        response_encoders = {'syllogistic': SyllogisticResponseEncoder()}
+        set_feature_encoders(task_encoders, response_encoders)
+        features = self.item.features
+
+        # Registering the same encoders keeps the computed features
+        set_feature_encoders(task_encoders, response_encoders)
+        self.assertEqual(1, len(FEATURE_CACHE))
+        self.assertIs(features, self.item.features)
+
+        # Temporarily registered encoders are replaced by the previous ones afterwards
+        with feature_encoders({'syllogistic': SyllogisticTaskEncoder()}):
+            self.assertEqual(0, len(FEATURE_CACHE))
+            self.assertNotIn('choices', self.item.features)
+        self.assertEqual(
+            (task_encoders['syllogistic'], response_encoders['syllogistic']),
+            FEATURE_ENCODERS['syllogistic'])
+        self.assertEqual(('Aac', 'Ica', 'NVC'), self.item.features['choices'])
+
+if __name__ == '__main__':
+    unittest.main()